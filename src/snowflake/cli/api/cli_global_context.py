@@ -1,17 +1,34 @@
 import re
+import threading
 from pathlib import Path
 from typing import Dict, Optional
 
 from snowflake.cli.api.exceptions import InvalidSchemaError
 from snowflake.cli.api.output.formats import OutputFormat
+from snowflake.cli.api.session_state import SessionState
 from snowflake.connector import SnowflakeConnection
 
 schema_pattern = re.compile(r".+\..+")
 
+# attributes describing the state of the connection rather than how to connect
+_CONNECTION_STATE_ATTRIBUTES = {
+    "_cached_connection",
+    "_session_state",
+    "_warm_up_thread",
+    "_warm_up_error",
+    "_settings_version",
+}
+_UNSET = object()
+
 
 class _ConnectionContext:
     def __init__(self):
         self._cached_connection: Optional[SnowflakeConnection] = None
+        self._session_state = SessionState()
+        self._connection_lock = threading.Lock()
+        self._warm_up_thread: Optional[threading.Thread] = None
+        self._warm_up_error: Optional[Exception] = None
+        self._settings_version = 0
 
         self._connection_name: Optional[str] = None
         self._account: Optional[str] = None
@@ -34,10 +51,16 @@ class _ConnectionContext:
     def __setattr__(self, key, value):
         """
         We invalidate connection cache every time connection attributes change.
+        Options are set anew by every command, so setting the same value keeps the cache.
         """
+        changed = (
+            key not in _CONNECTION_STATE_ATTRIBUTES
+            and getattr(self, key, _UNSET) != value
+        )
         super().__setattr__(key, value)
-        if key != "_cached_connection":
+        if changed:
             self._cached_connection = None
+            self._settings_version = getattr(self, "_settings_version", 0) + 1
 
     @property
     def connection_name(self) -> Optional[str]:
@@ -167,9 +190,70 @@ class _ConnectionContext:
 
     @property
     def connection(self) -> SnowflakeConnection:
-        if not self._cached_connection:
-            self._cached_connection = self._build_connection()
-        return self._cached_connection
+        # worker threads (e.g. concurrent stage uploads) share a single connection
+        with self._connection_lock:
+            if self._warm_up_error is not None:
+                error, self._warm_up_error = self._warm_up_error, None
+                raise error
+            if not self._cached_connection:
+                self._session_state = SessionState()
+                self._cached_connection = self._build_connection()
+            return self._cached_connection
+
+    def warm_up(self) -> None:
+        """
+        Starts connecting on a background thread, so that the handshake overlaps with
+        the local work of the command; the first use of the connection waits only for
+        the rest of it. Nothing happens if connecting may prompt the user.
+        """
+        if self._cached_connection or self._warm_up_thread:
+            return
+        from snowflake.cli.app.snow_connector import requires_user_interaction
+        from snowflake.cli.app.telemetry import command_info
+
+        try:
+            if requires_user_interaction(
+                temporary_connection=self.temporary_connection,
+                mfa_passcode=self._mfa_passcode,
+                connection_name=self.connection_name,
+                **self._collect_not_empty_connection_attributes(),
+            ):
+                return
+            # the command is known only to the thread executing it
+            application = command_info()
+        except Exception:
+            # errors in the configuration are reported when the connection is used
+            return
+        self._warm_up_thread = threading.Thread(
+            target=self._warm_up_connection,
+            args=(self._settings_version, application),
+            name="connection-warm-up",
+            daemon=True,
+        )
+        self._warm_up_thread.start()
+
+    def _warm_up_connection(self, settings_version: int, application: str):
+        with self._connection_lock:
+            if self._cached_connection:
+                return
+            try:
+                connection = self._build_connection(
+                    redirect_output=False, application=application
+                )
+            except Exception as err:
+                connection, error = None, err
+            else:
+                error = None
+            # the connection is dropped if the settings changed in the meantime
+            if settings_version == self._settings_version:
+                self._session_state = SessionState()
+                self._cached_connection = connection
+                self._warm_up_error = error
+
+    @property
+    def session_state(self) -> SessionState:
+        """State of the session of the cached connection."""
+        return self._session_state
 
     def _collect_not_empty_connection_attributes(self):
         return {
@@ -186,10 +270,11 @@ class _ConnectionContext:
             "master_token": self.master_token,
         }
 
-    def _build_connection(self):
+    def _build_connection(self, **kwargs):
         from snowflake.cli.app.snow_connector import connect_to_snowflake
 
         return connect_to_snowflake(
+            **kwargs,
             temporary_connection=self.temporary_connection,
             mfa_passcode=self._mfa_passcode,
             enable_diag=self._enable_diag,
@@ -280,6 +365,10 @@ class _CliGlobalContextAccess:
     def connection(self) -> SnowflakeConnection:
         return self._manager.connection
 
+    @property
+    def session_state(self) -> SessionState:
+        return self._manager.connection_context.session_state
+
     @property
     def enable_tracebacks(self) -> bool:
         return self._manager.enable_tracebacks
@@ -313,7 +402,13 @@ class _CliGlobalContextAccess:
     @property
     def _should_force_mute_intermediate_output(self) -> bool:
         """Computes whether cli_console output should be muted."""
-        return self._manager.output_format == OutputFormat.JSON
+        return self._manager.output_format in (
+            OutputFormat.JSON,
+            OutputFormat.NDJSON,
+            OutputFormat.CSV,
+            OutputFormat.ARROW,
+            OutputFormat.PARQUET,
+        )
 
 
 cli_context_manager: _CliGlobalContextManager = _CliGlobalContextManager()
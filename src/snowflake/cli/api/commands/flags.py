@@ -342,7 +342,8 @@ DiagAllowlistPathOption: Path = typer.Option(
 OutputFormatOption = typer.Option(
     OutputFormat.TABLE.value,
     "--format",
-    help="Specifies the output format.",
+    help="Specifies the output format: TABLE, JSON, NDJSON, CSV, ARROW or PARQUET.",
+    metavar="FORMAT",
     case_sensitive=False,
     callback=_callback(lambda: cli_context_manager.set_output_format),
     rich_help_panel=_CLI_BEHAVIOUR,
@@ -419,6 +420,14 @@ VariablesOption = typer.Option(
     show_default=False,
 )
 
+ExecuteParallelOption = typer.Option(
+    1,
+    "--parallel",
+    min=1,
+    help="Maximum number of files to execute at the same time. Files in the same directory are executed "
+    "concurrently, and a directory is executed only after all files of the previous one finished.",
+)
+
 
 def like_option(help_example: str):
     return typer.Option(
@@ -51,6 +51,8 @@ class SnowTyper(typer.Typer):
             @wraps(command_callable)
             def command_callable_decorator(*args, **kw):
                 """Wrapper around command callable. This is what happens at "runtime"."""
+                if requires_connection:
+                    self.warm_up_connection()
                 self.pre_execute()
                 try:
                     result = command_callable(*args, **kw)
@@ -67,6 +69,19 @@ class SnowTyper(typer.Typer):
 
         return custom_command
 
+    @staticmethod
+    def warm_up_connection():
+        """
+        Callback executed before running a command that requires a connection, once its
+        options are parsed. Starts connecting in the background, unless disabled.
+        """
+        from snowflake.cli.api.cli_global_context import cli_context_manager
+        from snowflake.cli.api.feature_flags import FeatureFlag
+
+        if FeatureFlag.ENABLE_CONNECTION_WARM_UP.is_enabled():
+            log.debug("Connecting in the background")
+            cli_context_manager.connection_context.warm_up()
+
     @staticmethod
     def pre_execute():
         """
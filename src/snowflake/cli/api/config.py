@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import copy
 import logging
 import os
+import sys
+import warnings
 from contextlib import contextmanager
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
@@ -19,7 +22,7 @@ from snowflake.cli.api.secure_utils import file_permissions_are_strict
 from snowflake.connector.compat import IS_WINDOWS
 from snowflake.connector.config_manager import CONFIG_MANAGER
 from snowflake.connector.constants import CONFIG_FILE, CONNECTIONS_FILE
-from snowflake.connector.errors import MissingConfigOptionError
+from snowflake.connector.errors import ConfigSourceError, MissingConfigOptionError
 from tomlkit import TOMLDocument, dump
 from tomlkit.container import Container
 from tomlkit.exceptions import NonExistentKey
@@ -48,6 +51,21 @@ CONFIG_MANAGER.add_option(
 )
 
 
+class _ParsedConfig(dict):
+    """
+    Content of configuration files parsed with a fast TOML parser, which CONFIG_MANAGER
+    reads like a tomlkit document. Sections merged with environment variables are
+    memoized until the files are read again.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.merged_sections: Dict[tuple, Any] = {}
+
+    def __missing__(self, key):
+        raise NonExistentKey(key)
+
+
 @dataclass
 class ConnectionConfig:
     account: Optional[str] = None
@@ -104,7 +122,7 @@ def config_init(config_file: Optional[Path]):
         _check_default_config_files_permissions()
     if not CONFIG_MANAGER.file_path.exists():
         _initialise_config(CONFIG_MANAGER.file_path)
-    CONFIG_MANAGER.read_config()
+    _read_config()
 
 
 def add_connection(name: str, connection_config: ConnectionConfig):
@@ -115,6 +133,14 @@ def add_connection(name: str, connection_config: ConnectionConfig):
     )
 
 
+def get_cache_dir() -> Path:
+    """
+    Directory of data cached between invocations. It is kept next to the default
+    configuration file, since other files may be in directories shared with other users.
+    """
+    return CONFIG_FILE.parent / "cache"
+
+
 _DEFAULT_LOGS_CONFIG = {
     "save_logs": True,
     "path": str(CONFIG_MANAGER.file_path.parent / "logs"),
@@ -126,10 +152,47 @@ _DEFAULT_CLI_CONFIG = {LOGS_SECTION: _DEFAULT_LOGS_CONFIG}
 
 @contextmanager
 def _config_file():
+    # tomlkit preserves formatting and comments of the file when it is modified
     CONFIG_MANAGER.read_config()
     conf_file_cache = CONFIG_MANAGER.conf_file_cache
     yield conf_file_cache
     _dump_config(conf_file_cache)
+    _read_config()
+
+
+def _parse_toml(text: str) -> dict:
+    if sys.version_info >= (3, 11):
+        import tomllib
+    else:
+        import tomli as tomllib
+
+    return tomllib.loads(text)
+
+
+def _read_config() -> None:
+    """
+    Reads the configuration file with a fast parser, tomlkit is used only to modify it.
+    Configuration split into connections.toml is read by CONFIG_MANAGER.read_config(),
+    which merges it with the configuration file.
+    """
+    if CONNECTIONS_FILE.exists():
+        CONFIG_MANAGER.read_config()
+        return
+    config = _ParsedConfig()
+    path = CONFIG_MANAGER.file_path
+    if path.exists():
+        if not IS_WINDOWS and not file_permissions_are_strict(path):
+            warnings.warn(
+                f"Bad owner or permissions on {path}.\n"
+                f' * To restrict permissions, run `chmod 0600 "{path}"`.\n'
+            )
+        try:
+            config = _ParsedConfig(_parse_toml(path.read_text()))
+        except Exception as err:
+            raise ConfigSourceError(
+                f"An unknown error happened while loading '{path}'"
+            ) from err
+    CONFIG_MANAGER.conf_file_cache = config
 
 
 def _initialise_logs_section():
@@ -199,8 +262,23 @@ def get_default_connection_dict() -> dict:
 
 
 def get_config_section(*path) -> dict:
+    config = CONFIG_MANAGER.conf_file_cache
+    if not isinstance(config, _ParsedConfig):
+        return _get_config_section(*path)
+    key = (
+        path,
+        os.environ.get(f"SNOWFLAKE_{path[0].upper()}"),
+        tuple(sorted(_get_envs_for_path(*path).items())),
+    )
+    if key not in config.merged_sections:
+        config.merged_sections[key] = _get_config_section(*path)
+    return copy.deepcopy(config.merged_sections[key])
+
+
+def _get_config_section(*path) -> dict:
     section = _find_section(*path)
-    if isinstance(section, Container):
+    # top-level sections are parsed as plain dicts by the fast parser
+    if isinstance(section, Container) or (len(path) == 1 and isinstance(section, dict)):
         return {s: _merge_section_with_env(section[s], *path, s) for s in section}
     if isinstance(section, dict):
         return _merge_section_with_env(section, *path)
@@ -270,6 +348,8 @@ def _merge_section_with_env(section: Union[Table, Any], *path) -> Dict[str, str]
         section_copy = section.copy()
         section_copy.update(env_variables)
         return section_copy.unwrap()
+    if isinstance(section, dict):
+        return {**section, **_get_envs_for_path(*path)}
     # It's a atomic value
     return section
 
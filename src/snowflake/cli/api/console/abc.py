@@ -2,7 +2,7 @@ from abc import ABC, abstractmethod
 from contextlib import contextmanager
 from typing import Callable, Iterator, Optional
 
-from rich import print as rich_print
+from rich import get_console
 from rich.text import Text
 from snowflake.cli.api.cli_global_context import _CliGlobalContextAccess, cli_context
 
@@ -39,7 +39,8 @@ class AbstractConsole(ABC):
     def _print(self, text: Text):
         if self.is_silent:
             return
-        rich_print(text)
+        # ensure we do not break URLs that wrap lines
+        get_console().print(text, soft_wrap=True)
 
     @contextmanager
     @abstractmethod
@@ -34,3 +34,8 @@ class FeatureFlag(FeatureFlagMixin):
     ENABLE_STREAMLIT_EMBEDDED_STAGE = BooleanFlag(
         "ENABLE_STREAMLIT_EMBEDDED_STAGE", False
     )
+    ENABLE_STAGE_DIFF_SIZE_COMPARISON = BooleanFlag(
+        "ENABLE_STAGE_DIFF_SIZE_COMPARISON", False
+    )
+    ENABLE_CONNECTION_WARM_UP = BooleanFlag("ENABLE_CONNECTION_WARM_UP", True)
+    ENABLE_LAZY_COMMAND_LOADING = BooleanFlag("ENABLE_LAZY_COMMAND_LOADING", True)
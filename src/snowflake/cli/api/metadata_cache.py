@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import re
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from snowflake.cli.api.project.util import unquote_identifier
+from snowflake.cli.api.utils.naming_utils import from_qualified_name
+
+_IDENTIFIER_REGEX = re.compile(r'"(?:[^"]|"")*"|[A-Za-z_][\w$]*')
+_OBJECT_DDL_REGEX = re.compile(
+    r"(?:create|alter|drop|undrop|grant|revoke|comment)\b", re.IGNORECASE
+)
+
+_MISSING = object()
+
+
+def _normalize(identifier: str) -> str:
+    return unquote_identifier(identifier.strip())
+
+
+class ObjectMetadataCache:
+    """
+    Results of SHOW and DESCRIBE lookups of single objects, cached for the lifetime
+    of the session. Entries are keyed by the type of the object, its name and the scope
+    of the lookup; the caller makes the key specific to the session context (e.g. the
+    current role), since it decides which objects are visible.
+
+    A whole "show <objects> in <scope>" listing can be stored as well, so that
+    lookups of any object of that type in that scope are answered from memory.
+    """
+
+    def __init__(self):
+        self._objects: Dict[Tuple, object] = {}
+        self._listings: Dict[Tuple, List[dict]] = {}
+
+    @staticmethod
+    def _object_key(
+        context: Hashable, object_type: str, name: str, scope: Optional[str]
+    ) -> Tuple:
+        unqualified_name, schema, database = from_qualified_name(name.strip())
+        return (
+            context,
+            object_type.lower(),
+            _normalize(unqualified_name),
+            tuple(_normalize(part) for part in (database, schema) if part),
+            " ".join((scope or "").lower().split()),
+        )
+
+    @staticmethod
+    def _listing_key(context: Hashable, object_type: str, scope: Optional[str]):
+        return context, object_type.lower(), " ".join((scope or "").lower().split())
+
+    def get(
+        self,
+        context: Hashable,
+        object_type: str,
+        name: str,
+        scope: Optional[str],
+        default=None,
+    ):
+        """
+        Returns the cached result of the lookup of the object, or the default if the
+        object was neither looked up nor listed. Objects missing from a stored
+        listing are reported as None.
+        """
+        cached = self._objects.get(
+            self._object_key(context, object_type, name, scope), _MISSING
+        )
+        if cached is not _MISSING:
+            return cached
+        return default
+
+    def put(
+        self,
+        context: Hashable,
+        object_type: str,
+        name: str,
+        scope: Optional[str],
+        value,
+    ):
+        self._objects[self._object_key(context, object_type, name, scope)] = value
+
+    def get_listing(
+        self, context: Hashable, object_type: str, scope: Optional[str]
+    ) -> Optional[List[dict]]:
+        return self._listings.get(self._listing_key(context, object_type, scope))
+
+    def put_listing(
+        self,
+        context: Hashable,
+        object_type: str,
+        scope: Optional[str],
+        rows: List[dict],
+    ):
+        self._listings[self._listing_key(context, object_type, scope)] = rows
+
+    def observe(self, statement: str):
+        """
+        Forgets the objects the statement may have changed. A DDL statement invalidates
+        all cached objects whose name it mentions, as well as all listings, since it may
+        have created an object or changed one listed under a different name.
+        """
+        if not _OBJECT_DDL_REGEX.match(statement):
+            return
+        mentioned = {
+            _normalize(identifier)
+            for identifier in _IDENTIFIER_REGEX.findall(statement)
+        }
+        self._listings.clear()
+        self._objects = {
+            key: value
+            for key, value in self._objects.items()
+            if key[2] not in mentioned
+        }
+
+    def clear(self):
+        self._objects.clear()
+        self._listings.clear()
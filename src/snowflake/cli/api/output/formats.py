@@ -4,3 +4,11 @@ from enum import Enum
 class OutputFormat(Enum):
     TABLE = "TABLE"
     JSON = "JSON"
+    NDJSON = "NDJSON"
+    CSV = "CSV"
+    ARROW = "ARROW"
+    PARQUET = "PARQUET"
+
+    @property
+    def is_binary(self) -> bool:
+        return self in (OutputFormat.ARROW, OutputFormat.PARQUET)
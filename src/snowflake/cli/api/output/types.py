@@ -48,16 +48,24 @@ class QueryResult(CollectionResult):
         self.column_names = [col.name for col in cursor.description]
         super().__init__(elements=self._prepare_payload(cursor))
         self._query = cursor.query
+        self._cursor = cursor
 
     def _prepare_payload(self, cursor: SnowflakeCursor | DictCursor):
-        if isinstance(cursor, DictCursor):
-            return (k for k in cursor)
-        return ({k: v for k, v in zip(self.column_names, row)} for row in cursor)
+        # rows of DictCursor, and of cursors served by the daemon created for it,
+        # are already dictionaries
+        return (
+            row if isinstance(row, dict) else dict(zip(self.column_names, row))
+            for row in cursor
+        )
 
     @property
     def query(self):
         return self._query
 
+    @property
+    def cursor(self) -> SnowflakeCursor | DictCursor:
+        return self._cursor
+
 
 class SingleQueryResult(ObjectResult):
     def __init__(self, cursor: SnowflakeCursor):
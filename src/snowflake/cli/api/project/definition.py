@@ -1,10 +1,14 @@
+from __future__ import annotations
+
+import hashlib
+import logging
 from pathlib import Path
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List, Optional
 
-import yaml.loader
+from snowflake.cli.__about__ import VERSION
 from snowflake.cli.api.cli_global_context import cli_context
+from snowflake.cli.api.config import get_cache_dir
 from snowflake.cli.api.constants import DEFAULT_SIZE_LIMIT_MB
-from snowflake.cli.api.project.schemas.project_definition import ProjectDefinition
 from snowflake.cli.api.project.util import (
     append_to_identifier,
     clean_identifier,
@@ -12,9 +16,18 @@ from snowflake.cli.api.project.util import (
     to_identifier,
 )
 from snowflake.cli.api.secure_path import SecurePath
-from yaml import load
+from snowflake.cli.api.utils.cache_files import read_cache_file, write_cache_file
+
+if TYPE_CHECKING:
+    from snowflake.cli.api.project.schemas.project_definition import (
+        ProjectDefinition,
+    )
+
+log = logging.getLogger(__name__)
 
 DEFAULT_USERNAME = "unknown_user"
+# only definitions of the most recently loaded projects are kept in the cache
+MAX_CACHED_PROJECT_DEFINITIONS = 32
 
 
 def merge_left(target: Dict, source: Dict) -> None:
@@ -30,28 +43,99 @@ def merge_left(target: Dict, source: Dict) -> None:
             target[k] = v
 
 
+def _get_project_definitions_cache_dir() -> Path:
+    return get_cache_dir() / "project_definitions"
+
+
+def get_project_definition_cache_path(paths: List[Path]) -> Path:
+    key = "\n".join(str(path.absolute()) for path in paths)
+    name = hashlib.sha256(key.encode()).hexdigest()
+    return _get_project_definitions_cache_dir() / f"{name}.json"
+
+
+def get_project_definition_cache_key(file_hashes: List[str]) -> Dict:
+    return {"version": VERSION, "file_hashes": file_hashes}
+
+
+def _load_cached_definition(path: Path, key: Dict) -> Optional[Dict]:
+    data = read_cache_file(path)
+    if data is None:
+        return None
+    try:
+        if data["key"] != key:
+            return None
+        return data["definition"]
+    except (KeyError, TypeError):
+        log.debug("Ignoring invalid project definition cache %s", path)
+        return None
+
+
+def _prune_cached_definitions() -> None:
+    """Removes cached definitions of all but the most recently loaded projects."""
+    try:
+        cache_files = sorted(
+            _get_project_definitions_cache_dir().glob("*.json"),
+            key=lambda path: path.stat().st_mtime,
+            reverse=True,
+        )
+        for path in cache_files[MAX_CACHED_PROJECT_DEFINITIONS:]:
+            path.unlink(missing_ok=True)
+    except OSError as err:
+        log.debug("Could not prune project definitions cache: %s", err)
+
+
+def _parse_yaml(content: str) -> Dict:
+    import yaml
+
+    # the C loader is an order of magnitude faster, but may be missing in builds of PyYAML
+    loader = getattr(yaml, "CBaseLoader", yaml.BaseLoader)
+    return yaml.load(content, Loader=loader)
+
+
 def load_project_definition(paths: List[Path]) -> ProjectDefinition:
     """
     Loads project definition, optionally overriding values. Definition values
     are merged in left-to-right order (increasing precedence).
+
+    Validated definitions are cached by hashes of the content of the files, so
+    unchanged projects are loaded without parsing YAML or validating it again.
     """
+    from snowflake.cli.api.project.schemas.project_definition import (
+        ProjectDefinition,
+    )
+
     spaths: List[SecurePath] = [SecurePath(p) for p in paths]
     if len(spaths) == 0:
         raise ValueError("Need at least one definition file.")
 
-    with spaths[0].open("r", read_file_limit_mb=DEFAULT_SIZE_LIMIT_MB) as base_yml:
-        definition = load(base_yml.read(), Loader=yaml.loader.BaseLoader)
-
-    for override_path in spaths[1:]:
-        with override_path.open(
-            "r", read_file_limit_mb=DEFAULT_SIZE_LIMIT_MB
-        ) as override_yml:
-            overrides = load(override_yml.read(), Loader=yaml.loader.BaseLoader)
-            merge_left(definition, overrides)
-
-        # TODO: how to show good error messages here?
-
-    return ProjectDefinition(**definition)
+    contents = []
+    for spath in spaths:
+        with spath.open("r", read_file_limit_mb=DEFAULT_SIZE_LIMIT_MB) as yml:
+            contents.append(yml.read())
+    file_hashes = [hashlib.sha256(content.encode()).hexdigest() for content in contents]
+    cache_path = get_project_definition_cache_path(paths)
+    cache_key = get_project_definition_cache_key(file_hashes)
+
+    definition = _load_cached_definition(cache_path, cache_key)
+    if definition is not None:
+        return ProjectDefinition.construct_validated(definition)
+
+    definition = _parse_yaml(contents[0])
+    for overrides in contents[1:]:
+        merge_left(definition, _parse_yaml(overrides))
+
+    # TODO: how to show good error messages here?
+    project = ProjectDefinition(**definition)
+    # only valid definitions are cached
+    write_cache_file(
+        cache_path,
+        {
+            "key": cache_key,
+            "definition": project.model_dump(mode="json", exclude_unset=True),
+        },
+    )
+    _prune_cached_definitions()
+    return project
 
 
 def generate_local_override_yml(
@@ -62,6 +146,10 @@ def generate_local_override_yml(
     schema. The returned YAML object can be saved directly to a file, if desired.
     A connection is made using global context to resolve current role and warehouse.
     """
+    from snowflake.cli.api.project.schemas.project_definition import (
+        ProjectDefinition,
+    )
+
     conn = cli_context.connection
     user = clean_identifier(get_env_username() or DEFAULT_USERNAME)
     role = conn.role
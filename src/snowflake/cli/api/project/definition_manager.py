@@ -3,11 +3,14 @@ from __future__ import annotations
 import functools
 import os
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 from snowflake.cli.api.exceptions import MissingConfiguration
-from snowflake.cli.api.project.definition import load_project_definition
-from snowflake.cli.api.project.schemas.project_definition import ProjectDefinition
+
+if TYPE_CHECKING:
+    from snowflake.cli.api.project.schemas.project_definition import (
+        ProjectDefinition,
+    )
 
 
 def _compat_is_mount(path: Path):
@@ -102,4 +105,7 @@ class DefinitionManager:
 
     @functools.cached_property
     def project_definition(self) -> ProjectDefinition:
+        # yaml and pydantic models are imported only once the definition is needed
+        from snowflake.cli.api.project.definition import load_project_definition
+
         return load_project_definition(self._project_config_paths)
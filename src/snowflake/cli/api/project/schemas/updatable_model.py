@@ -1,4 +1,4 @@
-from typing import Any, Dict
+from typing import Any, Dict, Union, get_args, get_origin
 
 from pydantic import BaseModel, ConfigDict, Field, ValidationError
 from snowflake.cli.api.project.errors import SchemaValidationError
@@ -22,6 +22,39 @@ class UpdatableModel(BaseModel):
                 setattr(self, field, value)
         return self
 
+    @classmethod
+    def construct_validated(cls, values: Dict[str, Any]):
+        """
+        Builds the model from a dump of an already validated model, including nested
+        models, without validating it again.
+        """
+        return cls.model_construct(
+            **{
+                name: _construct_value(cls.model_fields[name].annotation, value)
+                for name, value in values.items()
+            }
+        )
+
+
+def _construct_value(annotation: Any, value: Any) -> Any:
+    if (
+        isinstance(annotation, type)
+        and issubclass(annotation, UpdatableModel)
+        and isinstance(value, dict)
+    ):
+        return annotation.construct_validated(value)
+    origin, args = get_origin(annotation), get_args(annotation)
+    if origin is list and isinstance(value, list):
+        return [_construct_value(args[0], item) for item in value]
+    if origin is dict and isinstance(value, dict):
+        return {key: _construct_value(args[1], item) for key, item in value.items()}
+    if origin is Union:
+        for arg in args:
+            constructed = _construct_value(arg, value)
+            if constructed is not value:
+                return constructed
+    return value
+
 
 def IdentifierField(*args, **kwargs):  # noqa
     return Field(max_length=254, pattern=IDENTIFIER_NO_LENGTH, *args, **kwargs)
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import re
+from typing import Optional, Tuple
+
+from snowflake.cli.api.metadata_cache import ObjectMetadataCache
+
+_LEADING_COMMENTS_REGEX = re.compile(r"^(?:\s+|--[^\n]*(?:\n|$)|/\*.*?\*/)*", re.DOTALL)
+_USE_STATEMENT_REGEX = re.compile(
+    r"use\s+(?:(?P<kind>role|warehouse|database|schema)\s+)?"
+    r'(?P<first>"[^"]*"|[^\s;."]+)(?:\.(?P<second>"[^"]*"|[^\s;."]+))?\s*;?\s*',
+    re.IGNORECASE,
+)
+_CONTEXT_CHANGING_STATEMENT_REGEX = re.compile(
+    r"(?:use|call|execute|begin|declare)\b", re.IGNORECASE
+)
+_DATABASE_OR_SCHEMA_DDL_REGEX = re.compile(
+    r"(?:create|drop|undrop)\s+(?:or\s+replace\s+)?(?:transient\s+)?(?:database|schema)\b",
+    re.IGNORECASE,
+)
+
+
+class SessionState:
+    """
+    Current role, warehouse, database and schema of the session of the shared
+    connection, as far as they are known from the statements executed through it.
+    None means that the value is not known and has to be queried.
+    """
+
+    def __init__(self):
+        self.role: Optional[str] = None
+        self.warehouse: Optional[str] = None
+        self.database: Optional[str] = None
+        self.schema: Optional[str] = None
+        self.metadata = ObjectMetadataCache()
+
+    def invalidate(self):
+        self.__init__()
+
+    @property
+    def metadata_context(self) -> Optional[Tuple[str, ...]]:
+        """
+        Part of the session context that decides the outcome of SHOW and DESCRIBE
+        lookups, or None if the metadata of objects must not be cached.
+        """
+        if self.role is None:
+            return None
+        return self.role.upper(), self.database or "", self.schema or ""
+
+    def observe(self, sql: str):
+        """
+        Updates the state after the statement completed successfully. Statements that
+        may change the session context in a way that is not recognized (e.g. calls
+        of procedures or anonymous blocks) make the whole state unknown.
+        """
+        statement = _LEADING_COMMENTS_REGEX.sub("", sql, count=1)
+        use_statement = _USE_STATEMENT_REGEX.fullmatch(statement)
+        if use_statement:
+            self._observe_use(
+                (use_statement.group("kind") or "database").lower(),
+                use_statement.group("first"),
+                use_statement.group("second"),
+            )
+        elif _CONTEXT_CHANGING_STATEMENT_REGEX.match(statement):
+            self.invalidate()
+        elif _DATABASE_OR_SCHEMA_DDL_REGEX.match(statement):
+            # creating a database or schema makes it the current one
+            self.database = self.schema = None
+            self.metadata.clear()
+        else:
+            self.metadata.observe(statement)
+
+    def _observe_use(self, kind: str, first: str, second: Optional[str]):
+        if kind in ("role", "warehouse"):
+            if second is None:
+                setattr(self, kind, first)
+            else:
+                self.invalidate()
+        elif second is not None:
+            # "use [schema] <database>.<schema>"
+            self.database, self.schema = first, second
+        elif kind == "schema":
+            self.schema = first
+        else:
+            self.database, self.schema = first, None
@@ -1,11 +1,21 @@
 from __future__ import annotations
 
 import logging
+import time
 from contextlib import contextmanager
 from functools import cached_property
 from io import StringIO
 from textwrap import dedent
-from typing import Iterable, Optional, Tuple
+from typing import (
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
 
 from snowflake.cli.api.cli_global_context import cli_context
 from snowflake.cli.api.constants import ObjectType
@@ -18,11 +28,53 @@ from snowflake.cli.api.project.util import (
     identifier_to_show_like_pattern,
     unquote_identifier,
 )
+from snowflake.cli.api.session_state import SessionState
 from snowflake.cli.api.utils.cursor import find_first_row
 from snowflake.cli.api.utils.naming_utils import from_qualified_name
 from snowflake.connector.cursor import DictCursor, SnowflakeCursor
 from snowflake.connector.errors import ProgrammingError
 
+ASYNC_POLL_MIN_INTERVAL_SECONDS = 0.05
+ASYNC_POLL_MAX_INTERVAL_SECONDS = 2.0
+CONCURRENT_STATEMENTS_LOOKAHEAD = 100
+
+_NOT_CACHED = object()
+
+
+class ConcurrentStatement(NamedTuple):
+    sql: str
+    dependencies: FrozenSet[int] = frozenset()
+    "Positions of the statements that must complete before this one is submitted"
+    is_put_or_get: bool = False
+    "PUT and GET transfer files through the client, so they cannot run asynchronously"
+
+
+class _SessionTrackingIterator:
+    """
+    Records the statements executed by the cursors of the given stream in the session
+    state. If a statement fails, the state is no longer known.
+    """
+
+    def __init__(self, session_state: SessionState, cursors: Iterable[SnowflakeCursor]):
+        self._session_state = session_state
+        self._cursors = cursors if isinstance(cursors, Iterator) else iter(cursors)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> SnowflakeCursor:
+        try:
+            cursor = next(self._cursors)
+        except StopIteration:
+            raise
+        except BaseException:
+            self._session_state.invalidate()
+            raise
+        query = getattr(cursor, "query", None)
+        if isinstance(query, str):
+            self._session_state.observe(query)
+        return cursor
+
 
 class SqlExecutionMixin:
     def __init__(self):
@@ -36,6 +88,10 @@ class SqlExecutionMixin:
     def _log(self):
         return logging.getLogger(__name__)
 
+    @property
+    def _session_state(self) -> SessionState:
+        return cli_context.session_state
+
     def _execute_string(
         self,
         sql_text: str,
@@ -51,11 +107,137 @@ class SqlExecutionMixin:
         """
         self._log.debug("Executing %s", sql_text)
         stream = StringIO(sql_text)
-        stream_generator = self._conn.execute_stream(
-            stream, remove_comments=remove_comments, cursor_class=cursor_class, **kwargs
+        stream_generator = _SessionTrackingIterator(
+            self._session_state,
+            self._conn.execute_stream(
+                stream,
+                remove_comments=remove_comments,
+                cursor_class=cursor_class,
+                **kwargs,
+            ),
         )
         return stream_generator if return_cursors else list()
 
+    def _execute_statements(
+        self,
+        statements: Iterable[Tuple[str, bool]],
+        cursor_class: SnowflakeCursor = SnowflakeCursor,
+        **kwargs,
+    ) -> Iterator[SnowflakeCursor]:
+        """
+        Executes already split statements one by one, as they are pulled from the given
+        iterable. Unlike execute_stream, this never collects all statements in memory,
+        so statements can be submitted while the rest of the input is still being read.
+        Accepts the (statement, is_put_or_get) pairs produced by split_statements.
+        """
+        for sql, is_put_or_get in statements:
+            if not sql:
+                continue
+            self._log.debug("Executing %s", sql)
+            cursor = self._conn.cursor(cursor_class=cursor_class)
+            try:
+                cursor.execute(sql, _is_put_get=is_put_or_get, **kwargs)
+            except BaseException:
+                self._session_state.invalidate()
+                raise
+            self._session_state.observe(sql)
+            yield cursor
+
+    def _execute_concurrently(
+        self,
+        statements: Iterable[ConcurrentStatement],
+        max_concurrency: int,
+        cursor_class: SnowflakeCursor = SnowflakeCursor,
+    ) -> Iterator[SnowflakeCursor]:
+        """
+        Submits statements with the asynchronous query API, running up to max_concurrency
+        of them at a time, as soon as all their dependencies completed. Running queries are
+        polled with a backoff that grows while none of them completes.
+        Cursors are yielded in the order of the statements; if a statement fails,
+        the queries that are still running are aborted and the error is raised.
+        """
+        statements = iter(statements)
+        waiting: Dict[int, ConcurrentStatement] = {}
+        running: Dict[int, SnowflakeCursor] = {}
+        running_sql: Dict[int, str] = {}
+        completed: Dict[int, SnowflakeCursor] = {}
+        done = set()
+        read_count = 0
+        yielded_count = 0
+        exhausted = False
+        poll_interval = ASYNC_POLL_MIN_INTERVAL_SECONDS
+
+        def is_ready(statement: ConcurrentStatement) -> bool:
+            return statement.dependencies <= done and not (
+                statement.is_put_or_get and running
+            )
+
+        try:
+            while True:
+                while len(running) < max_concurrency:
+                    position = next(
+                        (pos for pos, st in waiting.items() if is_ready(st)), None
+                    )
+                    if position is not None:
+                        statement = waiting.pop(position)
+                        cursor = self._conn.cursor(cursor_class=cursor_class)
+                        self._log.debug("Submitting %s", statement.sql)
+                        if statement.is_put_or_get:
+                            cursor.execute(statement.sql, _is_put_get=True)
+                            done.add(position)
+                            completed[position] = cursor
+                        else:
+                            cursor.execute_async(statement.sql)
+                            running[position] = cursor
+                            running_sql[position] = statement.sql
+                    elif exhausted or len(waiting) >= CONCURRENT_STATEMENTS_LOOKAHEAD:
+                        break
+                    else:
+                        next_statement = next(statements, None)
+                        if next_statement is None:
+                            exhausted = True
+                        else:
+                            waiting[read_count] = next_statement
+                            read_count += 1
+
+                while yielded_count in completed:
+                    yield completed.pop(yielded_count)
+                    yielded_count += 1
+
+                if not running:
+                    if exhausted and not waiting:
+                        return
+                    continue
+
+                finished = [
+                    position
+                    for position, cursor in running.items()
+                    if not self._conn.is_still_running(
+                        self._conn.get_query_status_throw_if_error(cursor.sfqid)
+                    )
+                ]
+                for position in finished:
+                    cursor = running.pop(position)
+                    cursor.get_results_from_sfqid(cursor.sfqid)
+                    self._session_state.observe(running_sql.pop(position))
+                    done.add(position)
+                    completed[position] = cursor
+
+                if finished:
+                    poll_interval = ASYNC_POLL_MIN_INTERVAL_SECONDS
+                else:
+                    time.sleep(poll_interval)
+                    poll_interval = min(
+                        poll_interval * 2, ASYNC_POLL_MAX_INTERVAL_SECONDS
+                    )
+        except BaseException:
+            self._session_state.invalidate()
+            raise
+        finally:
+            for cursor in running.values():
+                self._log.debug("Aborting query %s", cursor.sfqid)
+                cursor.abort_query(cursor.sfqid)
+
     def _execute_query(self, query: str, **kwargs):
         *_, last_result = self._execute_queries(query, **kwargs)
         return last_result
@@ -66,25 +248,53 @@ class SqlExecutionMixin:
     def use(self, object_type: ObjectType, name: str):
         return self._execute_query(f"use {object_type.value.sf_name} {name}")
 
+    def _get_current_role(self) -> str:
+        """
+        Returns the current role of the session, querying it only if the role
+        is not known from the statements executed so far.
+        """
+        if self._session_state.role is None:
+            role_result = self._execute_query(
+                f"select current_role()", cursor_class=DictCursor
+            ).fetchone()
+            self._session_state.role = role_result["CURRENT_ROLE()"]
+        return self._session_state.role
+
     @contextmanager
     def use_role(self, new_role: str):
         """
         Switches to a different role for a while, then switches back.
         This is a no-op if the requested role is already active.
         """
-        role_result = self._execute_query(
-            f"select current_role()", cursor_class=DictCursor
-        ).fetchone()
-        prev_role = role_result["CURRENT_ROLE()"]
+        prev_role = self._get_current_role()
         is_different_role = new_role.lower() != prev_role.lower()
         if is_different_role:
             self._log.debug("Assuming different role: %s", new_role)
-            self._execute_query(f"use role {new_role}")
+            self._switch_role(new_role)
         try:
             yield
         finally:
             if is_different_role:
-                self._execute_query(f"use role {prev_role}")
+                self._switch_role(prev_role)
+
+    def _switch_role(self, role: str):
+        self._session_state.role = None
+        self._execute_query(f"use role {role}")
+        self._session_state.role = role
+
+    def use_warehouse(self, warehouse: str):
+        """
+        Switches to the given warehouse for the rest of the session.
+        This is a no-op if the warehouse is already known to be in use.
+        """
+        current_warehouse = self._session_state.warehouse
+        if current_warehouse is not None and (
+            current_warehouse.lower() == warehouse.lower()
+        ):
+            return
+        self._session_state.warehouse = None
+        self._execute_query(f"use warehouse {warehouse}")
+        self._session_state.warehouse = warehouse
 
     def create_password_secret(
         self, name: str, username: str, password: str
@@ -201,6 +411,34 @@ class SqlExecutionMixin:
             raise self.InClauseWithQualifiedNameError()
         elif name_in_clause:
             in_clause = name_in_clause
+
+        metadata = self._session_state.metadata
+        metadata_context = self._session_state.metadata_context
+        if metadata_context is not None:
+            if check_schema:
+                self.check_database_and_schema_provided(name)
+            listing = metadata.get_listing(
+                metadata_context, object_type_plural, in_clause
+            )
+            if listing is not None:
+                return next(
+                    (
+                        dict(row)
+                        for row in listing
+                        if row[name_col] == unquote_identifier(unqualified_name)
+                    ),
+                    None,
+                )
+            cached_row = metadata.get(
+                metadata_context,
+                object_type_plural,
+                unqualified_name,
+                in_clause,
+                default=_NOT_CACHED,
+            )
+            if cached_row is not _NOT_CACHED:
+                return dict(cached_row) if cached_row else None
+
         show_obj_query = f"show {object_type_plural} like {identifier_to_show_like_pattern(unqualified_name)} {in_clause}".strip()
 
         if check_schema:
@@ -223,4 +461,33 @@ class SqlExecutionMixin:
             show_obj_cursor,
             lambda row: row[name_col] == unquote_identifier(unqualified_name),
         )
+        if metadata_context is not None:
+            metadata.put(
+                metadata_context,
+                object_type_plural,
+                unqualified_name,
+                in_clause,
+                dict(show_obj_row) if show_obj_row else None,
+            )
         return show_obj_row
+
+    def list_objects(self, object_type_plural: str, in_clause: str) -> List[dict]:
+        """
+        Executes a "show <objects> in <scope>" query and returns all of its rows.
+        """
+        show_objs_query = f"show {object_type_plural} {in_clause}"
+        return self._execute_query(show_objs_query, cursor_class=DictCursor).fetchall()
+
+    def prefetch_objects(self, object_type_plural: str, in_clause: str) -> List[dict]:
+        """
+        Lists objects like list_objects and keeps all of the rows, so that later
+        calls to show_specific_object for objects of that type in that scope
+        are answered without querying Snowflake, until a DDL statement is executed.
+        """
+        rows = self.list_objects(object_type_plural, in_clause)
+        metadata_context = self._session_state.metadata_context
+        if metadata_context is not None:
+            self._session_state.metadata.put_listing(
+                metadata_context, object_type_plural, in_clause, rows
+            )
+        return rows
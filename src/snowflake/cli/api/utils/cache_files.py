@@ -0,0 +1,30 @@
+import json
+import logging
+from pathlib import Path
+from typing import Optional
+
+log = logging.getLogger(__name__)
+
+# Caches are read on every start of the CLI, so unlike SecurePath these helpers
+# do not log every access, and treat unreadable caches as missing.
+
+
+def read_cache_file(path: Path) -> Optional[dict]:
+    """Returns JSON content of the cache file, or None if it is missing or unreadable."""
+    try:
+        return json.loads(path.read_text())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as err:
+        log.debug("Ignoring unreadable cache file %s: %s", path, err)
+        return None
+
+
+def write_cache_file(path: Path, content: dict) -> None:
+    """Writes JSON content to the cache file, readable only by the owner."""
+    try:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        path.touch(mode=0o600, exist_ok=True)
+        path.write_text(json.dumps(content))
+    except OSError as err:
+        log.debug("Could not write cache file %s: %s", path, err)
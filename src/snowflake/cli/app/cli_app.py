@@ -19,11 +19,13 @@ from snowflake.cli.api.secure_path import SecurePath
 from snowflake.cli.app.api_impl.plugin.plugin_config_provider_impl import (
     PluginConfigProviderImpl,
 )
+from snowflake.cli.app.commands_registration.command_manifest import (
+    load_lazy_commands,
+)
 from snowflake.cli.app.commands_registration.commands_registration_with_callbacks import (
     CommandsRegistrationWithCallbacks,
 )
 from snowflake.cli.app.dev.commands_structure import generate_commands_structure
-from snowflake.cli.app.dev.docs.generator import generate_docs
 from snowflake.cli.app.dev.pycharm_remote_debug import (
     setup_pycharm_remote_debugger_if_provided,
 )
@@ -86,7 +88,11 @@ def _disable_external_command_plugins_callback(value: bool):
 @_commands_registration.after
 def _docs_callback(value: bool):
     if value:
+        # jinja2 used by the generator is imported only when generating docs
+        from snowflake.cli.app.dev.docs.generator import generate_docs
+
         ctx = click.get_current_context()
+        load_lazy_commands(ctx.command)
         generate_docs(SecurePath("gen_docs"), ctx.command)
         _exit_with_cleanup()
 
@@ -96,6 +102,7 @@ def _docs_callback(value: bool):
 def _commands_structure_callback(value: bool):
     if value:
         ctx = click.get_current_context()
+        load_lazy_commands(ctx.command)
         generate_commands_structure(ctx.command).print_node()
         _exit_with_cleanup()
 
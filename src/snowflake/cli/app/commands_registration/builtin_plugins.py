@@ -1,28 +1,33 @@
-from snowflake.cli.plugins.connection import plugin_spec as connection_plugin_spec
-from snowflake.cli.plugins.git import plugin_spec as git_plugin_spec
-from snowflake.cli.plugins.nativeapp import plugin_spec as nativeapp_plugin_spec
-from snowflake.cli.plugins.object import plugin_spec as object_plugin_spec
-from snowflake.cli.plugins.render import plugin_spec as render_plugin_spec
-from snowflake.cli.plugins.snowpark import plugin_spec as snowpark_plugin_spec
-from snowflake.cli.plugins.spcs import plugin_spec as spcs_plugin_spec
-from snowflake.cli.plugins.sql import plugin_spec as sql_plugin_spec
-from snowflake.cli.plugins.stage import plugin_spec as stage_plugin_spec
-from snowflake.cli.plugins.streamlit import plugin_spec as streamlit_plugin_spec
+from importlib import import_module
+
+# plugin name to module of plugin spec; modules are imported only when
+# commands of the plugin are needed
+BUILTIN_PLUGIN_SPEC_MODULES = {
+    "connection": "snowflake.cli.plugins.connection.plugin_spec",
+    "spcs": "snowflake.cli.plugins.spcs.plugin_spec",
+    "nativeapp": "snowflake.cli.plugins.nativeapp.plugin_spec",
+    "object": "snowflake.cli.plugins.object.plugin_spec",
+    "render": "snowflake.cli.plugins.render.plugin_spec",
+    "snowpark": "snowflake.cli.plugins.snowpark.plugin_spec",
+    "stage": "snowflake.cli.plugins.stage.plugin_spec",
+    "sql": "snowflake.cli.plugins.sql.plugin_spec",
+    "streamlit": "snowflake.cli.plugins.streamlit.plugin_spec",
+    "git": "snowflake.cli.plugins.git.plugin_spec",
+    "daemon": "snowflake.cli.plugins.daemon.plugin_spec",
+    "batch": "snowflake.cli.plugins.batch.plugin_spec",
+    "shell": "snowflake.cli.plugins.shell.plugin_spec",
+}
+
+
+def get_builtin_plugin_spec(plugin_name: str):
+    return import_module(BUILTIN_PLUGIN_SPEC_MODULES[plugin_name])
 
 
 # plugin name to plugin spec
 def get_builtin_plugin_name_to_plugin_spec():
     plugin_specs = {
-        "connection": connection_plugin_spec,
-        "spcs": spcs_plugin_spec,
-        "nativeapp": nativeapp_plugin_spec,
-        "object": object_plugin_spec,
-        "render": render_plugin_spec,
-        "snowpark": snowpark_plugin_spec,
-        "stage": stage_plugin_spec,
-        "sql": sql_plugin_spec,
-        "streamlit": streamlit_plugin_spec,
-        "git": git_plugin_spec,
+        plugin_name: get_builtin_plugin_spec(plugin_name)
+        for plugin_name in BUILTIN_PLUGIN_SPEC_MODULES
     }
 
     return plugin_specs
@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import click
+from snowflake.cli.__about__ import VERSION
+from snowflake.cli.api.config import get_cache_dir
+from snowflake.cli.api.utils.cache_files import read_cache_file, write_cache_file
+from snowflake.cli.app.commands_registration import (
+    LoadedBuiltInCommandPlugin,
+    LoadedCommandPlugin,
+)
+from snowflake.cli.app.commands_registration.builtin_plugins import (
+    BUILTIN_PLUGIN_SPEC_MODULES,
+)
+from snowflake.cli.app.commands_registration.command_plugins_loader import (
+    load_builtin_and_external_command_plugins,
+    load_command_plugins,
+)
+from snowflake.cli.app.commands_registration.external_plugins_discovery import (
+    discover_external_plugins,
+)
+from snowflake.cli.app.commands_registration.typer_registration import (
+    register_commands_from_plugins,
+)
+from typer.core import TyperGroup
+from typer.models import DefaultPlaceholder
+
+log = logging.getLogger(__name__)
+
+COMMAND_MANIFEST_VERSION = 1
+COMMAND_MANIFEST_FILENAME = "commands_manifest.json"
+
+_PLUGINS_DIR = Path(__file__).parent.parent.parent / "plugins"
+
+
+def get_command_manifest_path() -> Path:
+    return get_cache_dir() / COMMAND_MANIFEST_FILENAME
+
+
+def _get_external_plugin_versions(plugin_names: List[str]) -> Dict[str, Optional[str]]:
+    entry_points = discover_external_plugins(plugin_names)
+    return {
+        name: entry_points[name].version if name in entry_points else None
+        for name in plugin_names
+    }
+
+
+def get_command_manifest_cache_key(external_plugin_names: List[str]) -> Dict:
+    """
+    Describes everything the command tree depends on. Modification time of builtin
+    plugins covers editable installations, in which commands change without a new version.
+    """
+    return {
+        "version": VERSION,
+        "builtin_plugins_mtime": max(
+            (path.stat().st_mtime_ns for path in _PLUGINS_DIR.rglob("*.py")),
+            default=0,
+        ),
+        "external_plugins": _get_external_plugin_versions(external_plugin_names),
+    }
+
+
+def _get_default_value(value):
+    return value.value if isinstance(value, DefaultPlaceholder) else value
+
+
+def _describe_command(command: click.Command) -> Dict:
+    node = {
+        "name": command.name,
+        "help": command.help,
+        "short_help": command.short_help,
+        "hidden": command.hidden,
+        "deprecated": command.deprecated,
+        "rich_help_panel": _get_default_value(
+            getattr(command, "rich_help_panel", None)
+        ),
+        "options": [
+            option
+            for param in command.params
+            if isinstance(param, click.Option) and not param.hidden
+            for option in param.opts + param.secondary_opts
+        ],
+    }
+    if isinstance(command, click.Group):
+        node["commands"] = [
+            _describe_command(subcommand) for subcommand in command.commands.values()
+        ]
+    return node
+
+
+@dataclass
+class ManifestPlugin:
+    name: str
+    builtin: bool
+    command_path: List[str]
+    command: Dict
+    "Names, help and options of the command of the plugin and of its subcommands"
+
+
+@dataclass
+class CommandManifest:
+    """
+    Command tree of all plugins, used to list commands and to find the plugin owning
+    an invoked command without importing any plugin.
+    """
+
+    cache_key: Dict
+    plugins: List[ManifestPlugin]
+
+    @classmethod
+    def from_registered_plugins(
+        cls,
+        cache_key: Dict,
+        registered_plugins: List[LoadedCommandPlugin],
+        main_command_group: TyperGroup,
+    ) -> CommandManifest:
+        plugins = []
+        for plugin in registered_plugins:
+            command_path = plugin.command_spec.full_command_path.path_segments
+            command = main_command_group
+            for name in command_path:
+                command = command.commands[name]
+            plugins.append(
+                ManifestPlugin(
+                    name=plugin.plugin_name,
+                    builtin=isinstance(plugin, LoadedBuiltInCommandPlugin),
+                    command_path=command_path,
+                    command=_describe_command(command),
+                )
+            )
+        return cls(cache_key=cache_key, plugins=plugins)
+
+    @classmethod
+    def load(cls, path: Path, cache_key: Dict) -> Optional[CommandManifest]:
+        """Returns the manifest stored at the path, or None if it is missing or stale."""
+        data = read_cache_file(path)
+        if data is None:
+            return None
+        try:
+            if (
+                data["manifest_version"] != COMMAND_MANIFEST_VERSION
+                or data["cache_key"] != cache_key
+            ):
+                return None
+            return cls(
+                cache_key=data["cache_key"],
+                plugins=[ManifestPlugin(**plugin) for plugin in data["plugins"]],
+            )
+        except (KeyError, TypeError):
+            log.debug("Ignoring invalid command manifest %s", path)
+            return None
+
+    def save(self, path: Path) -> None:
+        data = {
+            "manifest_version": COMMAND_MANIFEST_VERSION,
+            "cache_key": self.cache_key,
+            "plugins": [asdict(plugin) for plugin in self.plugins],
+        }
+        write_cache_file(path, data)
+
+    def register_lazy_commands(self, main_command_group: TyperGroup) -> None:
+        """
+        Adds a placeholder for every top-level command, which loads the plugins owning
+        the command and its subcommands once it is invoked.
+        """
+        top_level_plugins: Dict[str, List[ManifestPlugin]] = {}
+        for plugin in sorted(self.plugins, key=lambda p: len(p.command_path)):
+            top_level_plugins.setdefault(plugin.command_path[0], []).append(plugin)
+        for name, plugins in top_level_plugins.items():
+            owner = plugins[0]
+            if len(owner.command_path) != 1 or name in main_command_group.commands:
+                continue
+            main_command_group.add_command(LazyPluginCommand(owner.command, plugins))
+
+
+class LazyPluginCommand(click.Command):
+    """
+    Placeholder of a top-level command, describing it in help of the main command group.
+    Its plugins are loaded when the command is invoked, replacing the placeholder
+    with the actual command.
+    """
+
+    def __init__(self, node: Dict, plugins: List[ManifestPlugin]):
+        super().__init__(
+            name=node["name"],
+            help=node["help"],
+            short_help=node["short_help"],
+            hidden=node["hidden"],
+            deprecated=node["deprecated"],
+        )
+        self.rich_help_panel = node["rich_help_panel"]
+        self._plugins = plugins
+
+    def load(self, main_command_group: TyperGroup) -> Optional[click.Command]:
+        """Registers the actual command in place of the placeholder and returns it."""
+        log.debug("Loading plugins of command [%s]", self.name)
+        loaded_plugins = load_command_plugins(
+            builtin_plugin_names=[
+                plugin.name
+                for plugin in self._plugins
+                if plugin.builtin and plugin.name in BUILTIN_PLUGIN_SPEC_MODULES
+            ],
+            external_plugin_names=[
+                plugin.name for plugin in self._plugins if not plugin.builtin
+            ],
+        )
+        loaded_plugins.sort(
+            key=lambda plugin: len(
+                plugin.command_spec.parent_command_path.path_segments
+            )
+        )
+        if main_command_group.commands.get(self.name) is self:
+            del main_command_group.commands[self.name]
+        register_commands_from_plugins(loaded_plugins, main_command_group)
+        return main_command_group.commands.get(self.name)
+
+    def make_context(self, info_name, args, parent=None, **extra) -> click.Context:
+        command = self.load(parent.command)
+        if command is None:
+            raise click.UsageError(f"No such command '{self.name}'.", ctx=parent)
+        return command.make_context(info_name, args, parent=parent, **extra)
+
+
+def load_lazy_commands(main_command_group: TyperGroup) -> None:
+    """Replaces all placeholders with actual commands, e.g. to document all of them."""
+    for command in list(main_command_group.commands.values()):
+        if isinstance(command, LazyPluginCommand):
+            command.load(main_command_group)
+
+
+def register_commands_using_manifest(
+    main_command_group: TyperGroup, external_plugin_names: List[str]
+) -> None:
+    """
+    Registers placeholders of commands from the manifest. If the manifest is missing or
+    stale, all plugins are loaded and registered instead, and the manifest is regenerated.
+    """
+    cache_key = get_command_manifest_cache_key(external_plugin_names)
+    manifest_path = get_command_manifest_path()
+    manifest = CommandManifest.load(manifest_path, cache_key)
+    if manifest is not None:
+        manifest.register_lazy_commands(main_command_group)
+        return
+    log.debug("Generating command manifest %s", manifest_path)
+    registered_plugins = register_commands_from_plugins(
+        load_builtin_and_external_command_plugins(external_plugin_names),
+        main_command_group,
+    )
+    CommandManifest.from_registered_plugins(
+        cache_key, registered_plugins, main_command_group
+    ).save(manifest_path)
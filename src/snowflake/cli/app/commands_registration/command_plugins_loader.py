@@ -1,5 +1,5 @@
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 
 import pluggy
 from snowflake.cli.api.plugins.command import (
@@ -15,8 +15,12 @@ from snowflake.cli.app.commands_registration import (
 )
 from snowflake.cli.app.commands_registration.builtin_plugins import (
     get_builtin_plugin_name_to_plugin_spec,
+    get_builtin_plugin_spec,
 )
 from snowflake.cli.app.commands_registration.exception_logging import exception_logging
+from snowflake.cli.app.commands_registration.external_plugins_discovery import (
+    discover_external_plugins,
+)
 
 log = logging.getLogger(__name__)
 log_exception = exception_logging(log)
@@ -29,21 +33,44 @@ class CommandPluginsLoader:
         self._plugin_manager = plugin_manager
         self._loaded_plugins: Dict[str, LoadedCommandPlugin] = {}
         self._loaded_command_paths: Dict[CommandPath, LoadedCommandPlugin] = {}
+        self._builtin_plugin_names: Set[str] = set()
 
     def register_builtin_plugins(self) -> None:
         for plugin_name, plugin in get_builtin_plugin_name_to_plugin_spec().items():
-            try:
-                self._plugin_manager.register(plugin=plugin, name=plugin_name)
-            except Exception as ex:
-                log_exception(
-                    f"Cannot register plugin [{plugin_name}]: {ex.__str__()}", ex
-                )
+            self._register_builtin_plugin(plugin_name, plugin)
+
+    def register_builtin_plugin(self, plugin_name: str) -> None:
+        try:
+            plugin = get_builtin_plugin_spec(plugin_name)
+        except Exception as ex:
+            log_exception(f"Cannot register plugin [{plugin_name}]: {ex.__str__()}", ex)
+            return
+        self._register_builtin_plugin(plugin_name, plugin)
+
+    def _register_builtin_plugin(self, plugin_name: str, plugin) -> None:
+        self._builtin_plugin_names.add(plugin_name)
+        try:
+            self._plugin_manager.register(plugin=plugin, name=plugin_name)
+        except Exception as ex:
+            log_exception(f"Cannot register plugin [{plugin_name}]: {ex.__str__()}", ex)
 
     def register_external_plugins(self, plugin_names: List[str]) -> None:
+        try:
+            entry_points = discover_external_plugins(plugin_names)
+        except Exception as ex:
+            log_exception(f"Cannot discover external plugins: {ex.__str__()}", ex)
+            return
         for plugin_name in plugin_names:
+            entry_point = entry_points.get(plugin_name)
+            if (
+                entry_point is None
+                or self._plugin_manager.get_plugin(plugin_name)
+                or self._plugin_manager.is_blocked(plugin_name)
+            ):
+                continue
             try:
-                self._plugin_manager.load_setuptools_entrypoints(
-                    SNOWCLI_COMMAND_PLUGIN_NAMESPACE, plugin_name
+                self._plugin_manager.register(
+                    plugin=entry_point.load(), name=plugin_name
                 )
             except Exception as ex:
                 log_exception(
@@ -89,7 +116,7 @@ class CommandPluginsLoader:
     def _load_plugin_spec(
         self, plugin_name: str, plugin
     ) -> Optional[LoadedCommandPlugin]:
-        if plugin_name in get_builtin_plugin_name_to_plugin_spec().keys():
+        if plugin_name in self._builtin_plugin_names:
             return self._load_builtin_plugin_spec(plugin_name, plugin)
         else:
             return self._load_external_plugin_spec(plugin_name, plugin)
@@ -143,3 +170,14 @@ def load_builtin_and_external_command_plugins(
     loader.register_builtin_plugins()
     loader.register_external_plugins(external_plugin_names)
     return loader.load_all_registered_plugins()
+
+
+def load_command_plugins(
+    builtin_plugin_names: List[str], external_plugin_names: List[str]
+) -> List[LoadedCommandPlugin]:
+    """Loads only the given plugins, importing none of the other builtin plugins."""
+    loader = CommandPluginsLoader()
+    for plugin_name in builtin_plugin_names:
+        loader.register_builtin_plugin(plugin_name)
+    loader.register_external_plugins(external_plugin_names)
+    return loader.load_all_registered_plugins()
@@ -1,7 +1,13 @@
 from dataclasses import dataclass
 from typing import Callable, List
+from weakref import WeakSet
 
+import click
+from snowflake.cli.api.feature_flags import FeatureFlag
 from snowflake.cli.api.plugins.plugin_config import PluginConfigProvider
+from snowflake.cli.app.commands_registration.command_manifest import (
+    register_commands_using_manifest,
+)
 from snowflake.cli.app.commands_registration.command_plugins_loader import (
     load_builtin_and_external_command_plugins,
     load_only_builtin_command_plugins,
@@ -31,6 +37,7 @@ class CommandsRegistrationWithCallbacks:
             CommandRegistrationConfig(enable_external_command_plugins=True)
         )
         self._commands_already_registered: bool = False
+        self._command_groups_with_registered_commands: WeakSet = WeakSet()
 
     def register_commands_if_ready_and_not_registered_yet(self):
         all_required_callbacks_executed = (
@@ -41,10 +48,16 @@ class CommandsRegistrationWithCallbacks:
             self._register_commands_from_plugins()
 
     def _register_commands_from_plugins(self) -> None:
-        if self._commands_registration_config.enable_external_command_plugins:
-            self._register_builtin_and_enabled_external_plugin_commands()
-        else:
-            self._register_only_builtin_plugin_commands()
+        main_command_group = click.get_current_context().command
+        # commands run by "snow batch" are invoked through the same command group
+        if main_command_group not in self._command_groups_with_registered_commands:
+            if FeatureFlag.ENABLE_LAZY_COMMAND_LOADING.is_enabled():
+                self._register_commands_using_manifest(main_command_group)
+            elif self._commands_registration_config.enable_external_command_plugins:
+                self._register_builtin_and_enabled_external_plugin_commands()
+            else:
+                self._register_only_builtin_plugin_commands()
+            self._command_groups_with_registered_commands.add(main_command_group)
 
         self._commands_already_registered = True
         for callback in self._callbacks_after_registration:
@@ -64,6 +77,14 @@ class CommandsRegistrationWithCallbacks:
         )
         register_commands_from_plugins(loaded_command_plugins)
 
+    def _register_commands_using_manifest(self, main_command_group) -> None:
+        enabled_external_plugins = (
+            self._plugin_config_provider.get_enabled_plugin_names()
+            if self._commands_registration_config.enable_external_command_plugins
+            else []
+        )
+        register_commands_using_manifest(main_command_group, enabled_external_plugins)
+
     def disable_external_command_plugins(self):
         self._commands_registration_config.enable_external_command_plugins = False
 
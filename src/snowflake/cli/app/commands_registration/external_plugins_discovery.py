@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from snowflake.cli.__about__ import VERSION
+from snowflake.cli.api.config import get_cache_dir, get_plugins_config
+from snowflake.cli.api.plugins.command import SNOWCLI_COMMAND_PLUGIN_NAMESPACE
+from snowflake.cli.api.utils.cache_files import read_cache_file, write_cache_file
+
+log = logging.getLogger(__name__)
+
+EXTERNAL_PLUGINS_CACHE_VERSION = 1
+EXTERNAL_PLUGINS_CACHE_FILENAME = "external_plugins.json"
+
+
+def get_external_plugins_cache_path() -> Path:
+    return get_cache_dir() / EXTERNAL_PLUGINS_CACHE_FILENAME
+
+
+@dataclass
+class ExternalPluginEntryPoint:
+    name: str
+    value: str
+    "Reference to the plugin spec, e.g. `package.plugin_spec`"
+    distribution: str
+    version: str
+
+    def load(self):
+        from importlib.metadata import EntryPoint
+
+        return EntryPoint(
+            name=self.name, value=self.value, group=SNOWCLI_COMMAND_PLUGIN_NAMESPACE
+        ).load()
+
+
+def _get_search_path_mtimes() -> Dict[str, int]:
+    # installing or removing a distribution changes the directory containing its metadata
+    mtimes = {}
+    for path in sys.path:
+        try:
+            mtimes[path] = os.stat(path or os.curdir).st_mtime_ns
+        except OSError:
+            continue
+    return mtimes
+
+
+def get_external_plugins_cache_key(plugin_names: List[str]) -> Dict:
+    return {
+        "version": VERSION,
+        "plugin_names": sorted(plugin_names),
+        "plugins_config": json.loads(json.dumps(get_plugins_config(), default=str)),
+        "search_path_mtimes": _get_search_path_mtimes(),
+    }
+
+
+def _scan_distributions(plugin_names: List[str]) -> Dict[str, ExternalPluginEntryPoint]:
+    from importlib.metadata import distributions
+
+    entry_points: Dict[str, ExternalPluginEntryPoint] = {}
+    for distribution in distributions():
+        for entry_point in distribution.entry_points:
+            if (
+                entry_point.group == SNOWCLI_COMMAND_PLUGIN_NAMESPACE
+                and entry_point.name in plugin_names
+                and entry_point.name not in entry_points
+            ):
+                entry_points[entry_point.name] = ExternalPluginEntryPoint(
+                    name=entry_point.name,
+                    value=entry_point.value,
+                    distribution=distribution.metadata["Name"],
+                    version=distribution.version,
+                )
+    return entry_points
+
+
+def _load_cached_entry_points(
+    path: Path, cache_key: Dict
+) -> Optional[Dict[str, ExternalPluginEntryPoint]]:
+    data = read_cache_file(path)
+    if data is None:
+        return None
+    try:
+        if (
+            data["cache_version"] != EXTERNAL_PLUGINS_CACHE_VERSION
+            or data["cache_key"] != cache_key
+        ):
+            return None
+        return {
+            name: ExternalPluginEntryPoint(**entry_point)
+            for name, entry_point in data["entry_points"].items()
+        }
+    except (KeyError, TypeError):
+        log.debug("Ignoring invalid external plugins cache %s", path)
+        return None
+
+
+def _save_entry_points(
+    path: Path, cache_key: Dict, entry_points: Dict[str, ExternalPluginEntryPoint]
+) -> None:
+    data = {
+        "cache_version": EXTERNAL_PLUGINS_CACHE_VERSION,
+        "cache_key": cache_key,
+        "entry_points": {
+            name: asdict(entry_point) for name, entry_point in entry_points.items()
+        },
+    }
+    write_cache_file(path, data)
+
+
+def discover_external_plugins(
+    plugin_names: List[str],
+) -> Dict[str, ExternalPluginEntryPoint]:
+    """
+    Finds entry points of the given plugins in metadata of installed distributions.
+    Scanning the metadata is slow in environments with many packages, so the result is
+    cached until directories on the search path or plugins configuration change.
+    """
+    if not plugin_names:
+        return {}
+    cache_key = get_external_plugins_cache_key(plugin_names)
+    cache_path = get_external_plugins_cache_path()
+    entry_points = _load_cached_entry_points(cache_path, cache_key)
+    if entry_points is None:
+        log.debug("Scanning installed distributions for plugins %s", plugin_names)
+        entry_points = _scan_distributions(plugin_names)
+        _save_entry_points(cache_path, cache_key, entry_points)
+    return entry_points
@@ -1,5 +1,6 @@
 import logging
-from typing import List
+from dataclasses import replace
+from typing import List, Optional
 
 import click
 from snowflake.cli.api.plugins.command import CommandSpec, CommandType
@@ -12,20 +13,28 @@ log_exception = exception_logging(log)
 
 
 class TyperCommandsRegistration:
-    def __init__(self, plugins: List[LoadedCommandPlugin]):
+    def __init__(
+        self,
+        plugins: List[LoadedCommandPlugin],
+        main_typer_command_group: Optional[TyperGroup] = None,
+    ):
         self._plugins = plugins
         self._main_typer_command_group = (
-            self._get_main_typer_command_group_from_click_context()
+            main_typer_command_group
+            or self._get_main_typer_command_group_from_click_context()
         )
 
-    def register_commands(self):
+    def register_commands(self) -> List[LoadedCommandPlugin]:
+        registered_plugins = []
         for plugin in self._plugins:
             try:
-                self._add_plugin_to_typer(plugin.command_spec)
+                command_spec = self._add_plugin_to_typer(plugin.command_spec)
+                registered_plugins.append(replace(plugin, command_spec=command_spec))
             except Exception as ex:
                 log_exception(
                     f"Cannot register plugin [{plugin.plugin_name}]: {ex.__str__()}", ex
                 )
+        return registered_plugins
 
     @staticmethod
     def _get_main_typer_command_group_from_click_context() -> TyperGroup:
@@ -40,7 +49,7 @@ class TyperCommandsRegistration:
     def _add_plugin_to_typer(
         self,
         command_spec: CommandSpec,
-    ) -> None:
+    ) -> CommandSpec:
         command_spec = self._adjust_command_spec_if_required(command_spec)
         parent_group = self._find_typer_group_at_path(
             current_level_group=self._main_typer_command_group,
@@ -49,6 +58,7 @@ class TyperCommandsRegistration:
         )
         self._validate_command_spec(command_spec, parent_group)
         parent_group.add_command(command_spec.command)
+        return command_spec
 
     def _adjust_command_spec_if_required(
         self,
@@ -133,5 +143,10 @@ class TyperCommandsRegistration:
             return current_level_group
 
 
-def register_commands_from_plugins(plugins: List[LoadedCommandPlugin]) -> None:
-    return TyperCommandsRegistration(plugins).register_commands()
+def register_commands_from_plugins(
+    plugins: List[LoadedCommandPlugin],
+    main_typer_command_group: Optional[TyperGroup] = None,
+) -> List[LoadedCommandPlugin]:
+    return TyperCommandsRegistration(
+        plugins, main_typer_command_group
+    ).register_commands()
@@ -1,17 +1,16 @@
 from __future__ import annotations
 
+import csv
 import json
 import sys
 from datetime import datetime
+from itertools import islice
 from json import JSONEncoder
 from pathlib import Path
 from textwrap import indent
-from typing import TextIO
+from typing import Dict, Iterator, List, TextIO
 
-from rich import box, get_console
-from rich import print as rich_print
-from rich.live import Live
-from rich.table import Table
+from click import ClickException
 from snowflake.cli.api.cli_global_context import cli_context
 from snowflake.cli.api.output.formats import OutputFormat
 from snowflake.cli.api.output.types import (
@@ -22,11 +21,10 @@ from snowflake.cli.api.output.types import (
     ObjectResult,
     QueryResult,
 )
+from snowflake.connector.errors import NotSupportedError
 
 NO_ITEMS_FOUND: str = "No data"
-
-# ensure we do not break URLs that wrap lines
-get_console().soft_wrap = True
+TABLE_PAGE_SIZE: int = 1000
 
 
 class CustomJSONEncoder(JSONEncoder):
@@ -51,28 +49,69 @@ def _get_format_type() -> OutputFormat:
     return OutputFormat.TABLE
 
 
-def _get_table():
-    return Table(show_header=True, box=box.ASCII)
+def _get_console():
+    from rich import get_console
+
+    console = get_console()
+    # ensure we do not break URLs that wrap lines
+    console.soft_wrap = True
+    return console
+
+
+def _rich_print(*objects, end: str = "\n"):
+    _get_console().print(*objects, end=end)
+
+
+def _get_table(show_header: bool = True):
+    from rich import box
+    from rich.table import Table
+
+    return Table(show_header=show_header, box=box.ASCII)
+
+
+def _sample_column_widths(columns: List[str], sample: List[Dict]) -> List[int]:
+    """Computes column widths fitting the header and all values of the sample."""
+    from rich.cells import cell_len
+
+    def _width(value) -> int:
+        return max((cell_len(line) for line in str(value).splitlines()), default=0)
+
+    return [
+        max([_width(column)] + [_width(value) for value in values])
+        for column, values in zip(columns, zip(*(item.values() for item in sample)))
+    ]
 
 
 def _print_multiple_table_results(obj: CollectionResult):
     if isinstance(obj, QueryResult):
-        rich_print(obj.query)
+        _rich_print(obj.query)
     items = obj.result
-    try:
-        first_item = next(items)
-    except StopIteration:
-        rich_print(NO_ITEMS_FOUND, end="\n\n")
+    page = list(islice(items, TABLE_PAGE_SIZE))
+    if not page:
+        _rich_print(NO_ITEMS_FOUND, end="\n\n")
         return
-    table = _get_table()
-    for column in first_item.keys():
-        table.add_column(column, overflow="fold")
-    with Live(table, refresh_per_second=4):
-        table.add_row(*[str(i) for i in first_item.values()])
-        for item in items:
+    columns = list(page[0].keys())
+    # results larger than a single page are printed page by page, so that rows
+    # are never all held in memory; column widths are fixed by the first page
+    widths = (
+        _sample_column_widths(columns, page)
+        if len(page) == TABLE_PAGE_SIZE
+        else [None] * len(columns)
+    )
+    show_header = True
+    while page:
+        table = _get_table(show_header=show_header)
+        for column, width in zip(columns, widths):
+            table.add_column(column, overflow="fold", width=width)
+        for item in page:
             table.add_row(*[str(i) for i in item.values()])
-    # Add separator between tables
-    rich_print()
+        _rich_print(table)
+        show_header = False
+        page = list(islice(items, TABLE_PAGE_SIZE))
+    # Add separator between tables, which was printed only to terminals
+    # when tables were rendered live
+    if _get_console().is_terminal:
+        _rich_print()
 
 
 def is_structured_format(output_format):
@@ -111,11 +150,11 @@ def _stream_json(result):
 def print_unstructured(obj: CommandResult | None):
     """Handles outputs like table, plain text and other unstructured types."""
     if not obj:
-        rich_print("Done")
+        _rich_print("Done")
     elif not obj.result:
-        rich_print("No data")
+        _rich_print("No data")
     elif isinstance(obj, MessageResult):
-        rich_print(obj.message)
+        _rich_print(obj.message)
     else:
         if isinstance(obj, ObjectResult):
             _print_single_table(obj)
@@ -131,13 +170,150 @@ def _print_single_table(obj):
     table.add_column("value", overflow="fold")
     for key, value in obj.result.items():
         table.add_row(str(key), str(value))
-    rich_print(table)
+    _rich_print(table)
+
+
+def _iter_rows(result: CommandResult | None) -> Iterator[Dict]:
+    if result is None:
+        return
+    if isinstance(result, MultipleResults):
+        for element in result.result:
+            yield from _iter_rows(element)
+    elif isinstance(result, CollectionResult):
+        yield from result.result
+    elif result.result is not None:
+        yield result.result
+
+
+def print_ndjson(result: CommandResult | None):
+    """Writes every row as a separate JSON document, one per line, as it is fetched."""
+    for row in _iter_rows(result):
+        sys.stdout.write(json.dumps(row, cls=CustomJSONEncoder))
+        sys.stdout.write("\n")
+
+
+def print_csv(result: CommandResult | None):
+    """
+    Writes rows as CSV as they are fetched. Each result of multiple results
+    gets its own header, separated from the previous one by an empty line.
+    """
+    if isinstance(result, MultipleResults):
+        for i, element in enumerate(result.result):
+            if i:
+                sys.stdout.write("\n")
+            print_csv(element)
+        return
+
+    writer = csv.writer(sys.stdout, lineterminator="\n")
+    rows = _iter_rows(result)
+    first_row = next(rows, None)
+    if first_row is not None:
+        writer.writerow(first_row.keys())
+        writer.writerow(first_row.values())
+    elif isinstance(result, QueryResult):
+        writer.writerow(result.column_names)
+    writer.writerows(row.values() for row in rows)
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError:
+        raise ClickException(
+            "ARROW and PARQUET output formats require the pyarrow package. "
+            "Install it with `pip install snowflake-cli-labs[arrow]`."
+        )
+    return pyarrow
+
+
+def _iter_arrow_tables(pa, result: CommandResult | None):
+    """
+    Yields the result as Arrow tables. Query results are fetched as Arrow batches,
+    without converting values to Python objects; other results are converted row by row.
+    At least one table is yielded, so that the schema of empty results is preserved.
+    """
+    if isinstance(result, QueryResult):
+        try:
+            batches = result.cursor.fetch_arrow_batches()
+        except NotSupportedError:
+            # results of some statements (e.g. "show") are not returned as Arrow
+            batches = None
+        if batches is not None:
+            has_batches = False
+            for batch in batches:
+                has_batches = True
+                yield batch
+            if not has_batches:
+                yield pa.schema(
+                    [(column, pa.null()) for column in result.column_names]
+                ).empty_table()
+            return
+
+    rows = list(_iter_rows(result))
+    if rows or not isinstance(result, QueryResult):
+        yield pa.Table.from_pylist(rows)
+    else:
+        yield pa.schema(
+            [(column, pa.null()) for column in result.column_names]
+        ).empty_table()
+
+
+def _widen_schema(pa, schema):
+    """
+    Batches of the same result may use integers of different widths,
+    depending on the values in each batch; all of them are written as int64.
+    """
+    return pa.schema(
+        [
+            field.with_type(pa.int64()) if pa.types.is_integer(field.type) else field
+            for field in schema
+        ]
+    )
+
+
+def print_arrow(result: CommandResult | None, output_format: OutputFormat):
+    """
+    Writes a single result to stdout as an Arrow IPC stream or a Parquet file,
+    one batch at a time.
+    """
+    if isinstance(result, MultipleResults):
+        raise ClickException(
+            f"{output_format.value} output format supports only a single result, "
+            "but the command returned multiple results."
+        )
+    if sys.stdout.isatty():
+        raise ClickException(
+            f"{output_format.value} output format is binary. Redirect the output to a file."
+        )
+    pa = _import_pyarrow()
+
+    sink = sys.stdout.buffer
+    writer = None
+    schema = None
+    for table in _iter_arrow_tables(pa, result):
+        if writer is None:
+            schema = _widen_schema(pa, table.schema)
+            if output_format == OutputFormat.PARQUET:
+                writer = pa.parquet.ParquetWriter(sink, schema)
+            else:
+                writer = pa.ipc.new_stream(sink, schema)
+        writer.write_table(table.cast(schema))
+    writer.close()
+    sink.flush()
 
 
 def print_result(cmd_result: CommandResult, output_format: OutputFormat | None = None):
     output_format = output_format or _get_format_type()
     if is_structured_format(output_format):
         print_structured(cmd_result)
+    elif output_format == OutputFormat.NDJSON:
+        print_ndjson(cmd_result)
+    elif output_format == OutputFormat.CSV:
+        print_csv(cmd_result)
+    elif output_format.is_binary:
+        print_arrow(cmd_result, output_format)
     elif isinstance(cmd_result, MultipleResults):
         for res in cmd_result.result:
             print_result(res)
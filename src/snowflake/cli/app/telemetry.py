@@ -3,7 +3,7 @@ from __future__ import annotations
 import platform
 import sys
 from enum import Enum, unique
-from typing import Any, Dict, Union
+from typing import Any, Dict, List, Union
 
 import click
 from snowflake.cli.__about__ import VERSION
@@ -72,6 +72,7 @@ def python_version() -> str:
 class CLITelemetryClient:
     def __init__(self, ctx):
         self._ctx = ctx
+        self._pending: List[TelemetryData] = []
 
     @staticmethod
     def generate_telemetry_data_dict(
@@ -93,15 +94,23 @@ class CLITelemetryClient:
         return self._ctx.connection._telemetry  # noqa
 
     def send(self, payload: TelemetryDict):
-        if self._telemetry:
-            message = self.generate_telemetry_data_dict(payload)
-            telemetry_data = TelemetryData.from_telemetry_data_dict(
+        """
+        Queues the event until the telemetry is flushed, so that logging it does not
+        wait for the connection, which may still be established in the background.
+        """
+        message = self.generate_telemetry_data_dict(payload)
+        self._pending.append(
+            TelemetryData.from_telemetry_data_dict(
                 from_dict=message, timestamp=get_time_millis()
             )
-            self._telemetry.try_add_log_to_batch(telemetry_data)
+        )
 
     def flush(self):
-        self._telemetry.send_batch()
+        pending, self._pending = self._pending, []
+        if self._telemetry:
+            for telemetry_data in pending:
+                self._telemetry.try_add_log_to_batch(telemetry_data)
+            self._telemetry.send_batch()
 
 
 _telemetry = CLITelemetryClient(ctx=cli_context)
@@ -0,0 +1,50 @@
+import sys
+from pathlib import Path
+from typing import Optional
+
+import click
+import typer
+from snowflake.cli.api.commands.snow_typer import SnowTyper
+from snowflake.cli.api.constants import DEFAULT_SIZE_LIMIT_MB
+from snowflake.cli.api.output.types import CollectionResult, CommandResult
+from snowflake.cli.api.secure_path import SecurePath
+from snowflake.cli.plugins.batch.manager import BatchManager, parse_commands
+
+# simple Typer with defaults because it won't become a command group as it contains only one command
+app = SnowTyper()
+
+
+@app.command(name="batch")
+def execute_batch(
+    file: Optional[Path] = typer.Option(
+        None,
+        "--filename",
+        "-f",
+        exists=True,
+        file_okay=True,
+        dir_okay=False,
+        readable=True,
+        help="File with commands to run, one per line. Commands are read from standard input if not provided.",
+    ),
+    continue_on_error: bool = typer.Option(
+        False,
+        "--continue-on-error",
+        help="Runs remaining commands after a command fails, instead of stopping the batch.",
+        is_flag=True,
+    ),
+    **options,
+) -> CommandResult:
+    """
+    Runs many commands in a single process, sharing a connection between them.
+
+    Each line is a command line of `snow`, for example `sql -q "select 1"`. Empty lines and lines
+    starting with `#` are skipped. The connection is opened again only when options of a command
+    change how to connect, like `--connection` or `--role`.
+    """
+    if file:
+        lines = SecurePath(file).read_text(DEFAULT_SIZE_LIMIT_MB).splitlines()
+    else:
+        lines = sys.stdin.read().splitlines()
+    commands = parse_commands(lines)
+    manager = BatchManager(click.get_current_context().find_root())
+    return CollectionResult(manager.execute(commands, continue_on_error))
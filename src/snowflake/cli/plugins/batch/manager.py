@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import logging
+import shlex
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import click
+from click import ClickException
+from snowflake.cli.api.cli_global_context import cli_context, cli_context_manager
+from snowflake.cli.api.console import cli_console
+
+log = logging.getLogger(__name__)
+
+_PROGRAM_NAME = "snow"
+
+
+@dataclass
+class BatchCommand:
+    line_number: int
+    args: List[str]
+
+    @property
+    def command_line(self) -> str:
+        return shlex.join(self.args)
+
+
+def parse_commands(lines: Iterable[str]) -> List[BatchCommand]:
+    """
+    Each line is a command line of `snow`, with or without the program name.
+    Empty lines and lines starting with `#` are skipped.
+    """
+    commands = []
+    for line_number, line in enumerate(lines, start=1):
+        try:
+            args = shlex.split(line, comments=True)
+        except ValueError as err:
+            raise ClickException(f"Cannot parse line {line_number}: {err}.")
+        if args and args[0] == _PROGRAM_NAME:
+            args = args[1:]
+        if args:
+            commands.append(BatchCommand(line_number, args))
+    return commands
+
+
+class BatchManager:
+    """
+    Runs commands through the application in the current process, so that they share
+    the cached connection. The connection is opened again only when options of
+    a command change how to connect.
+    """
+
+    def __init__(self, root_context: click.Context):
+        self._root_command = root_context.command
+        self._root_args = []
+        configuration_file: Optional[Path] = root_context.params.get(
+            "configuration_file"
+        )
+        if configuration_file:
+            self._root_args = ["--config-file", str(configuration_file)]
+
+    def execute(
+        self, commands: List[BatchCommand], continue_on_error: bool
+    ) -> List[Dict]:
+        # every command sets global options anew, so ones of the batch are restored
+        # before its summary is printed
+        global_options = (
+            cli_context.output_format,
+            cli_context.silent,
+            cli_context.verbose,
+            cli_context.enable_tracebacks,
+            cli_context.experimental,
+        )
+        try:
+            return self._execute(commands, continue_on_error)
+        finally:
+            (
+                output_format,
+                silent,
+                verbose,
+                enable_tracebacks,
+                experimental,
+            ) = global_options
+            cli_context_manager.set_output_format(output_format)
+            cli_context_manager.set_silent(silent)
+            cli_context_manager.set_verbose(verbose)
+            cli_context_manager.set_enable_tracebacks(enable_tracebacks)
+            cli_context_manager.set_experimental(experimental)
+
+    def _execute(
+        self, commands: List[BatchCommand], continue_on_error: bool
+    ) -> List[Dict]:
+        results = []
+        for command in commands:
+            start = time.monotonic()
+            error = self._run(command)
+            duration = round(time.monotonic() - start, 3)
+            description = f"line {command.line_number}: {command.command_line}"
+            if error is None:
+                cli_console.step(f"SUCCESS - {description} ({duration}s)")
+            else:
+                cli_console.warning(f"FAILURE - {description} ({duration}s)")
+                if not continue_on_error:
+                    raise ClickException(
+                        f"Command in line {command.line_number} failed: {error}"
+                    )
+            results.append(
+                {
+                    "Line": command.line_number,
+                    "Command": command.command_line,
+                    "Status": "SUCCESS" if error is None else "FAILURE",
+                    "Duration": duration,
+                    "Error": error,
+                }
+            )
+        return results
+
+    def _run(self, command: BatchCommand) -> Optional[str]:
+        """Runs the command, returning the error message if it failed."""
+        log.debug("Running command from line %d", command.line_number)
+        try:
+            exit_code = self._root_command.main(
+                args=[*self._root_args, *command.args],
+                prog_name=_PROGRAM_NAME,
+                standalone_mode=False,
+            )
+        except click.Abort:
+            raise
+        except ClickException as err:
+            from typer.rich_utils import rich_format_error
+
+            rich_format_error(err)
+            return err.format_message()
+        except SystemExit as err:
+            exit_code = err.code
+        except Exception as err:
+            if cli_context.enable_tracebacks:
+                raise
+            return str(err)
+        # click returns the code of an exit requested by the command
+        if isinstance(exit_code, int) and exit_code != 0:
+            return f"Exited with code {exit_code}."
+        return None
@@ -0,0 +1,360 @@
+from __future__ import annotations
+
+import logging
+import os
+import re
+import socket
+import threading
+from collections import deque
+from io import StringIO
+from typing import Any, Dict, Iterator, List, Optional
+
+import snowflake.connector
+from click import ClickException
+from snowflake.cli.plugins.daemon.protocol import (
+    DaemonDirectoryNotSecureError,
+    assert_directory_is_secure,
+    get_socket_path,
+    is_daemon_supported,
+    receive_message,
+    send_message,
+    uses_fake_connector,
+)
+from snowflake.connector import errors
+from snowflake.connector.connection import SnowflakeConnection
+from snowflake.connector.constants import QueryStatus
+from snowflake.connector.cursor import DictCursor, ResultMetadata, SnowflakeCursor
+from snowflake.connector.errors import NotSupportedError
+from snowflake.connector.util_text import split_statements
+
+log = logging.getLogger(__name__)
+
+# arguments of cursor.execute which are sent to the daemon
+_FORWARDED_EXECUTE_ARGUMENTS = {"params", "timeout"}
+_LOCAL_FILE_URI_REGEX = re.compile(
+    r"(?P<prefix>(?P<quote>')?file://)(?P<path>(?(quote)[^']+|\S+))", re.IGNORECASE
+)
+
+
+class DaemonError(ClickException):
+    pass
+
+
+class DaemonClient:
+    """Connection to the daemon over its socket, exchanging one message per request."""
+
+    def __init__(self, sock: socket.socket):
+        self._socket = sock
+        self._stream = sock.makefile("rwb")
+        self._lock = threading.Lock()
+        self.session: Dict = {}
+
+    @classmethod
+    def connect(cls) -> Optional[DaemonClient]:
+        """Connects to the daemon, or returns None if it is not running."""
+        socket_path = get_socket_path()
+        if not is_daemon_supported() or not socket_path.exists():
+            return None
+        try:
+            assert_directory_is_secure(socket_path.parent)
+        except DaemonDirectoryNotSecureError as err:
+            log.warning("Not using the daemon: %s", err.message)
+            return None
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(str(socket_path))
+        except OSError as err:
+            log.debug("Daemon is not running: %s", err)
+            sock.close()
+            return None
+        return cls(sock)
+
+    def request(self, action: str, **payload) -> Dict:
+        with self._lock:
+            try:
+                send_message(self._stream, {"action": action, **payload})
+                response = receive_message(self._stream)
+            except OSError as err:
+                raise DaemonError(f"Lost connection to the daemon: {err}")
+        if response is None:
+            raise DaemonError("Lost connection to the daemon.")
+        self.session = response.pop("session", self.session)
+        if "error" in response:
+            raise _to_exception(response["error"])
+        return response
+
+    def close(self):
+        self._stream.close()
+        self._socket.close()
+
+
+def _to_exception(error: Dict) -> Exception:
+    error_class = getattr(errors, error["type"] or "", None)
+    if isinstance(error_class, type) and issubclass(error_class, errors.Error):
+        return error_class(
+            msg=error["msg"],
+            errno=error["errno"],
+            sqlstate=error["sqlstate"],
+            sfqid=error["sfqid"],
+        )
+    return DaemonError(error["msg"])
+
+
+class DaemonCursor:
+    """
+    Results of statements executed by the daemon, providing the part of the cursor
+    interface used by the CLI. Results are fetched as a whole when the statement
+    completes.
+    """
+
+    def __init__(self, connection: DaemonConnection, use_dict_result: bool):
+        self._connection = connection
+        self._use_dict_result = use_dict_result
+        self._rows: deque = deque()
+        self._description: Optional[List[ResultMetadata]] = None
+        self.query: Optional[str] = None
+        self.sfqid: Optional[str] = None
+        self.rowcount: Optional[int] = None
+
+    @property
+    def connection(self) -> DaemonConnection:
+        return self._connection
+
+    @property
+    def description(self) -> Optional[List[ResultMetadata]]:
+        return self._description
+
+    def _load(self, cursor: Dict):
+        self._description = [
+            ResultMetadata(*column) for column in cursor["description"]
+        ]
+        rows = cursor["rows"]
+        self._rows = deque(rows if self._use_dict_result else map(tuple, rows))
+        self.query = cursor["query"]
+        self.sfqid = cursor["sfqid"]
+        self.rowcount = cursor["rowcount"]
+
+    def execute(self, command: str, _is_put_get: Optional[bool] = None, **kwargs):
+        unsupported = sorted(set(kwargs) - _FORWARDED_EXECUTE_ARGUMENTS)
+        if unsupported:
+            raise NotSupportedError(
+                f"Arguments not supported by the daemon: {', '.join(unsupported)}."
+            )
+        if _is_put_get:
+            command = _with_absolute_local_paths(command)
+        response = self._connection.client.request(
+            "execute",
+            sql=command,
+            use_dict_result=self._use_dict_result,
+            is_put_get=_is_put_get,
+            **kwargs,
+        )
+        self._load(response["cursor"])
+        return self
+
+    def execute_async(self, command: str, **kwargs) -> Dict:
+        response = self._connection.client.request("execute_async", sql=command)
+        self.query = command
+        self.sfqid = response["sfqid"]
+        return {"queryId": self.sfqid}
+
+    def get_results_from_sfqid(self, sfqid: str):
+        response = self._connection.client.request(
+            "fetch_results", sfqid=sfqid, use_dict_result=self._use_dict_result
+        )
+        self._load(response["cursor"])
+
+    def abort_query(self, sfqid: str) -> bool:
+        return self._connection.client.request("abort", sfqid=sfqid)["aborted"]
+
+    def fetchone(self):
+        return self._rows.popleft() if self._rows else None
+
+    def fetchmany(self, size: Optional[int] = None) -> List:
+        return [self._rows.popleft() for _ in range(min(size or 1, len(self._rows)))]
+
+    def fetchall(self) -> List:
+        rows = list(self._rows)
+        self._rows.clear()
+        return rows
+
+    def __iter__(self) -> Iterator:
+        while self._rows:
+            yield self._rows.popleft()
+
+    def fetch_arrow_batches(self):
+        raise NotSupportedError("Results served by the daemon are not in Arrow format.")
+
+    def close(self):
+        self._rows.clear()
+
+
+def _with_absolute_local_paths(statement: str) -> str:
+    """
+    Resolves relative local paths of PUT and GET statements against the working
+    directory of the client, which the daemon does not share.
+    """
+
+    def _absolute(match: re.Match) -> str:
+        path = match.group("path")
+        if not path.startswith("~"):
+            path = os.path.join(os.getcwd(), path)
+        return match.group("prefix") + path
+
+    return _LOCAL_FILE_URI_REGEX.sub(_absolute, statement)
+
+
+class _DaemonTelemetry:
+    """Collects telemetry events and sends them through the connection of the daemon."""
+
+    def __init__(self, client: DaemonClient):
+        self._client = client
+        self._events: List[Dict] = []
+
+    def try_add_log_to_batch(self, telemetry_data):
+        self._events.append(telemetry_data.to_dict())
+
+    def send_batch(self):
+        events, self._events = self._events, []
+        if events:
+            self._client.request("telemetry", events=events)
+
+
+class DaemonConnection:
+    """
+    Connection served by the daemon, providing the part of the SnowflakeConnection
+    interface used by the CLI. The session stays checked out of the pool of
+    the daemon until the connection is closed.
+
+    Other attributes of SnowflakeConnection (e.g. the REST client used to issue
+    tokens) are served by a direct connection, opened when they are first used.
+    """
+
+    is_still_running = staticmethod(SnowflakeConnection.is_still_running)
+    _OWN_ATTRIBUTES = {
+        "client",
+        "_telemetry",
+        "_closed",
+        "_connection_parameters",
+        "_direct_connection",
+    }
+
+    def __init__(self, client: DaemonClient, connection_parameters: Dict):
+        self.client = client
+        self._telemetry = _DaemonTelemetry(client)
+        self._closed = False
+        self._connection_parameters = connection_parameters
+        self._direct_connection: Optional[SnowflakeConnection] = None
+
+    def _get_direct_connection(self) -> SnowflakeConnection:
+        if self._direct_connection is None:
+            log.debug(
+                "Opening a direct connection for attributes not served by the daemon"
+            )
+            self._direct_connection = snowflake.connector.connect(
+                **self._connection_parameters
+            )
+        return self._direct_connection
+
+    def __getattr__(self, name: str) -> Any:
+        if name in self._OWN_ATTRIBUTES or name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self._get_direct_connection(), name)
+
+    def __setattr__(self, name: str, value: Any):
+        if name in self._OWN_ATTRIBUTES:
+            super().__setattr__(name, value)
+        else:
+            setattr(self._get_direct_connection(), name, value)
+
+    @property
+    def account(self) -> Optional[str]:
+        return self.client.session.get("account")
+
+    @property
+    def user(self) -> Optional[str]:
+        return self.client.session.get("user")
+
+    @property
+    def host(self) -> Optional[str]:
+        return self.client.session.get("host")
+
+    @property
+    def role(self) -> Optional[str]:
+        return self.client.session.get("role")
+
+    @property
+    def warehouse(self) -> Optional[str]:
+        return self.client.session.get("warehouse")
+
+    @property
+    def database(self) -> Optional[str]:
+        return self.client.session.get("database")
+
+    @property
+    def schema(self) -> Optional[str]:
+        return self.client.session.get("schema")
+
+    def cursor(self, cursor_class=SnowflakeCursor) -> DaemonCursor:
+        return DaemonCursor(self, use_dict_result=issubclass(cursor_class, DictCursor))
+
+    def execute_stream(
+        self,
+        stream: StringIO,
+        remove_comments: bool = False,
+        cursor_class=SnowflakeCursor,
+        **kwargs,
+    ) -> Iterator[DaemonCursor]:
+        for sql, is_put_or_get in split_statements(stream, remove_comments):
+            cursor = self.cursor(cursor_class=cursor_class)
+            cursor.execute(sql, _is_put_get=is_put_or_get, **kwargs)
+            yield cursor
+
+    def execute_string(
+        self,
+        sql_text: str,
+        remove_comments: bool = False,
+        return_cursors: bool = True,
+        cursor_class=SnowflakeCursor,
+        **kwargs,
+    ) -> List[DaemonCursor]:
+        cursors = list(
+            self.execute_stream(
+                StringIO(sql_text), remove_comments, cursor_class, **kwargs
+            )
+        )
+        return cursors if return_cursors else []
+
+    def get_query_status_throw_if_error(self, sfqid: str) -> QueryStatus:
+        return QueryStatus[self.client.request("query_status", sfqid=sfqid)["status"]]
+
+    def is_closed(self) -> bool:
+        return self._closed
+
+    def close(self):
+        if not self._closed:
+            self._closed = True
+            self.client.close()
+            if self._direct_connection is not None:
+                self._direct_connection.close()
+
+
+def connect_through_daemon(**connection_parameters) -> Optional[DaemonConnection]:
+    """
+    Returns a connection served by the daemon, or None if the daemon is not running.
+    Errors of opening the connection are raised as if it was opened directly.
+    """
+    client = DaemonClient.connect()
+    if client is None:
+        return None
+    try:
+        response = client.request("connect", parameters=connection_parameters)
+    except BaseException:
+        client.close()
+        raise
+    if response.get("fake_connector") and not uses_fake_connector():
+        log.warning("Not using the daemon: it does not connect to Snowflake")
+        client.close()
+        return None
+    log.debug("Using connection served by the daemon")
+    return DaemonConnection(client, connection_parameters)
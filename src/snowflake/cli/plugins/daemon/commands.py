@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import typer
+from click import ClickException
+from snowflake.cli.api.commands.snow_typer import SnowTyper
+from snowflake.cli.api.output.types import CommandResult, MessageResult, ObjectResult
+from snowflake.cli.plugins.daemon.manager import DaemonManager
+from snowflake.cli.plugins.daemon.protocol import (
+    FAKE_CONNECTOR_ENV,
+    get_socket_path,
+    uses_fake_connector,
+)
+from snowflake.cli.plugins.daemon.server import DEFAULT_IDLE_TIMEOUT_SECONDS
+
+app = SnowTyper(
+    name="daemon",
+    help="Manages the local daemon keeping connections to Snowflake open between commands.",
+)
+
+
+@app.command()
+def start(
+    idle_timeout: int = typer.Option(
+        DEFAULT_IDLE_TIMEOUT_SECONDS,
+        "--idle-timeout",
+        min=1,
+        help="Number of seconds after which unused connections are closed. The daemon "
+        "stops once it has no connections left.",
+    ),
+    foreground: bool = typer.Option(
+        False,
+        "--foreground",
+        help="Runs the daemon in the current process until it is stopped.",
+        is_flag=True,
+    ),
+    fake_connector: bool = typer.Option(
+        False,
+        "--fake-connector",
+        help="Executes statements with a fake connection, which returns every statement "
+        "as its result without connecting to Snowflake. Useful for benchmarking.",
+        is_flag=True,
+        hidden=True,
+    ),
+    **options,
+) -> CommandResult:
+    """
+    Starts the daemon. While it is running, commands use connections kept open
+    by the daemon instead of logging in to Snowflake.
+    """
+    if fake_connector and not uses_fake_connector():
+        raise ClickException(
+            f"Set {FAKE_CONNECTOR_ENV}=true to start and use the daemon with a fake connection."
+        )
+    if foreground:
+        DaemonManager().run(idle_timeout, fake_connector)
+        return MessageResult("Daemon stopped.")
+    pid = DaemonManager().start(idle_timeout, fake_connector)
+    return MessageResult(
+        f"Daemon started (pid {pid}), listening on {get_socket_path()}."
+    )
+
+
+@app.command()
+def stop(**options) -> CommandResult:
+    """
+    Stops the daemon, closing all its connections.
+    """
+    if DaemonManager().stop():
+        return MessageResult("Daemon stopped.")
+    return MessageResult("Daemon is not running.")
+
+
+@app.command()
+def status(**options) -> CommandResult:
+    """
+    Shows the status of the daemon and the number of connections it keeps open.
+    """
+    daemon_status = DaemonManager().status()
+    if daemon_status is None:
+        return MessageResult("Daemon is not running.")
+    return ObjectResult(daemon_status)
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import logging
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from click import ClickException
+from snowflake.cli.plugins.daemon.client import DaemonClient
+from snowflake.cli.plugins.daemon.protocol import get_socket_path, is_daemon_supported
+from snowflake.cli.plugins.daemon.server import run_daemon
+from snowflake.connector.config_manager import CONFIG_MANAGER
+
+log = logging.getLogger(__name__)
+
+START_TIMEOUT_SECONDS = 15
+_START_POLL_INTERVAL_SECONDS = 0.1
+
+
+class DaemonManager:
+    @staticmethod
+    def _assert_supported():
+        if not is_daemon_supported():
+            raise ClickException("The daemon is not supported on this platform.")
+
+    @staticmethod
+    def _request(action: str) -> Optional[Dict]:
+        client = DaemonClient.connect()
+        if client is None:
+            return None
+        try:
+            return client.request(action)
+        finally:
+            client.close()
+
+    def run(self, idle_timeout: int, fake_connector: bool) -> None:
+        """Runs the daemon in the current process until it is stopped."""
+        self._assert_supported()
+        try:
+            run_daemon(get_socket_path(), idle_timeout, fake_connector)
+        except KeyboardInterrupt:
+            log.info("Daemon interrupted")
+
+    def start(self, idle_timeout: int, fake_connector: bool) -> int:
+        """
+        Starts the daemon in a detached process and waits until it accepts clients.
+        Returns the process id of the daemon.
+        """
+        self._assert_supported()
+        if self.status() is not None:
+            raise ClickException("Daemon is already running.")
+
+        command = self._daemon_command(idle_timeout, fake_connector)
+        log.info("Starting daemon: %s", " ".join(command))
+        process = subprocess.Popen(
+            command,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        deadline = time.monotonic() + START_TIMEOUT_SECONDS
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                break
+            status = self.status()
+            if status is not None:
+                return status["pid"]
+            time.sleep(_START_POLL_INTERVAL_SECONDS)
+        raise ClickException(
+            "Daemon did not start. Run `snow daemon start --foreground` to see the error."
+        )
+
+    @staticmethod
+    def _daemon_command(idle_timeout: int, fake_connector: bool) -> List[str]:
+        if getattr(sys, "frozen", False):
+            executable = [sys.executable]
+        else:
+            executable = [sys.executable, "-m", "snowflake.cli.app"]
+        return [
+            *executable,
+            "--config-file",
+            str(CONFIG_MANAGER.file_path),
+            "daemon",
+            "start",
+            "--foreground",
+            "--idle-timeout",
+            str(idle_timeout),
+            *(["--fake-connector"] if fake_connector else []),
+        ]
+
+    def stop(self) -> bool:
+        """Stops the daemon. Returns False if it was not running."""
+        return self._request("shutdown") is not None
+
+    def status(self) -> Optional[Dict]:
+        """Returns the status of the daemon, or None if it is not running."""
+        status = self._request("ping")
+        if status is None:
+            return None
+        return {
+            "pid": status["pid"],
+            "socket": str(get_socket_path()),
+            "started": datetime.fromtimestamp(status["started"]),
+            "idle_timeout": status["idle_timeout"],
+            "fake_connector": status["fake_connector"],
+            "profiles": status["profiles"],
+            "idle_connections": status["idle_connections"],
+            "connections_in_use": status["connections_in_use"],
+        }
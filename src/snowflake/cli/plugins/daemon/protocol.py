@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import base64
+import json
+import os
+import socket
+from datetime import date, datetime, time
+from decimal import Decimal
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+from click import ClickException
+from snowflake.cli.api.secure_utils import file_permissions_are_strict
+from snowflake.connector.compat import IS_WINDOWS
+from snowflake.connector.config_manager import CONFIG_MANAGER
+
+SOCKET_FILE_NAME = "snow.sock"
+FAKE_CONNECTOR_SOCKET_FILE_NAME = "snow-fake.sock"
+# opts in to using a daemon serving statements with a fake connection
+FAKE_CONNECTOR_ENV = "SNOWFLAKE_CLI_DAEMON_FAKE_CONNECTOR"
+
+_TYPE_KEY = "$type"
+_VALUE_KEY = "value"
+
+
+class DaemonDirectoryNotSecureError(ClickException):
+    def __init__(self, path: Path):
+        super().__init__(
+            f"Directory {path} must be owned by the current user and not accessible "
+            "by other users."
+        )
+
+
+def is_daemon_supported() -> bool:
+    return not IS_WINDOWS and hasattr(socket, "AF_UNIX")
+
+
+def get_daemon_directory() -> Path:
+    return CONFIG_MANAGER.file_path.parent / "daemon"
+
+
+def uses_fake_connector() -> bool:
+    return os.environ.get(FAKE_CONNECTOR_ENV, "").lower() in ("1", "true", "yes")
+
+
+def get_socket_path() -> Path:
+    """
+    A daemon with a fake connection listens on its own socket, used only by clients
+    opting in to it, so that commands never report success without reaching Snowflake.
+    """
+    if uses_fake_connector():
+        return get_daemon_directory() / FAKE_CONNECTOR_SOCKET_FILE_NAME
+    return get_daemon_directory() / SOCKET_FILE_NAME
+
+
+def assert_directory_is_secure(path: Path) -> None:
+    """
+    The socket gives access to authenticated connections, so only the user running
+    the daemon may be able to reach it.
+    """
+    if path.stat().st_uid != os.getuid() or not file_permissions_are_strict(path):
+        raise DaemonDirectoryNotSecureError(path)
+
+
+def _encode_value(value):
+    if isinstance(value, datetime):
+        return {_TYPE_KEY: "datetime", _VALUE_KEY: value.isoformat()}
+    if isinstance(value, date):
+        return {_TYPE_KEY: "date", _VALUE_KEY: value.isoformat()}
+    if isinstance(value, time):
+        return {_TYPE_KEY: "time", _VALUE_KEY: value.isoformat()}
+    if isinstance(value, Decimal):
+        return {_TYPE_KEY: "decimal", _VALUE_KEY: str(value)}
+    if isinstance(value, (bytes, bytearray)):
+        return {_TYPE_KEY: "bytes", _VALUE_KEY: base64.b64encode(value).decode()}
+    raise TypeError(f"Value of type {type(value).__name__} cannot be sent")
+
+
+_DECODERS = {
+    "datetime": datetime.fromisoformat,
+    "date": date.fromisoformat,
+    "time": time.fromisoformat,
+    "decimal": Decimal,
+    "bytes": base64.b64decode,
+}
+
+
+def _decode_value(obj: dict):
+    if obj.keys() == {_TYPE_KEY, _VALUE_KEY} and obj[_TYPE_KEY] in _DECODERS:
+        return _DECODERS[obj[_TYPE_KEY]](obj[_VALUE_KEY])
+    return obj
+
+
+def send_message(stream: BinaryIO, message: dict) -> None:
+    """Messages are JSON documents, one per line."""
+    stream.write(json.dumps(message, default=_encode_value).encode() + b"\n")
+    stream.flush()
+
+
+def receive_message(stream: BinaryIO) -> Optional[dict]:
+    """Returns the next message, or None if the other side closed the socket."""
+    line = stream.readline()
+    if not line:
+        return None
+    return json.loads(line, object_hook=_decode_value)
@@ -0,0 +1,509 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import signal
+import socket
+import socketserver
+import struct
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import snowflake.connector
+from click import ClickException
+from snowflake.cli.api.secure_path import SecurePath
+from snowflake.cli.api.session_state import SessionState
+from snowflake.cli.plugins.daemon.protocol import (
+    assert_directory_is_secure,
+    receive_message,
+    send_message,
+)
+from snowflake.connector import SnowflakeConnection
+from snowflake.connector.constants import QueryStatus
+from snowflake.connector.cursor import DictCursor, ResultMetadata, SnowflakeCursor
+from snowflake.connector.errors import Error
+from snowflake.connector.telemetry import TelemetryData
+
+log = logging.getLogger(__name__)
+
+DEFAULT_IDLE_TIMEOUT_SECONDS = 3600
+MAX_IDLE_CONNECTIONS_PER_PROFILE = 8
+
+_LEADING_COMMENTS_REGEX = re.compile(r"^(?:\s+|--[^\n]*(?:\n|$)|/\*.*?\*/)*", re.DOTALL)
+# statements after which the session differs from a freshly opened one
+_SESSION_CHANGING_STATEMENT_REGEX = re.compile(
+    r"(?:use|call|execute|begin|start\s+transaction|declare|set|unset|alter\s+session"
+    r"|create\s+(?:or\s+replace\s+)?(?:(?:local|global)\s+)?(?:temp|temporary|volatile)"
+    r"|(?:create|drop|undrop)\s+(?:or\s+replace\s+)?(?:transient\s+)?(?:database|schema))\b",
+    re.IGNORECASE,
+)
+# parameters which do not decide which session is opened
+_PROFILE_INDEPENDENT_PARAMETERS = {"application"}
+
+
+def changes_session(statement: str) -> bool:
+    statement = _LEADING_COMMENTS_REGEX.sub("", statement, count=1)
+    return bool(_SESSION_CHANGING_STATEMENT_REGEX.match(statement))
+
+
+def get_profile_key(parameters: Dict) -> str:
+    """
+    Identifies the connection profile by all parameters of the connection, so that
+    connections are shared only by clients that would have opened the same one.
+    The key is a digest, so that it does not reveal the secrets among them.
+    """
+    profile = {
+        key: value
+        for key, value in parameters.items()
+        if key not in _PROFILE_INDEPENDENT_PARAMETERS
+    }
+    serialized = json.dumps(profile, sort_keys=True, default=repr)
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+
+class FakeCursor:
+    """
+    Cursor of FakeConnection. Every statement returns a single row containing
+    the statement itself.
+    """
+
+    def __init__(self, connection: FakeConnection, use_dict_result: bool):
+        self._connection = connection
+        self._use_dict_result = use_dict_result
+        self._rows: List = []
+        self.description: Optional[List[ResultMetadata]] = None
+        self.query: Optional[str] = None
+        self.sfqid: Optional[str] = None
+        self.rowcount: Optional[int] = None
+
+    def execute(self, command: str, **kwargs):
+        self.query = command
+        self.sfqid = str(uuid.uuid4())
+        self.description = [
+            ResultMetadata("STATEMENT", 2, None, None, None, None, False)
+        ]
+        row = {"STATEMENT": command} if self._use_dict_result else (command,)
+        self._rows = [row]
+        self.rowcount = 1
+        self._connection.session_state.observe(command)
+        return self
+
+    def execute_async(self, command: str, **kwargs):
+        self.execute(command)
+        self._connection.results[self.sfqid] = command
+        return {"queryId": self.sfqid}
+
+    def get_results_from_sfqid(self, sfqid: str):
+        self.execute(self._connection.results[sfqid])
+        self.sfqid = sfqid
+
+    def abort_query(self, sfqid: str) -> bool:
+        return self._connection.results.pop(sfqid, None) is not None
+
+    def fetchall(self) -> List:
+        rows, self._rows = self._rows, []
+        return rows
+
+
+class FakeConnection:
+    """
+    Stands in for a Snowflake connection in the fake connector mode, in which
+    the daemon can be exercised and benchmarked without connecting to Snowflake.
+    """
+
+    def __init__(self, **parameters):
+        self._parameters = parameters
+        self.account = parameters.get("account", "fake_account")
+        self.user = parameters.get("user", "fake_user")
+        self.host = parameters.get("host", f"{self.account}.snowflakecomputing.com")
+        self.session_state = SessionState()
+        self.results: Dict[str, str] = {}
+        self._telemetry = None
+
+    def _context_value(self, name: str) -> Optional[str]:
+        return getattr(self.session_state, name) or self._parameters.get(name)
+
+    @property
+    def role(self) -> Optional[str]:
+        return self._context_value("role")
+
+    @property
+    def warehouse(self) -> Optional[str]:
+        return self._context_value("warehouse")
+
+    @property
+    def database(self) -> Optional[str]:
+        return self._context_value("database")
+
+    @property
+    def schema(self) -> Optional[str]:
+        return self._context_value("schema")
+
+    def cursor(self, cursor_class=SnowflakeCursor) -> FakeCursor:
+        return FakeCursor(self, use_dict_result=issubclass(cursor_class, DictCursor))
+
+    def get_query_status_throw_if_error(self, sfqid: str) -> QueryStatus:
+        return QueryStatus.SUCCESS
+
+    def close(self):
+        pass
+
+
+class ConnectionPool:
+    """
+    Authenticated connections which are not used by any client, grouped by the
+    connection profile they were opened for. Connections idle for longer than
+    the idle timeout are closed by expire().
+    """
+
+    def __init__(
+        self, connect: Callable[..., SnowflakeConnection], idle_timeout: float
+    ):
+        self._connect = connect
+        self._idle_timeout = idle_timeout
+        self._idle: Dict[str, List[Tuple[float, SnowflakeConnection]]] = {}
+        self._in_use: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, profile: str, parameters: Dict) -> SnowflakeConnection:
+        with self._lock:
+            self._in_use[profile] = self._in_use.get(profile, 0) + 1
+            if profile in self._idle:
+                idle = self._idle[profile]
+                _, connection = idle.pop()
+                if not idle:
+                    del self._idle[profile]
+                return connection
+        try:
+            log.info("Opening connection for profile %s", profile[:8])
+            return self._connect(**parameters)
+        except BaseException:
+            self._release_slot(profile)
+            raise
+
+    def release(self, profile: str, connection: SnowflakeConnection, reuse: bool):
+        """Returns the connection to the pool, or closes it if it cannot be reused."""
+        with self._lock:
+            idle_count = len(self._idle.get(profile, []))
+            if reuse and idle_count < MAX_IDLE_CONNECTIONS_PER_PROFILE:
+                entry = (time.monotonic(), connection)
+                self._idle.setdefault(profile, []).append(entry)
+                connection = None
+        self._release_slot(profile)
+        if connection is not None:
+            _close_quietly(connection)
+
+    def _release_slot(self, profile: str):
+        with self._lock:
+            self._in_use[profile] -= 1
+            if not self._in_use[profile]:
+                del self._in_use[profile]
+
+    def expire(self) -> None:
+        deadline = time.monotonic() - self._idle_timeout
+        with self._lock:
+            expired = [
+                connection
+                for idle in self._idle.values()
+                for last_used, connection in idle
+                if last_used < deadline
+            ]
+            self._idle = {
+                profile: kept
+                for profile, idle in self._idle.items()
+                if (kept := [entry for entry in idle if entry[0] >= deadline])
+            }
+        for connection in expired:
+            _close_quietly(connection)
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for entries in idle.values():
+            for _, connection in entries:
+                _close_quietly(connection)
+
+    def is_empty(self) -> bool:
+        with self._lock:
+            return not self._idle and not self._in_use
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "profiles": len(self._idle.keys() | self._in_use.keys()),
+                "idle_connections": sum(len(idle) for idle in self._idle.values()),
+                "connections_in_use": sum(self._in_use.values()),
+            }
+
+
+def _close_quietly(connection: SnowflakeConnection):
+    try:
+        connection.close()
+    except Exception as err:
+        log.warning("Failed to close connection: %s", err)
+
+
+def _session_info(connection: SnowflakeConnection) -> Dict:
+    return {
+        attribute: getattr(connection, attribute, None)
+        for attribute in (
+            "account",
+            "user",
+            "host",
+            "role",
+            "warehouse",
+            "database",
+            "schema",
+        )
+    }
+
+
+def _cursor_info(cursor: SnowflakeCursor) -> Dict:
+    description = cursor.description
+    return {
+        "description": [list(column) for column in description or []],
+        "rows": cursor.fetchall() if description else [],
+        "sfqid": cursor.sfqid,
+        "query": cursor.query,
+        "rowcount": cursor.rowcount,
+    }
+
+
+def _error_info(err: Exception) -> Dict:
+    if isinstance(err, Error):
+        return {
+            "type": type(err).__name__,
+            "msg": err.raw_msg,
+            "errno": err.errno,
+            "sqlstate": err.sqlstate,
+            "sfqid": err.sfqid,
+        }
+    return {"type": None, "msg": str(err)}
+
+
+class _SessionHandler(socketserver.StreamRequestHandler):
+    """
+    Serves a single client. The connection checked out from the pool is used
+    exclusively by the client until it disconnects.
+    """
+
+    server: DaemonServer
+
+    def setup(self):
+        super().setup()
+        self._profile: Optional[str] = None
+        self._connection: Optional[SnowflakeConnection] = None
+        self._reusable = True
+
+    def handle(self):
+        if not self.server.is_peer_trusted(self.request):
+            log.warning("Rejected client of another user")
+            return
+        self.server.touch()
+        try:
+            while (request := receive_message(self.rfile)) is not None:
+                try:
+                    response = self._dispatch(request)
+                except Exception as err:
+                    response = {"error": _error_info(err)}
+                if self._connection is not None:
+                    response["session"] = _session_info(self._connection)
+                send_message(self.wfile, response)
+        except (ConnectionError, ValueError) as err:
+            log.debug("Client disconnected: %s", err)
+        finally:
+            if self._connection is not None:
+                self.server.pool.release(
+                    self._profile, self._connection, reuse=self._reusable
+                )
+            self.server.touch()
+
+    def _dispatch(self, request: Dict) -> Dict:
+        action = request.pop("action", None)
+        if action == "ping":
+            return self.server.status()
+        if action == "shutdown":
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+            return {}
+        if action == "connect":
+            return self._connect(**request)
+        if self._connection is None:
+            raise ClickException("Not connected.")
+        if action == "execute":
+            return self._execute(**request)
+        if action == "execute_async":
+            cursor = self._connection.cursor()
+            cursor.execute_async(request["sql"])
+            self._observe(request["sql"])
+            return {"sfqid": cursor.sfqid}
+        if action == "query_status":
+            status = self._connection.get_query_status_throw_if_error(request["sfqid"])
+            return {"status": status.name}
+        if action == "fetch_results":
+            cursor = self._cursor(request.get("use_dict_result", False))
+            cursor.get_results_from_sfqid(request["sfqid"])
+            return {"cursor": _cursor_info(cursor)}
+        if action == "abort":
+            return {"aborted": self._connection.cursor().abort_query(request["sfqid"])}
+        if action == "telemetry":
+            return self._add_telemetry(request["events"])
+        raise ClickException(f"Unknown action: {action}")
+
+    def _connect(self, parameters: Dict) -> Dict:
+        if self._connection is not None:
+            raise ClickException("Already connected.")
+        self._profile = get_profile_key(parameters)
+        self._connection = self.server.pool.acquire(self._profile, parameters)
+        return {"fake_connector": self.server.fake_connector}
+
+    def _cursor(self, use_dict_result: bool) -> SnowflakeCursor:
+        return self._connection.cursor(
+            DictCursor if use_dict_result else SnowflakeCursor
+        )
+
+    def _execute(
+        self,
+        sql: str,
+        use_dict_result: bool = False,
+        is_put_get: Optional[bool] = None,
+        **kwargs,
+    ) -> Dict:
+        # local paths of file transfers are made absolute by the client
+        cursor = self._cursor(use_dict_result)
+        cursor.execute(sql, _is_put_get=is_put_get, **kwargs)
+        self._observe(sql)
+        return {"cursor": _cursor_info(cursor)}
+
+    def _observe(self, sql: str):
+        if changes_session(sql):
+            self._reusable = False
+
+    def _add_telemetry(self, events: List[Dict]) -> Dict:
+        telemetry = getattr(self._connection, "_telemetry", None)
+        if telemetry:
+            for event in events:
+                telemetry.try_add_log_to_batch(
+                    TelemetryData(event["message"], event["timestamp"])
+                )
+            telemetry.send_batch()
+        return {}
+
+
+class DaemonServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path, idle_timeout: float, fake_connector: bool):
+        self.pool = ConnectionPool(
+            connect=FakeConnection if fake_connector else snowflake.connector.connect,
+            idle_timeout=idle_timeout,
+        )
+        self._idle_timeout = idle_timeout
+        self.fake_connector = fake_connector
+        self._started = time.time()
+        self._last_activity = time.monotonic()
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        # the socket is created accessible only by its owner
+        old_umask = os.umask(0o177)
+        try:
+            super().__init__(str(socket_path), _SessionHandler)
+        finally:
+            os.umask(old_umask)
+
+    @staticmethod
+    def is_peer_trusted(connection: socket.socket) -> bool:
+        if not hasattr(socket, "SO_PEERCRED"):
+            # the permissions of the socket are the only protection
+            return True
+        credentials = connection.getsockopt(
+            socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i")
+        )
+        _, uid, _ = struct.unpack("3i", credentials)
+        return uid == os.getuid()
+
+    def touch(self):
+        with self._lock:
+            self._last_activity = time.monotonic()
+
+    def status(self) -> Dict:
+        return {
+            "pid": os.getpid(),
+            "started": self._started,
+            "idle_timeout": self._idle_timeout,
+            "fake_connector": self.fake_connector,
+            **self.pool.stats(),
+        }
+
+    def expire(self):
+        """
+        Closes connections which were idle for longer than the idle timeout,
+        and stops the daemon once it has nothing left to serve.
+        """
+        self.pool.expire()
+        with self._lock:
+            idle_for = time.monotonic() - self._last_activity
+        if idle_for > self._idle_timeout and self.pool.is_empty():
+            log.info("Stopping after being idle for %d seconds", idle_for)
+            self.shutdown()
+
+    def _expire_periodically(self):
+        interval = min(self._idle_timeout / 2, 30)
+        while not self._stopped.wait(interval):
+            self.expire()
+
+    def serve(self):
+        reaper = threading.Thread(target=self._expire_periodically, daemon=True)
+        reaper.start()
+        try:
+            self.serve_forever(poll_interval=0.2)
+        finally:
+            self._stopped.set()
+            self.pool.close()
+
+
+def run_daemon(
+    socket_path: Path, idle_timeout: float, fake_connector: bool = False
+) -> None:
+    """Serves connections over the socket until stopped or idle for too long."""
+    directory = SecurePath(socket_path.parent)
+    directory.mkdir(parents=True, exist_ok=True)
+    directory.chmod(0o700)
+    assert_directory_is_secure(directory.path)
+    _remove_stale_socket(socket_path)
+
+    server = DaemonServer(socket_path, idle_timeout, fake_connector)
+    _stop_on_signal(server)
+    log.info("Listening on %s", socket_path)
+    try:
+        server.serve()
+    finally:
+        server.server_close()
+        socket_path.unlink(missing_ok=True)
+
+
+def _remove_stale_socket(socket_path: Path) -> None:
+    if not socket_path.exists():
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(str(socket_path))
+        except OSError:
+            socket_path.unlink()
+            return
+    raise ClickException(f"Daemon is already listening on {socket_path}.")
+
+
+def _stop_on_signal(server: DaemonServer) -> None:
+    if threading.current_thread() is not threading.main_thread():
+        return
+
+    def _handler(signum, frame):
+        threading.Thread(target=server.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGTERM, _handler)
@@ -5,6 +5,7 @@ from typing import List, Optional
 import typer
 from click import ClickException
 from snowflake.cli.api.commands.flags import (
+    ExecuteParallelOption,
     OnErrorOption,
     PatternOption,
     VariablesOption,
@@ -246,6 +247,7 @@ def execute(
     repository_path: str = RepoPathArgument,
     on_error: OnErrorType = OnErrorOption,
     variables: Optional[List[str]] = VariablesOption,
+    parallel: int = ExecuteParallelOption,
     **options,
 ):
     """
@@ -254,6 +256,9 @@ def execute(
     extension will be executed.
     """
     results = GitManager().execute(
-        stage_path=repository_path, on_error=on_error, variables=variables
+        stage_path=repository_path,
+        on_error=on_error,
+        variables=variables,
+        parallel=parallel,
     )
     return CollectionResult(results)
@@ -1,13 +1,30 @@
+import fnmatch
+import hashlib
 import os
-from dataclasses import dataclass
-from pathlib import Path
-from typing import List, Optional, Tuple, Union
+import re
+import shutil
+from dataclasses import asdict, dataclass
+from pathlib import Path, PurePath
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from click import ClickException
+from snowflake.cli.api.config import get_cache_dir
 from snowflake.cli.api.constants import DEFAULT_SIZE_LIMIT_MB
-from snowflake.cli.api.project.schemas.native_app.path_mapping import PathMapping
 from snowflake.cli.api.secure_path import SecurePath
-from yaml import safe_load
+from snowflake.cli.api.utils.cache_files import read_cache_file, write_cache_file
+from snowflake.cli.plugins.stage.diff import CHECKSUM_CACHE_FILENAME
+
+BUNDLE_MANIFEST_VERSION = 1
 
 
 class DeployRootError(ClickException):
@@ -153,6 +170,9 @@ def translate_artifact(item: Union[dict, str]) -> ArtifactMapping:
     Builds an artifact mapping from a project definition value.
     Validation is done later when we actually resolve files / folders.
     """
+    from snowflake.cli.api.project.schemas.native_app.path_mapping import (
+        PathMapping,
+    )
 
     if isinstance(item, PathMapping):
         return ArtifactMapping(item.src, item.dest if item.dest else item.src)
@@ -164,17 +184,156 @@ def translate_artifact(item: Union[dict, str]) -> ArtifactMapping:
     raise ArtifactError("Item is not a valid artifact!")
 
 
-def get_source_paths(artifact: ArtifactMapping, project_root: Path) -> List[Path]:
+class _IndexEntry(NamedTuple):
+    name: str
+    is_dir: bool
+    "Is this a directory, or a symlink to one?"
+    is_real_dir: bool
+    "Is this a directory, and not a symlink to one?"
+
+
+class ProjectFileIndex:
+    """
+    In-memory listing of a project directory, used to expand the globs of many
+    artifacts without walking the same directories again for each of them.
+    Each directory is listed at most once, when a glob first needs it, and
+    directories inside ignored paths are never listed.
+
+    Globs are expanded the same way Path.glob() does it. Listings are validated
+    against the mtime of their directory by invalidate_stale(), so that a
+    long-lived index can pick up added, removed or renamed files.
+    """
+
+    def __init__(self, root: Path, ignored: Iterable[Path] = ()):
+        self._root = root
+        self._ignored = {resolve_without_follow(path) for path in ignored}
+        self._ignored_ancestors = {
+            parent for path in self._ignored for parent in path.parents
+        }
+        self._listings: Dict[Path, Tuple[int, List[_IndexEntry]]] = {}
+        self._match_flags = re.IGNORECASE if os.name == "nt" else 0
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    def is_ignored(self, path: Path) -> bool:
+        resolved = resolve_without_follow(path)
+        return resolved in self._ignored or not self._ignored.isdisjoint(
+            resolved.parents
+        )
+
+    def _list(self, directory: Path) -> List[_IndexEntry]:
+        if directory not in self._listings:
+            try:
+                mtime_ns = directory.stat().st_mtime_ns
+                may_contain_ignored = (
+                    resolve_without_follow(directory) in self._ignored_ancestors
+                )
+                with os.scandir(directory) as it:
+                    entries = [
+                        _IndexEntry(
+                            entry.name,
+                            entry.is_dir(),
+                            entry.is_dir(follow_symlinks=False),
+                        )
+                        for entry in it
+                        if not (
+                            may_contain_ignored
+                            and self.is_ignored(directory / entry.name)
+                        )
+                    ]
+            except (FileNotFoundError, NotADirectoryError, PermissionError):
+                mtime_ns, entries = -1, []
+            self._listings[directory] = (mtime_ns, entries)
+        return self._listings[directory][1]
+
+    def invalidate_stale(self) -> List[Path]:
+        """
+        Drops the listings of directories that changed since they were listed,
+        and returns those directories.
+        """
+        stale = []
+        for directory, (mtime_ns, _) in list(self._listings.items()):
+            try:
+                current_mtime_ns = directory.stat().st_mtime_ns
+            except OSError:
+                current_mtime_ns = -1
+            if current_mtime_ns != mtime_ns:
+                del self._listings[directory]
+                stale.append(directory)
+        return stale
+
+    def glob(self, pattern: str) -> List[Path]:
+        """
+        Returns the paths under the project root matching the given relative pattern.
+        """
+        pattern_path = PurePath(pattern)
+        if pattern_path.anchor:
+            raise NotImplementedError("Non-relative patterns are unsupported")
+        if not self._root.is_dir() or self.is_ignored(self._root):
+            return []
+        return list(self._select(self._root, pattern_path.parts))
+
+    def _select(self, parent: Path, parts: Tuple[str, ...]) -> Iterator[Path]:
+        if not parts:
+            yield parent
+            return
+
+        pattern, child_parts = parts[0], parts[1:]
+        dir_only = bool(child_parts)
+        if pattern == "**":
+            yielded: Set[Path] = set()
+            for start in self._iterate_directories(parent):
+                for path in self._select(start, child_parts):
+                    if path not in yielded:
+                        yielded.add(path)
+                        yield path
+        elif "**" in pattern:
+            raise ValueError(
+                "Invalid pattern: '**' can only be an entire path component"
+            )
+        elif glob_has_magic(pattern):
+            match = re.compile(fnmatch.translate(pattern), self._match_flags).match
+            for entry in self._list(parent):
+                if (entry.is_dir or not dir_only) and match(entry.name):
+                    yield from self._select(parent / entry.name, child_parts)
+        else:
+            path = parent / pattern
+            if not self.is_ignored(path) and (
+                path.is_dir() if dir_only else path.exists()
+            ):
+                yield from self._select(path, child_parts)
+
+    def _iterate_directories(self, parent: Path) -> Iterator[Path]:
+        yield parent
+        for entry in self._list(parent):
+            if entry.is_real_dir:
+                yield from self._iterate_directories(parent / entry.name)
+
+
+def glob_has_magic(s: str) -> bool:
+    return any(c in s for c in "*?[")
+
+
+def get_source_paths(
+    artifact: ArtifactMapping,
+    project_root: Path,
+    file_index: Optional[ProjectFileIndex] = None,
+) -> List[Path]:
     """
     Expands globs, ensuring at least one file exists that matches artifact.src.
     Returns a list of paths that resolve to actual files in the project root dir structure.
     If a glob does not specify a directory (i.e. does not end with a path separator)
-
+    If a file index is provided, globs are expanded with it instead of the filesystem.
     """
     source_paths: List[Path]
 
     if is_glob(artifact.src):
-        source_paths = list(project_root.glob(artifact.src))
+        if file_index:
+            source_paths = file_index.glob(artifact.src)
+        else:
+            source_paths = list(project_root.glob(artifact.src))
         if not source_paths:
             raise GlobMatchedNothingError(artifact.src)
     else:
@@ -194,32 +353,111 @@ def resolve_without_follow(path: Path) -> Path:
     return Path(os.path.abspath(path))
 
 
-def build_bundle(
-    project_root: Path, deploy_root: Path, artifacts: List[ArtifactMapping]
-):
+def stamp_copy(path: Path) -> Optional[str]:
     """
-    Prepares a local folder (deploy_root) with configured app artifacts.
-    This folder can then be uploaded to a stage.
+    Describes sizes and modification times of a file, or of all files in a directory,
+    following symlinks. Returns None if the path does not exist.
     """
-    resolved_root = deploy_root.resolve()
-    if resolved_root.exists() and not resolved_root.is_dir():
-        raise DeployRootError(
-            f"Deploy root {resolved_root} exists, but is not a directory!"
-        )
+    try:
+        if not path.is_dir():
+            stat = path.stat()
+            return f"{stat.st_size}:{stat.st_mtime_ns}"
+        digest = hashlib.sha256()
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for name in sorted(files):
+                file = Path(root, name)
+                stat = file.stat()
+                digest.update(
+                    f"{file.relative_to(path)}:{stat.st_size}:{stat.st_mtime_ns}\n".encode()
+                )
+        return digest.hexdigest()
+    except OSError:
+        return None
 
-    if project_root.resolve() not in resolved_root.parents:
-        raise DeployRootError(
-            f"Deploy root {resolved_root} is not a descendent of the project directory!"
-        )
 
-    # users may have removed files or entire artifact mappings from their project
-    # definition since the last time we bundled; we need to clear the deploy root first
-    if resolved_root.exists():
-        delete(resolved_root)
+@dataclass
+class BundleEntry:
+    source: str
+    copy_stamps: Optional[List[Optional[str]]] = None
+    "Stamps of the source and of the copy, or None if the entry is a symlink"
+
+
+def get_bundle_manifest_path(deploy_root: Path) -> Path:
+    name = hashlib.sha256(str(deploy_root).encode()).hexdigest()
+    return get_cache_dir() / "bundles" / f"{name}.json"
 
+
+def load_bundle_manifest(deploy_root: Path) -> Dict[Path, BundleEntry]:
+    """
+    Returns the entries produced by the last bundle of the deploy root, keyed by
+    their destination paths, or an empty dict if they are unknown.
+    """
+    data = read_cache_file(get_bundle_manifest_path(deploy_root))
+    if data is None or data.get("manifest_version") != BUNDLE_MANIFEST_VERSION:
+        return {}
+    try:
+        return {
+            deploy_root / dest: BundleEntry(**entry)
+            for dest, entry in data["entries"].items()
+        }
+    except (KeyError, TypeError, AttributeError):
+        return {}
+
+
+def save_bundle_manifest(deploy_root: Path, manifest: Dict[Path, BundleEntry]) -> None:
+    data = {
+        "manifest_version": BUNDLE_MANIFEST_VERSION,
+        "entries": {
+            str(dest.relative_to(deploy_root)): asdict(entry)
+            for dest, entry in manifest.items()
+        },
+    }
+    write_cache_file(get_bundle_manifest_path(deploy_root), data)
+
+
+def is_up_to_date(dest: Path, src: Path, entry: Optional[BundleEntry]) -> bool:
+    """
+    Was dest produced from src by the last bundle, with no changes to src or dest since?
+    Symlinks are trusted to point at the recorded source, while copied files and
+    directories are compared with the stamps taken when they were copied.
+    """
+    if entry is None or entry.source != str(src):
+        return False
+    if entry.copy_stamps is None:
+        return dest.is_symlink()
+    return not dest.is_symlink() and entry.copy_stamps == [
+        stamp_copy(src),
+        stamp_copy(dest),
+    ]
+
+
+def _create_bundle_entry(src: Path, dest: Path) -> BundleEntry:
+    symlink_or_copy(src, dest)
+    if dest.is_symlink():
+        return BundleEntry(source=str(src))
+    return BundleEntry(source=str(src), copy_stamps=[stamp_copy(src), stamp_copy(dest)])
+
+
+def resolve_bundle(
+    project_root: Path,
+    resolved_root: Path,
+    artifacts: List[ArtifactMapping],
+    file_index: Optional[ProjectFileIndex] = None,
+) -> Dict[Path, Path]:
+    """
+    Returns the desired contents of the deploy root, as a mapping of
+    destination paths to the source paths they should be linked to.
+    Globs are expanded with the given file index, or with a new one
+    that ignores the deploy root.
+    """
+    if file_index is None:
+        file_index = ProjectFileIndex(project_root, ignored=[resolved_root])
+
+    bundle: Dict[Path, Path] = {}
     for artifact in artifacts:
         dest_path = resolve_without_follow(Path(resolved_root, artifact.dest))
-        source_paths = get_source_paths(artifact, project_root)
+        source_paths = get_source_paths(artifact, project_root, file_index)
 
         if specifies_directory(artifact.dest):
             # make sure we are only modifying files / directories inside the deploy root
@@ -228,7 +466,7 @@ def build_bundle(
 
             # copy all files as children of the given destination path
             for source_path in source_paths:
-                symlink_or_copy(source_path, dest_path / source_path.name)
+                bundle[dest_path / source_path.name] = source_path
         else:
             # ensure we are copying into the deploy root, not replacing it!
             if resolved_root not in dest_path.parents:
@@ -236,11 +474,95 @@ def build_bundle(
 
             if len(source_paths) == 1:
                 # copy a single file as the given destination path
-                symlink_or_copy(source_paths[0], dest_path)
+                bundle[dest_path] = source_paths[0]
             else:
                 # refuse to map multiple source files to one destination (undefined behaviour)
                 raise TooManyFilesError(dest_path)
 
+    return bundle
+
+
+def _prune_deploy_root(
+    directory: Path,
+    bundle: Dict[Path, Path],
+    bundle_directories: Set[Path],
+    manifest: Dict[Path, BundleEntry],
+    up_to_date: Set[Path],
+) -> None:
+    """
+    Removes everything under the given directory that is not an up-to-date part of
+    the bundle, adding the paths that can be kept as they are to up_to_date.
+    Paths that are already in up_to_date are kept as well.
+    """
+    with os.scandir(directory) as it:
+        entries = list(it)
+
+    for entry in entries:
+        path = directory / entry.name
+        if path in up_to_date:
+            continue
+        if path in bundle and is_up_to_date(path, bundle[path], manifest.get(path)):
+            up_to_date.add(path)
+        elif path in bundle_directories and entry.is_dir(follow_symlinks=False):
+            _prune_deploy_root(path, bundle, bundle_directories, manifest, up_to_date)
+        elif entry.is_symlink() or not entry.is_dir():
+            path.unlink()
+        else:
+            shutil.rmtree(path)
+
+
+def build_bundle(
+    project_root: Path,
+    deploy_root: Path,
+    artifacts: List[ArtifactMapping],
+    file_index: Optional[ProjectFileIndex] = None,
+):
+    """
+    Prepares a local folder (deploy_root) with configured app artifacts.
+    This folder can then be uploaded to a stage.
+    The existing contents of the deploy root are reused, so only the entries
+    that were added, removed, retargeted or changed since the last bundle, which
+    are recorded in a manifest in the cache directory, are touched.
+    All artifact globs are expanded with a single index of the project directory,
+    which never includes the deploy root itself.
+    """
+    resolved_root = deploy_root.resolve()
+    if resolved_root.exists() and not resolved_root.is_dir():
+        raise DeployRootError(
+            f"Deploy root {resolved_root} exists, but is not a directory!"
+        )
+
+    if project_root.resolve() not in resolved_root.parents:
+        raise DeployRootError(
+            f"Deploy root {resolved_root} is not a descendent of the project directory!"
+        )
+
+    bundle = resolve_bundle(project_root, resolved_root, artifacts, file_index)
+
+    # users may have removed files or entire artifact mappings from their project
+    # definition since the last time we bundled; we need to clear those from the deploy
+    # root. The cached checksums are kept, as they are validated against the files themselves.
+    manifest = load_bundle_manifest(resolved_root)
+    up_to_date: Set[Path] = {resolved_root / CHECKSUM_CACHE_FILENAME}
+    if resolved_root.exists():
+        bundle_directories = {
+            parent
+            for dest_path in bundle
+            for parent in dest_path.parents
+            if resolved_root in parent.parents
+        }
+        _prune_deploy_root(
+            resolved_root, bundle, bundle_directories, manifest, up_to_date
+        )
+
+    new_manifest: Dict[Path, BundleEntry] = {}
+    for dest_path, source_path in bundle.items():
+        if dest_path in up_to_date:
+            new_manifest[dest_path] = manifest[dest_path]
+        else:
+            new_manifest[dest_path] = _create_bundle_entry(source_path, dest_path)
+    save_bundle_manifest(resolved_root, new_manifest)
+
 
 def find_manifest_file(deploy_root: Path) -> Path:
     """
@@ -267,6 +589,8 @@ def find_version_info_in_manifest_file(
     name_field = "name"
     patch_field = "patch"
 
+    from yaml import safe_load
+
     manifest_file = find_manifest_file(deploy_root)
     with SecurePath(manifest_file).open(
         "r", read_file_limit_mb=DEFAULT_SIZE_LIMIT_MB
@@ -13,7 +13,11 @@ from snowflake.cli.api.output.types import (
     MessageResult,
 )
 from snowflake.cli.api.secure_path import SecurePath
-from snowflake.cli.plugins.nativeapp.common_flags import ForceOption, InteractiveOption
+from snowflake.cli.plugins.nativeapp.common_flags import (
+    ForceOption,
+    InteractiveOption,
+    NoChecksumCacheOption,
+)
 from snowflake.cli.plugins.nativeapp.init import (
     OFFICIAL_TEMPLATES_GITHUB_URL,
     nativeapp_init,
@@ -34,6 +38,7 @@ from snowflake.cli.plugins.nativeapp.utils import (
     shallow_git_clone,
 )
 from snowflake.cli.plugins.nativeapp.version.commands import app as versions_app
+from snowflake.cli.plugins.nativeapp.watch_processor import NativeAppWatchProcessor
 
 app = SnowTyper(
     name="app",
@@ -153,6 +158,7 @@ def app_run(
     ),
     interactive: Optional[bool] = InteractiveOption,
     force: Optional[bool] = ForceOption,
+    no_checksum_cache: Optional[bool] = NoChecksumCacheOption,
     **options,
 ) -> CommandResult:
     """
@@ -180,6 +186,7 @@ def app_run(
         patch=patch,
         from_release_directive=from_release_directive,
         is_interactive=is_interactive,
+        use_checksum_cache=not no_checksum_cache,
     )
     return MessageResult(
         f"Your application object ({processor.app_name}) is now available:\n"
@@ -229,17 +236,41 @@ def app_teardown(
 @app.command("deploy", requires_connection=True)
 @with_project_definition("native_app")
 def app_deploy(
+    no_checksum_cache: Optional[bool] = NoChecksumCacheOption,
+    watch: Optional[bool] = typer.Option(
+        False,
+        "--watch",
+        help=f"""When enabled, this option keeps the command running after the first deployment, and syncs the stage whenever artifact sources in the project directory change. Press Ctrl+C to stop watching. Defaults to unset.""",
+        is_flag=True,
+    ),
+    reapply_package_scripts: Optional[bool] = typer.Option(
+        False,
+        "--reapply-package-scripts",
+        help=f"""When used with `--watch`, this option re-applies the package scripts whenever one of them changes. Defaults to unset.""",
+        is_flag=True,
+    ),
     **options,
 ) -> CommandResult:
     """
     Creates an application package in your Snowflake account and syncs the local changes to the stage without creating or updating the application.
     """
+    if watch:
+        processor = NativeAppWatchProcessor(
+            project_definition=cli_context.project_definition,
+            project_root=cli_context.project_root,
+        )
+        processor.process(
+            use_checksum_cache=not no_checksum_cache,
+            reapply_package_scripts=reapply_package_scripts,
+        )
+        return MessageResult(f"Stopped watching for changes.")
+
     manager = NativeAppManager(
         project_definition=cli_context.project_definition,
         project_root=cli_context.project_root,
     )
 
     manager.build_bundle()
-    manager.deploy()
+    manager.deploy(use_checksum_cache=not no_checksum_cache)
 
     return MessageResult(f"Deployed successfully.")
@@ -15,3 +15,10 @@ ForceOption = typer.Option(
     You should enable this option if interactive mode is not specified and if you want perform potentially destructive actions. Defaults to unset.""",
     is_flag=True,
 )
+
+NoChecksumCacheOption = typer.Option(
+    False,
+    "--no-checksum-cache",
+    help=f"""When enabled, this option recomputes the checksums of all files in the deploy root instead of reusing the ones cached by previous deployments. Defaults to unset.""",
+    is_flag=True,
+)
@@ -15,7 +15,6 @@ from snowflake.cli.api.project.util import (
 )
 from snowflake.cli.api.secure_path import SecurePath
 from snowflake.cli.api.utils.rendering import generic_render_template
-from yaml import dump, safe_dump, safe_load
 
 log = logging.getLogger(__name__)
 
@@ -100,6 +99,8 @@ def _to_yaml_string(identifier: str):
     """
     Returns the YAML representation of an identifier, suitable for including in a YAML jinja template
     """
+    from yaml import dump
+
     if is_valid_unquoted_identifier(identifier):
         return identifier
     else:
@@ -150,6 +151,8 @@ def _replace_snowflake_yml_name_with_project(
         None
     """
 
+    from yaml import safe_dump, safe_load
+
     path_to_snowflake_yml = SecurePath(target_directory) / "snowflake.yml"
     contents = None
 
@@ -4,17 +4,16 @@ from abc import ABC, abstractmethod
 from functools import cached_property
 from pathlib import Path
 from textwrap import dedent
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
-import jinja2
 from snowflake.cli.api.console import cli_console as cc
 from snowflake.cli.api.exceptions import SnowflakeSQLExecutionError
+from snowflake.cli.api.feature_flags import FeatureFlag
 from snowflake.cli.api.project.definition import (
     default_app_package,
     default_application,
     default_role,
 )
-from snowflake.cli.api.project.schemas.native_app.native_app import NativeApp
 from snowflake.cli.api.project.util import (
     extract_schema,
     to_identifier,
@@ -24,6 +23,7 @@ from snowflake.cli.api.sql_execution import SqlExecutionMixin
 from snowflake.cli.plugins.connection.util import make_snowsight_url
 from snowflake.cli.plugins.nativeapp.artifacts import (
     ArtifactMapping,
+    ProjectFileIndex,
     build_bundle,
     translate_artifact,
 )
@@ -49,7 +49,9 @@ from snowflake.cli.plugins.stage.diff import (
     sync_local_diff_with_stage,
 )
 from snowflake.connector import ProgrammingError
-from snowflake.connector.cursor import DictCursor
+
+if TYPE_CHECKING:
+    from snowflake.cli.api.project.schemas.native_app.native_app import NativeApp
 
 
 def generic_sql_error_handler(
@@ -212,12 +214,6 @@ class NativeAppManager(SqlExecutionMixin):
             role = self._get_current_role()
         return role
 
-    def _get_current_role(self) -> str:
-        role_result = self._execute_query(
-            "select current_role()", cursor_class=DictCursor
-        ).fetchone()
-        return role_result["CURRENT_ROLE()"]
-
     @cached_property
     def debug_mode(self) -> bool:
         if self.definition.application:
@@ -278,13 +274,15 @@ class NativeAppManager(SqlExecutionMixin):
             return False
         return True
 
-    def build_bundle(self) -> None:
+    def build_bundle(self, file_index: Optional[ProjectFileIndex] = None) -> None:
         """
         Populates the local deploy root from artifact sources.
         """
-        build_bundle(self.project_root, self.deploy_root, self.artifacts)
+        build_bundle(self.project_root, self.deploy_root, self.artifacts, file_index)
 
-    def sync_deploy_root_with_stage(self, role: str) -> DiffResult:
+    def sync_deploy_root_with_stage(
+        self, role: str, use_checksum_cache: bool = True
+    ) -> DiffResult:
         """
         Ensures that the files on our remote stage match the artifacts we have in
         the local filesystem. Returns the DiffResult used to make changes.
@@ -309,7 +307,12 @@ class NativeAppManager(SqlExecutionMixin):
             "Performing a diff between the Snowflake stage and your local deploy_root ('%s') directory."
             % self.deploy_root
         )
-        diff: DiffResult = stage_diff(self.deploy_root, self.stage_fqn)
+        diff: DiffResult = stage_diff(
+            self.deploy_root,
+            self.stage_fqn,
+            use_checksum_cache=use_checksum_cache,
+            compare_sizes=FeatureFlag.ENABLE_STAGE_DIFF_SIZE_COMPARISON.is_enabled(),
+        )
         cc.message(str(diff))
 
         # Upload diff-ed files to application package stage
@@ -400,6 +403,8 @@ class NativeAppManager(SqlExecutionMixin):
         Assuming the application package exists and we are using the correct role,
         applies all package scripts in-order to the application package.
         """
+        import jinja2
+
         env = jinja2.Environment(
             loader=jinja2.loaders.FileSystemLoader(self.project_root),
             keep_trailing_newline=True,
@@ -425,7 +430,7 @@ class NativeAppManager(SqlExecutionMixin):
         # once we're sure all the templates expanded correctly, execute all of them
         try:
             if self.package_warehouse:
-                self._execute_query(f"use warehouse {self.package_warehouse}")
+                self.use_warehouse(self.package_warehouse)
 
             for i, queries in enumerate(queued_queries):
                 cc.step(f"Applying package script: {self.package_scripts[i]}")
@@ -435,7 +440,7 @@ class NativeAppManager(SqlExecutionMixin):
                 err, role=self.package_role, warehouse=self.package_warehouse
             )
 
-    def deploy(self) -> DiffResult:
+    def deploy(self, use_checksum_cache: bool = True) -> DiffResult:
         """app deploy process"""
 
         # 1. Create an empty application package, if none exists
@@ -446,6 +451,8 @@ class NativeAppManager(SqlExecutionMixin):
             self._apply_package_scripts()
 
             # 3. Upload files from deploy root local folder to the above stage
-            diff = self.sync_deploy_root_with_stage(self.package_role)
+            diff = self.sync_deploy_root_with_stage(
+                self.package_role, use_checksum_cache=use_checksum_cache
+            )
 
         return diff
@@ -1,12 +1,13 @@
+from __future__ import annotations
+
 from pathlib import Path
 from textwrap import dedent
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import typer
 from click import UsageError
 from snowflake.cli.api.console import cli_console as cc
 from snowflake.cli.api.exceptions import SnowflakeSQLExecutionError
-from snowflake.cli.api.project.schemas.native_app.native_app import NativeApp
 from snowflake.cli.plugins.nativeapp.constants import (
     ALLOWED_SPECIAL_COMMENTS,
     COMMENT_COL,
@@ -30,6 +31,9 @@ from snowflake.cli.plugins.stage.manager import StageManager
 from snowflake.connector import ProgrammingError
 from snowflake.connector.cursor import SnowflakeCursor
 
+if TYPE_CHECKING:
+    from snowflake.cli.api.project.schemas.native_app.native_app import NativeApp
+
 UPGRADE_RESTRICTION_CODES = {93044, 93055, 93045, 93046}
 
 
@@ -46,7 +50,7 @@ class NativeAppRunProcessor(NativeAppManager, NativeAppCommandProcessor):
             # 1. Need to use a warehouse to create an application object
             try:
                 if self.application_warehouse:
-                    self._execute_query(f"use warehouse {self.application_warehouse}")
+                    self.use_warehouse(self.application_warehouse)
             except ProgrammingError as err:
                 generic_sql_error_handler(
                     err=err, role=self.app_role, warehouse=self.application_warehouse
@@ -191,7 +195,7 @@ class NativeAppRunProcessor(NativeAppManager, NativeAppCommandProcessor):
             # 1. Need to use a warehouse to create an application object
             try:
                 if self.application_warehouse:
-                    self._execute_query(f"use warehouse {self.application_warehouse}")
+                    self.use_warehouse(self.application_warehouse)
             except ProgrammingError as err:
                 generic_sql_error_handler(
                     err=err, role=self.app_role, warehouse=self.application_warehouse
@@ -268,6 +272,7 @@ class NativeAppRunProcessor(NativeAppManager, NativeAppCommandProcessor):
         patch: Optional[str] = None,
         from_release_directive: bool = False,
         is_interactive: bool = False,
+        use_checksum_cache: bool = True,
         *args,
         **kwargs,
     ):
@@ -297,5 +302,5 @@ class NativeAppRunProcessor(NativeAppManager, NativeAppCommandProcessor):
             )
             return
 
-        diff = self.deploy()
+        diff = self.deploy(use_checksum_cache=use_checksum_cache)
         self._create_dev_app(diff)
@@ -1,12 +1,13 @@
+from __future__ import annotations
+
 from pathlib import Path
 from textwrap import dedent
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 import typer
 from click import BadOptionUsage, ClickException
 from snowflake.cli.api.console import cli_console as cc
 from snowflake.cli.api.exceptions import SnowflakeSQLExecutionError
-from snowflake.cli.api.project.schemas.native_app.native_app import NativeApp
 from snowflake.cli.api.project.util import unquote_identifier
 from snowflake.cli.api.utils.cursor import (
     find_all_rows,
@@ -27,6 +28,9 @@ from snowflake.cli.plugins.nativeapp.run_processor import NativeAppRunProcessor
 from snowflake.connector import ProgrammingError
 from snowflake.connector.cursor import DictCursor
 
+if TYPE_CHECKING:
+    from snowflake.cli.api.project.schemas.native_app.native_app import NativeApp
+
 
 def check_index_changes_in_git_repo(
     project_root: Path, policy: PolicyBase, is_interactive: bool
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import logging
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+from click import ClickException
+from snowflake.cli.api.console import cli_console as cc
+from snowflake.cli.plugins.nativeapp.artifacts import (
+    ProjectFileIndex,
+    resolve_bundle,
+)
+from snowflake.cli.plugins.nativeapp.manager import (
+    NativeAppCommandProcessor,
+    NativeAppManager,
+)
+from snowflake.cli.plugins.stage.diff import (
+    CHECKSUM_CACHE_FILENAME,
+    DiffResult,
+    enumerate_files,
+    sync_local_diff_with_stage,
+)
+from snowflake.connector import DatabaseError
+
+if TYPE_CHECKING:
+    from snowflake.cli.api.project.schemas.native_app.native_app import NativeApp
+
+log = logging.getLogger(__name__)
+
+DEFAULT_POLL_INTERVAL_SECONDS = 0.5
+MAX_POLL_INTERVAL_SECONDS = 4.0
+DEFAULT_DEBOUNCE_SECONDS = 0.5
+
+FileStamp = Tuple[int, int]
+"Size and modification time (in nanoseconds) of a file"
+
+
+def stamp_file(path: Path) -> Optional[FileStamp]:
+    """
+    Returns the size and modification time of the file at the given path,
+    following symlinks, or None if there is no such file.
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def snapshot_deploy_root(deploy_root: Path) -> Dict[str, FileStamp]:
+    """
+    Stamps every file in the deploy root, keyed by its path relative to the
+    deploy root (the same keys stage_diff() uses).
+    """
+    if not deploy_root.is_dir():
+        return {}
+
+    snapshot: Dict[str, FileStamp] = {}
+    for file in enumerate_files(deploy_root):
+        relpath = str(file.relative_to(deploy_root))
+        if relpath == CHECKSUM_CACHE_FILENAME:
+            continue
+        stamp = stamp_file(file)
+        if stamp is not None:
+            snapshot[relpath] = stamp
+    return snapshot
+
+
+def diff_snapshots(
+    synced: Dict[str, FileStamp], current: Dict[str, FileStamp]
+) -> DiffResult:
+    """
+    Compares the deploy root as it was last synced with its current state.
+    As the stage matched the synced snapshot, the result describes the
+    changes to be pushed to the stage, without listing it again.
+    """
+    diff = DiffResult()
+    for relpath in sorted(current):
+        if relpath not in synced:
+            diff.only_local.append(relpath)
+        elif synced[relpath] != current[relpath]:
+            diff.different.append(relpath)
+        else:
+            diff.identical.append(relpath)
+    diff.only_on_stage = sorted(set(synced) - set(current))
+    return diff
+
+
+class NativeAppWatchProcessor(NativeAppManager, NativeAppCommandProcessor):
+    """
+    Deploys the application package once, then keeps its stage in sync with the
+    artifact sources in the project directory until interrupted.
+
+    The project is polled for changes, less often the longer it stays unchanged.
+    Once no further changes were seen for the debounce period, the bundle is rebuilt and only the files whose size or
+    modification time changed since the last sync are pushed to the stage,
+    reusing the same Snowflake connection.
+    """
+
+    def __init__(self, project_definition: NativeApp, project_root: Path):
+        super().__init__(project_definition, project_root)
+        self._file_index = ProjectFileIndex(
+            self.project_root, ignored=[self.deploy_root]
+        )
+        self._sources: Optional[Dict[Path, FileStamp]] = None
+        self._package_scripts: Dict[str, Optional[FileStamp]] = {}
+        self._applied_package_scripts: Dict[str, Optional[FileStamp]] = {}
+        self._synced: Dict[str, FileStamp] = {}
+        self._last_change: Optional[float] = None
+        self.debounce_seconds = DEFAULT_DEBOUNCE_SECONDS
+        self.reapply_package_scripts = False
+
+    def _snapshot_sources(self) -> Optional[Dict[Path, FileStamp]]:
+        """
+        Stamps every file the deploy root is built from, or returns None if the
+        artifacts cannot currently be resolved (e.g. a glob matches nothing).
+        """
+        try:
+            bundle = resolve_bundle(
+                self.project_root,
+                self.deploy_root.resolve(),
+                self.artifacts,
+                self._file_index,
+            )
+        except ClickException:
+            return None
+
+        snapshot: Dict[Path, FileStamp] = {}
+        for source_path in bundle.values():
+            files = (
+                enumerate_files(source_path) if source_path.is_dir() else [source_path]
+            )
+            for file in files:
+                stamp = stamp_file(file)
+                if stamp is not None:
+                    snapshot[file] = stamp
+        return snapshot
+
+    def _snapshot_package_scripts(self) -> Dict[str, Optional[FileStamp]]:
+        return {
+            relpath: stamp_file(self.project_root / relpath)
+            for relpath in self.package_scripts
+        }
+
+    def start(self, use_checksum_cache: bool = True) -> DiffResult:
+        """
+        Bundles the project and deploys it the same way `snow app deploy` does.
+        """
+        # take the snapshots first, so that files modified while we deploy are
+        # picked up as changes by the next poll
+        self._sources = self._snapshot_sources()
+        self._package_scripts = self._snapshot_package_scripts()
+        self._applied_package_scripts = self._package_scripts
+        self.build_bundle(file_index=self._file_index)
+        self._synced = snapshot_deploy_root(self.deploy_root)
+        return self.deploy(use_checksum_cache=use_checksum_cache)
+
+    def poll(self, now: Optional[float] = None) -> Optional[DiffResult]:
+        """
+        Checks the project for changes once. Changes are synced after no further
+        changes were seen for the debounce period; returns the synced diff, if any.
+        """
+        if now is None:
+            now = time.monotonic()
+
+        # forget the listings of directories where files were added or removed
+        self._file_index.invalidate_stale()
+        sources = self._snapshot_sources()
+        package_scripts = self._snapshot_package_scripts()
+        if sources != self._sources or package_scripts != self._package_scripts:
+            self._sources = sources
+            self._package_scripts = package_scripts
+            self._last_change = now
+            return None
+
+        if self._last_change is not None and (
+            now - self._last_change >= self.debounce_seconds
+        ):
+            diff = self.sync_changes()
+            # a failed sync stays pending, so that the next poll retries it
+            self._last_change = now if diff is None else None
+            return diff
+        return None
+
+    def sync_changes(self) -> Optional[DiffResult]:
+        """
+        Rebuilds the bundle and pushes the files that changed since the last sync
+        to the stage, re-applying package scripts first if they changed.
+        Errors are reported as warnings and None is returned, so that watching
+        can continue.
+        """
+        try:
+            self.build_bundle(file_index=self._file_index)
+            deployed = snapshot_deploy_root(self.deploy_root)
+            diff = diff_snapshots(self._synced, deployed)
+
+            with self.use_role(self.package_role):
+                if (
+                    self.reapply_package_scripts
+                    and self._package_scripts != self._applied_package_scripts
+                ):
+                    self._apply_package_scripts()
+                    self._applied_package_scripts = self._package_scripts
+
+                if diff.has_changes():
+                    cc.message(str(diff))
+                    sync_local_diff_with_stage(
+                        role=self.package_role,
+                        deploy_root_path=self.deploy_root,
+                        diff_result=diff,
+                        stage_path=self.stage_fqn,
+                    )
+        except ClickException as err:
+            cc.warning(err.format_message())
+            return None
+        except DatabaseError as err:
+            cc.warning(f"Could not sync changes: {err.msg}")
+            return None
+
+        self._synced = deployed
+        return diff
+
+    def process(
+        self,
+        use_checksum_cache: bool = True,
+        reapply_package_scripts: bool = False,
+        poll_interval: float = DEFAULT_POLL_INTERVAL_SECONDS,
+        max_poll_interval: float = MAX_POLL_INTERVAL_SECONDS,
+        *args,
+        **kwargs,
+    ):
+        """app deploy --watch process"""
+        self.reapply_package_scripts = reapply_package_scripts
+        self.start(use_checksum_cache=use_checksum_cache)
+
+        cc.step(f"Watching {self.project_root} for changes. Press Ctrl+C to stop.")
+        interval = poll_interval
+        try:
+            while True:
+                time.sleep(interval)
+                self.poll()
+                if self._last_change is None:
+                    # back off while nothing changes
+                    interval = min(interval * 2, max_poll_interval)
+                else:
+                    # a change is pending until the debounce period passes
+                    interval = poll_interval
+        except KeyboardInterrupt:
+            log.debug("Stopped watching %s", self.project_root)
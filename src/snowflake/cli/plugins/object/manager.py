@@ -44,11 +44,32 @@ class ObjectManager(SqlExecutionMixin):
                 f"Describe is currently not supported for object of type image-repository"
             )
         object_name = _get_object_names(object_type).sf_name
-        return self._execute_query(f"describe {object_name} {name}")
+        try:
+            cursor = self._execute_query(f"describe {object_name} {name}")
+        except ProgrammingError:
+            self._remember_existence(object_type, name, False)
+            raise
+        self._remember_existence(object_type, name, True)
+        return cursor
 
     def object_exists(self, *, object_type: str, name: str):
+        metadata_context = self._session_state.metadata_context
+        if metadata_context is not None:
+            exists = self._session_state.metadata.get(
+                metadata_context, f"describe {object_type}", name, None
+            )
+            if exists is not None:
+                return exists
+
         try:
             self.describe(object_type=object_type, name=name)
             return True
         except ProgrammingError:
             return False
+
+    def _remember_existence(self, object_type: str, name: str, exists: bool):
+        metadata_context = self._session_state.metadata_context
+        if metadata_context is not None:
+            self._session_state.metadata.put(
+                metadata_context, f"describe {object_type}", name, None, exists
+            )
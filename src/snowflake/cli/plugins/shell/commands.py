@@ -0,0 +1,17 @@
+from snowflake.cli.api.commands.snow_typer import SnowTyper
+from snowflake.cli.plugins.shell.manager import ShellManager
+
+# simple Typer with defaults because it won't become a command group as it contains only one command
+app = SnowTyper()
+
+
+@app.command(name="shell", requires_connection=True)
+def shell(**options) -> None:
+    """
+    Starts an interactive SQL shell keeping a single connection open for the whole session.
+
+    Statements terminated with a semicolon are executed as soon as they are entered and may span
+    many lines. Results are printed in the format selected with `--format`, followed by the time
+    of execution. Names of objects in the current schema are completed with Tab.
+    """
+    ShellManager().run()
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import time
+from io import StringIO
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from click import ClickException
+from snowflake.cli.api.console import cli_console
+from snowflake.cli.api.output.types import QueryResult
+from snowflake.cli.api.sql_execution import SqlExecutionMixin
+from snowflake.cli.app.printing import print_result
+from snowflake.cli.plugins.sql.manager import SqlManager
+from snowflake.connector.config_manager import CONFIG_MANAGER
+from snowflake.connector.cursor import DictCursor
+from snowflake.connector.errors import Error, ProgrammingError
+from snowflake.connector.util_text import split_statements
+
+log = logging.getLogger(__name__)
+
+PROMPT = "snow> "
+CONTINUATION_PROMPT = "   -> "
+EXIT_COMMANDS = ("exit", "quit", "!exit", "!quit")
+HISTORY_FILE_NAME = "shell_history"
+HISTORY_LENGTH = 1000
+
+# listing of the object catalog in the metadata cache of the session
+_CATALOG_OBJECT_TYPE = "terse objects"
+_SENTINEL_STATEMENT = "select 0"
+
+SQL_KEYWORDS = (
+    "alter",
+    "and",
+    "as",
+    "by",
+    "call",
+    "create",
+    "database",
+    "delete",
+    "describe",
+    "distinct",
+    "drop",
+    "from",
+    "grant",
+    "group",
+    "having",
+    "insert",
+    "into",
+    "join",
+    "limit",
+    "merge",
+    "not",
+    "null",
+    "on",
+    "or",
+    "order",
+    "replace",
+    "role",
+    "schema",
+    "select",
+    "set",
+    "show",
+    "table",
+    "union",
+    "update",
+    "use",
+    "values",
+    "view",
+    "warehouse",
+    "where",
+    "with",
+)
+
+
+def is_statement_complete(text: str) -> bool:
+    """
+    Input is complete when its last statement is terminated with a semicolon that is
+    not part of a string or a comment, i.e. when a statement appended to it is split
+    from the rest.
+    """
+    statements = [
+        statement
+        for statement, _ in split_statements(
+            StringIO(f"{text}\n{_SENTINEL_STATEMENT}"), remove_comments=True
+        )
+    ]
+    return len(statements) > 1 and statements[-1] == _SENTINEL_STATEMENT
+
+
+def get_history_path() -> Path:
+    return CONFIG_MANAGER.file_path.parent / HISTORY_FILE_NAME
+
+
+class ShellManager(SqlExecutionMixin):
+    """
+    Reads statements from the user and executes them one after another through
+    the connection of the command, which stays open for the whole session.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._sql_manager = SqlManager()
+        self._completions: List[str] = []
+
+    def run(self, read_line: Callable[[str], str] = input) -> None:
+        interactive = sys.stdin.isatty()
+        if interactive:
+            self._set_up_readline()
+            cli_console.message(
+                "Enter SQL statements terminated with a semicolon. "
+                "Type `exit` or press Ctrl-D to quit."
+            )
+        try:
+            self._loop(read_line, interactive)
+        finally:
+            if interactive:
+                self._save_history()
+
+    def _loop(self, read_line: Callable[[str], str], interactive: bool) -> None:
+        lines: List[str] = []
+        while True:
+            prompt = CONTINUATION_PROMPT if lines else PROMPT
+            try:
+                line = read_line(prompt if interactive else "")
+            except EOFError:
+                break
+            except KeyboardInterrupt:
+                # discards the statement being entered
+                lines.clear()
+                cli_console.message("")
+                continue
+            if not lines and line.strip().lower() in EXIT_COMMANDS:
+                return
+            lines.append(line)
+            text = "\n".join(lines)
+            if not text.strip():
+                lines.clear()
+            elif is_statement_complete(text):
+                lines.clear()
+                self.execute(text)
+        # input ended without a semicolon after the last statement
+        if "".join(lines).strip():
+            self.execute("\n".join(lines))
+
+    def execute(self, text: str) -> None:
+        """Executes the statements, printing the result and timing of each of them."""
+        try:
+            _, cursors = self._sql_manager.execute(text, file=None, std_in=False)
+            while True:
+                start = time.monotonic()
+                cursor = next(cursors, None)
+                if cursor is None:
+                    break
+                duration = time.monotonic() - start
+                print_result(QueryResult(cursor))
+                rows = "" if cursor.rowcount is None else f"{cursor.rowcount} row(s) "
+                cli_console.message(f"{rows}({duration:.3f}s)")
+        except ClickException as err:
+            cli_console.warning(err.format_message())
+        except Error as err:
+            cli_console.warning(str(err))
+        except KeyboardInterrupt:
+            cli_console.warning("Statement interrupted.")
+
+    def complete(self, text: str) -> List[str]:
+        """Returns keywords and names of objects in the current schema starting with the text."""
+        keyword_case = str.upper if text[:1].isupper() else str.lower
+        candidates = [keyword_case(keyword) for keyword in SQL_KEYWORDS]
+        candidates += self._catalog_names()
+        prefix = text.lower()
+        return [c for c in candidates if c.lower().startswith(prefix)]
+
+    def _catalog_names(self) -> List[str]:
+        """
+        Names of the objects in the current schema, listed once and kept in the
+        metadata cache of the session until a statement changes them.
+        """
+        state = self._session_state
+        context = (state.role or "", state.database or "", state.schema or "")
+        rows = state.metadata.get_listing(context, _CATALOG_OBJECT_TYPE, None)
+        if rows is None:
+            try:
+                rows = self._execute_query(
+                    f"show {_CATALOG_OBJECT_TYPE}", cursor_class=DictCursor
+                ).fetchall()
+            except ProgrammingError as err:
+                # e.g. the session has no current schema
+                log.debug("Cannot list objects for completion: %s", err)
+                rows = []
+            state.metadata.put_listing(context, _CATALOG_OBJECT_TYPE, None, rows)
+        return sorted({row["name"] for row in rows})
+
+    def _readline_completer(self, text: str, state: int) -> Optional[str]:
+        if state == 0:
+            try:
+                self._completions = self.complete(text)
+            except Exception as err:
+                log.debug("Completion failed: %s", err)
+                self._completions = []
+        return self._completions[state] if state < len(self._completions) else None
+
+    def _set_up_readline(self) -> None:
+        try:
+            import readline
+        except ImportError:
+            return
+        readline.set_completer(self._readline_completer)
+        readline.parse_and_bind("tab: complete")
+        readline.set_history_length(HISTORY_LENGTH)
+        try:
+            readline.read_history_file(get_history_path())
+        except OSError:
+            pass
+
+    @staticmethod
+    def _save_history() -> None:
+        try:
+            import readline
+        except ImportError:
+            return
+        history_path = get_history_path()
+        try:
+            readline.write_history_file(history_path)
+            # statements may contain secrets
+            os.chmod(history_path, 0o600)
+        except OSError as err:
+            log.debug("Cannot save history of the shell: %s", err)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 from enum import Enum
-from typing import Dict, List, Optional, Set
+from typing import TYPE_CHECKING, Dict, List, Optional, Set
 
 import typer
 from click import ClickException
@@ -31,11 +31,6 @@ from snowflake.cli.api.output.types import (
     MessageResult,
     SingleQueryResult,
 )
-from snowflake.cli.api.project.schemas.snowpark.callable import (
-    Callable,
-    FunctionSchema,
-    ProcedureSchema,
-)
 from snowflake.cli.api.secure_path import SecurePath
 from snowflake.cli.plugins.object.manager import ObjectManager
 from snowflake.cli.plugins.snowpark import package_utils
@@ -60,6 +55,13 @@ from snowflake.cli.plugins.snowpark.zipper import zip_dir
 from snowflake.cli.plugins.stage.manager import StageManager
 from snowflake.connector import DictCursor, ProgrammingError
 
+if TYPE_CHECKING:
+    from snowflake.cli.api.project.schemas.snowpark.callable import (
+        Callable,
+        FunctionSchema,
+        ProcedureSchema,
+    )
+
 log = logging.getLogger(__name__)
 
 app = SnowTyper(
@@ -201,10 +203,20 @@ def _find_existing_objects(
     om: ObjectManager,
 ):
     existing_objects = {}
+    listed_names: Dict[str, Optional[Set[str]]] = {}
     for object_definition in objects:
         identifier = build_udf_sproc_identifier(
             object_definition, om, include_parameter_names=False
         )
+        schema, _, name = identifier[: identifier.index("(")].rpartition(".")
+        if schema not in listed_names:
+            listed_names[schema] = _list_object_names(object_type, schema, om)
+        if (
+            listed_names[schema] is not None
+            and name.upper() not in listed_names[schema]
+        ):
+            # Objects missing from the listing do not exist, no need to describe them.
+            continue
         try:
             current_state = om.describe(
                 object_type=object_type.value.sf_name,
@@ -216,6 +228,22 @@ def _find_existing_objects(
     return existing_objects
 
 
+def _list_object_names(
+    object_type: ObjectType, schema: str, om: ObjectManager
+) -> Optional[Set[str]]:
+    """
+    Returns upper-cased names of all user objects of given type in the schema, fetched
+    with a single query, or None if the schema cannot be listed.
+    """
+    try:
+        rows = om.list_objects(
+            f"user {object_type.value.sf_plural_name}", f"in schema {schema}"
+        )
+    except ProgrammingError:
+        return None
+    return {row["name"].upper() for row in rows}
+
+
 def _check_if_all_defined_integrations_exists(
     om: ObjectManager,
     functions: List[FunctionSchema],
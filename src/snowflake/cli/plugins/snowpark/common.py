@@ -1,10 +1,9 @@
 from __future__ import annotations
 
 import re
-from typing import Dict, List, Optional, Set
+from typing import TYPE_CHECKING, Dict, List, Optional, Set
 
 from snowflake.cli.api.constants import ObjectType
-from snowflake.cli.api.project.schemas.snowpark.argument import Argument
 from snowflake.cli.api.sql_execution import SqlExecutionMixin
 from snowflake.cli.plugins.snowpark.models import Requirement
 from snowflake.cli.plugins.snowpark.package_utils import (
@@ -12,6 +11,9 @@ from snowflake.cli.plugins.snowpark.package_utils import (
 )
 from snowflake.connector.cursor import SnowflakeCursor
 
+if TYPE_CHECKING:
+    from snowflake.cli.api.project.schemas.snowpark.argument import Argument
+
 DEFAULT_RUNTIME = "3.8"
 
 
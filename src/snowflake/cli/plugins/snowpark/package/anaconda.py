@@ -4,12 +4,10 @@ import logging
 from dataclasses import dataclass
 from typing import Dict, List, Set
 
-import requests
 from click import ClickException
 from packaging.requirements import InvalidRequirement
 from packaging.requirements import Requirement as PkgRequirement
 from packaging.version import InvalidVersion, parse
-from requests import HTTPError
 from snowflake.cli.api.secure_path import SecurePath
 from snowflake.cli.plugins.snowpark.models import Requirement
 
@@ -65,6 +63,8 @@ class AnacondaChannel:
 
     @classmethod
     def from_snowflake(cls):
+        import requests
+
         try:
             response = requests.get(AnacondaChannel.snowflake_channel_url)
             response.raise_for_status()
@@ -79,7 +79,7 @@ class AnacondaChannel:
                 )
             return cls(packages)
 
-        except HTTPError as err:
+        except requests.HTTPError as err:
             raise ClickException(
                 f"Accessing Snowflake Anaconda channel failed. Reason {err}"
             )
@@ -1,8 +1,13 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
-from snowflake.cli.api.project.schemas.snowpark.snowpark import Snowpark
 from snowflake.cli.api.secure_path import SecurePath
 
+if TYPE_CHECKING:
+    from snowflake.cli.api.project.schemas.snowpark.snowpark import Snowpark
+
 _DEFINED_REQUIREMENTS = "requirements.txt"
 _REQUIREMENTS_SNOWFLAKE = "requirements.snowflake.txt"
 
@@ -4,7 +4,6 @@ import re
 import subprocess
 from urllib.parse import urlparse
 
-import requests
 from click import ClickException
 from snowflake.cli.api.sql_execution import SqlExecutionMixin
 from snowflake.connector.cursor import DictCursor
@@ -41,6 +40,8 @@ class RegistryManager(SqlExecutionMixin):
         """
         Logs in to the registry using basic authentication and generates a bearer authentication token.
         """
+        import requests
+
         token = json.dumps(self.get_token())
         parsed_url = urlparse(repo_url)
 
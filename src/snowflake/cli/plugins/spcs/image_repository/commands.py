@@ -1,7 +1,6 @@
 import json
 from typing import Optional
 
-import requests
 import typer
 from click import ClickException
 from snowflake.cli.api.commands.flags import IfNotExistsOption, ReplaceOption
@@ -60,6 +59,8 @@ def list_images(
     **options,
 ) -> CollectionResult:
     """Lists images in the given repository."""
+    import requests
+
     repository_manager = ImageRepositoryManager()
     database = repository_manager.get_database()
     schema = repository_manager.get_schema()
@@ -110,6 +111,7 @@ def list_tags(
     **options,
 ) -> CollectionResult:
     """Lists tags for the given image in a repository."""
+    import requests
 
     repository_manager = ImageRepositoryManager()
     url = repository_manager.get_repository_url(name)
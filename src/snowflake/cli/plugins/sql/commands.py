@@ -34,6 +34,15 @@ def execute_sql(
         "-i",
         help="Read the query from standard input. Use it when piping input to this command.",
     ),
+    parallel: int = typer.Option(
+        1,
+        "--parallel",
+        min=1,
+        help="Maximum number of statements to run at the same time. Statements are assumed to be independent, "
+        "unless a statement is preceded by a `-- @depends <name>` comment referring to a statement marked with "
+        "`-- @name <name>`. Statements like `USE` or `ALTER SESSION` wait for all previous statements, "
+        "and all later statements wait for them.",
+    ),
     **options,
 ) -> CommandResult:
     """
@@ -42,7 +51,9 @@ def execute_sql(
     Query to execute can be specified using query option, filename option (all queries from file will be executed)
     or via stdin by piping output from other command. For example `cat my.sql | snow sql -i`.
     """
-    single_statement, cursors = SqlManager().execute(query, file, std_in)
+    single_statement, cursors = SqlManager().execute(
+        query, file, std_in, max_concurrency=parallel
+    )
     if single_statement:
         return QueryResult(next(cursors))
     return MultipleResults((QueryResult(c) for c in cursors))
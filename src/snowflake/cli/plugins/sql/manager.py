@@ -1,18 +1,103 @@
+import re
 import sys
 from io import StringIO
+from itertools import chain, islice
 from pathlib import Path
-from typing import Iterable, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
 
 from click import UsageError
 from snowflake.cli.api.secure_path import UNLIMITED, SecurePath
-from snowflake.cli.api.sql_execution import SqlExecutionMixin
+from snowflake.cli.api.sql_execution import ConcurrentStatement, SqlExecutionMixin
 from snowflake.connector.cursor import SnowflakeCursor
 from snowflake.connector.util_text import split_statements
 
+# statements changing the session affect all statements that follow them
+BARRIER_STATEMENT_REGEX = re.compile(
+    r"^\s*(use|alter\s+session|set|unset|begin|start\s+transaction|commit|rollback)\b",
+    re.IGNORECASE,
+)
+DEPENDENCY_MARKER_REGEX = re.compile(
+    r"^\s*--\s*@(name|depends)\b:?(.*)$", re.IGNORECASE | re.MULTILINE
+)
+
+
+def _split_stream(
+    stream: TextIO, remove_comments: bool = True
+) -> Iterator[Tuple[str, bool]]:
+    return (
+        statement
+        for statement in split_statements(stream, remove_comments=remove_comments)
+        if statement[0]
+    )
+
+
+def _split_file(file: Path, remove_comments: bool = True) -> Iterator[Tuple[str, bool]]:
+    with SecurePath(file).open("r", read_file_limit_mb=UNLIMITED) as fd:
+        yield from _split_stream(fd, remove_comments)
+
+
+def plan_statements(
+    statements: Iterable[Tuple[str, bool]]
+) -> Iterator[ConcurrentStatement]:
+    """
+    Works out which statements have to wait for other ones when running concurrently.
+    Statements are independent, unless they are preceded by dependency markers:
+
+        -- @name orders
+        create table orders (...);
+        -- @depends orders
+        create view recent_orders as select ...;
+
+    Statements changing the session (e.g. USE or ALTER SESSION), as well as PUT and GET,
+    are barriers: they wait for all previous statements, and all later ones wait for them.
+    Takes statements split with their comments, and returns them without comments.
+    """
+    names: Dict[str, int] = {}
+    last_barrier: Optional[int] = None
+    since_last_barrier: List[int] = []
+    position = 0
+    for statement, is_put_or_get in statements:
+        sql = "".join(
+            part
+            for part, _ in split_statements(StringIO(statement), remove_comments=True)
+            if part
+        )
+        if not sql:
+            continue
+
+        dependencies = set() if last_barrier is None else {last_barrier}
+        name = None
+        for marker, value in DEPENDENCY_MARKER_REGEX.findall(statement):
+            if marker.lower() == "name":
+                name = value.strip()
+                continue
+            for dependency in filter(None, (d.strip() for d in value.split(","))):
+                if dependency not in names:
+                    raise UsageError(
+                        f"Statement {sql!r} depends on unknown statement {dependency!r}."
+                    )
+                dependencies.add(names[dependency])
+
+        if is_put_or_get or BARRIER_STATEMENT_REGEX.match(sql):
+            dependencies.update(since_last_barrier)
+            since_last_barrier = []
+            last_barrier = position
+        else:
+            since_last_barrier.append(position)
+        if name:
+            names[name] = position
+
+        yield ConcurrentStatement(sql, frozenset(dependencies), is_put_or_get)
+        position += 1
+
 
 class SqlManager(SqlExecutionMixin):
     def execute(
-        self, query: Optional[str], file: Optional[Path], std_in: bool
+        self,
+        query: Optional[str],
+        file: Optional[Path],
+        std_in: bool,
+        max_concurrency: int = 1,
     ) -> Tuple[int, Iterable[SnowflakeCursor]]:
         inputs = [query, file, std_in]
         if not any(inputs):
@@ -24,15 +109,37 @@ class SqlManager(SqlExecutionMixin):
                 "Multiple input sources specified. Please specify only one."
             )
 
-        if std_in:
-            query = sys.stdin.read()
-        elif file:
-            query = SecurePath(file).read_text(file_size_limit_mb=UNLIMITED)
+        concurrent = max_concurrency > 1
+        if query and not concurrent:
+            statements = tuple(
+                statement
+                for statement, _ in split_statements(
+                    StringIO(query), remove_comments=True
+                )
+            )
+            single_statement = len(statements) == 1
+            return single_statement, self._execute_string("\n".join(statements))
 
-        statements = tuple(
-            statement
-            for statement, _ in split_statements(StringIO(query), remove_comments=True)
-        )
-        single_statement = len(statements) == 1
+        # files and stdin can be arbitrarily large, so statements are read, split
+        # and submitted one by one instead of loading the whole input at once;
+        # comments are kept for now when they can hold dependency markers
+        remove_comments = not concurrent
+        if query:
+            split = _split_stream(StringIO(query), remove_comments)
+        elif std_in:
+            split = _split_stream(sys.stdin, remove_comments)
+        else:
+            split = _split_file(file, remove_comments)  # type: ignore
+
+        if concurrent:
+            planned = plan_statements(split)
+            first_statements = list(islice(planned, 2))
+            cursors = self._execute_concurrently(
+                chain(first_statements, planned), max_concurrency
+            )
+        else:
+            first_statements = list(islice(split, 2))
+            cursors = self._execute_statements(chain(first_statements, split))
 
-        return single_statement, self._execute_string("\n".join(statements))
+        # looking ahead by two statements is enough to tell a single statement apart
+        return len(first_statements) == 1, cursors
@@ -8,6 +8,7 @@ from typing import List, Optional
 import click
 import typer
 from snowflake.cli.api.commands.flags import (
+    ExecuteParallelOption,
     OnErrorOption,
     PatternOption,
     VariablesOption,
@@ -145,6 +146,7 @@ def execute(
     ),
     on_error: OnErrorType = OnErrorOption,
     variables: Optional[List[str]] = VariablesOption,
+    parallel: int = ExecuteParallelOption,
     **options,
 ):
     """
@@ -152,7 +154,10 @@ def execute(
     e.g. `@stage/*.sql`, `@stage/dev/*`. Only files with `.sql` extension will be executed.
     """
     results = StageManager().execute(
-        stage_path=stage_path, on_error=on_error, variables=variables
+        stage_path=stage_path,
+        on_error=on_error,
+        variables=variables,
+        parallel=parallel,
     )
     return CollectionResult(results)
 
@@ -1,9 +1,17 @@
+import glob
 import hashlib
+import json
 import logging
+import math
+import os
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
 
 from snowflake.cli.api.exceptions import SnowflakeSQLExecutionError
 from snowflake.cli.api.secure_path import UNLIMITED, SecurePath
@@ -12,7 +20,19 @@ from snowflake.connector.cursor import SnowflakeCursor
 from .manager import StageManager
 
 MD5SUM_REGEX = r"^[A-Fa-f0-9]{32}$"
-CHUNK_SIZE_BYTES = 8192
+MULTIPART_ETAG_REGEX = r"^([A-Fa-f0-9]{32})-(\d+)$"
+# part sizes used by the connector for multipart uploads to S3-backed stages
+MULTIPART_CHUNK_SIZE_BYTES = 8 * 1024**2
+MULTIPART_MIN_CHUNK_SIZE_BYTES = 5 * 1024**2
+MULTIPART_MAX_PARTS = 10000
+CHUNK_SIZE_BYTES = 1024 * 1024
+MAX_UPLOAD_WORKERS = 4
+# hashlib releases the GIL while hashing large buffers, so threads scale with cores
+MAX_HASHING_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+CHECKSUM_CACHE_FILENAME = ".snowflake-cli-checksums.json"
+CHECKSUM_CACHE_VERSION = 2
+# files modified this recently may still change within the same mtime tick
+CHECKSUM_CACHE_MIN_AGE_NS = 2 * 10**9
 
 log = logging.getLogger(__name__)
 
@@ -85,6 +105,31 @@ class DiffResult:
         return "\n".join(components)
 
 
+@dataclass
+class UploadResult:
+    """
+    Each collection is a list of relative paths from the root of the
+    uploaded local directory.
+    """
+
+    uploaded: List[str] = field(default_factory=list)
+    "Files that were transferred to the stage"
+
+    skipped: List[str] = field(default_factory=list)
+    "Files that the stage reported as already up-to-date"
+
+
+@dataclass
+class _PutRequest:
+    """
+    A single PUT statement, covering one or more files of a stage directory.
+    """
+
+    local_path: Path
+    stage_path: str
+    files: List[str]
+
+
 def is_valid_md5sum(checksum: str) -> bool:
     """
     Could the provided hexadecimal checksum represent a valid md5sum?
@@ -92,6 +137,27 @@ def is_valid_md5sum(checksum: str) -> bool:
     return re.match(MD5SUM_REGEX, checksum) is not None
 
 
+def get_multipart_parts(checksum: str) -> Optional[int]:
+    """
+    Returns the number of parts if the provided checksum is the ETag of a file
+    uploaded in multiple parts (i.e. "<md5sum>-<parts>"), otherwise None.
+    """
+    match = re.match(MULTIPART_ETAG_REGEX, checksum)
+    return int(match.group(2)) if match else None
+
+
+def get_multipart_chunk_size(file_size: int) -> int:
+    """
+    Returns the part size the connector uses to upload a file of the given size
+    in multiple parts.
+    """
+    if math.ceil(file_size / MULTIPART_CHUNK_SIZE_BYTES) > MULTIPART_MAX_PARTS:
+        return max(
+            math.ceil(file_size / MULTIPART_MAX_PARTS), MULTIPART_MIN_CHUNK_SIZE_BYTES
+        )
+    return MULTIPART_CHUNK_SIZE_BYTES
+
+
 def compute_md5sum(file: Path) -> str:
     """
     Returns a hexadecimal checksum for the file located at the given path.
@@ -106,8 +172,8 @@ def compute_md5sum(file: Path) -> str:
     #  1. when the stage uses SNOWFLAKE_FULL encryption
     #  2. when the file was uploaded in multiple parts
 
-    # We can re-create the second if we know what chunk size was used by the
-    # upload process to the backing object store (e.g. S3, azure blob, etc.)
+    # We re-create the second in compute_multipart_etag using the chunk size the
+    # connector uses to upload to the backing object store (e.g. S3, azure blob, etc.)
     # but we cannot re-create the first as the encrpytion key is hidden.
 
     # We are assuming that we will not get accidental collisions here due to the
@@ -116,12 +182,128 @@ def compute_md5sum(file: Path) -> str:
 
     with SecurePath(file).open("rb", read_file_limit_mb=UNLIMITED) as f:
         file_hash = hashlib.md5()
-        while chunk := f.read(CHUNK_SIZE_BYTES):
-            file_hash.update(chunk)
+        buffer = bytearray(CHUNK_SIZE_BYTES)
+        view = memoryview(buffer)
+        while read_bytes := f.readinto(buffer):
+            file_hash.update(view[:read_bytes])
 
     return file_hash.hexdigest()
 
 
+def compute_multipart_etag(file: Path, part_size: int) -> str:
+    """
+    Returns the checksum an object store reports for the file located at the given path
+    when it is uploaded in parts of the given size, i.e. the md5sum of the concatenated
+    md5sums of all parts followed by the number of parts.
+    """
+    if not file.is_file():
+        raise ValueError(
+            "The provided file does not exist or not a (symlink to a) regular file"
+        )
+
+    part_digests = []
+    with SecurePath(file).open("rb", read_file_limit_mb=UNLIMITED) as f:
+        buffer = bytearray(min(CHUNK_SIZE_BYTES, part_size))
+        view = memoryview(buffer)
+        while True:
+            part_hash = hashlib.md5()
+            remaining = part_size
+            while remaining > 0 and (read_bytes := f.readinto(view[:remaining])):
+                part_hash.update(view[:read_bytes])
+                remaining -= read_bytes
+            if remaining == part_size:
+                break
+            part_digests.append(part_hash.digest())
+            if remaining > 0:
+                break
+
+    return f"{hashlib.md5(b''.join(part_digests)).hexdigest()}-{len(part_digests)}"
+
+
+class ChecksumCache:
+    """
+    Persistent cache of local checksums, keyed by the path of each file relative
+    to the cached directory and validated against its size, mtime and inode.
+    Only entries looked up since the cache was loaded are written back by save(),
+    so files that no longer exist are evicted automatically.
+    Lookups are thread-safe.
+    """
+
+    def __init__(self, path: Path):
+        self._path = path
+        self._entries: Dict[str, List] = self._load()
+        self._seen: Dict[str, List] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def _load(self) -> Dict[str, List]:
+        spath = SecurePath(self._path)
+        if not spath.exists():
+            return {}
+        try:
+            data = json.loads(spath.read_text(file_size_limit_mb=UNLIMITED))
+        except (OSError, ValueError):
+            log.debug("Ignoring unreadable checksum cache %s", self._path)
+            return {}
+        if not isinstance(data, dict) or data.get("version") != CHECKSUM_CACHE_VERSION:
+            return {}
+        return data.get("entries", {})
+
+    def md5sum(self, relpath: str, file: Path, part_size: Optional[int] = None) -> str:
+        """
+        Returns the md5sum of the given file, or its multipart ETag if a part size is
+        given, only reading its contents if the file changed since it was cached.
+        """
+        kind = f"multipart-{part_size}" if part_size else "md5"
+        stat = file.stat()
+        key = [stat.st_size, stat.st_mtime_ns, stat.st_ino]
+        entry = self._entries.get(relpath)
+        digests: Dict[str, str] = (
+            entry[3] if entry is not None and entry[:3] == key else {}
+        )
+        is_hit = kind in digests
+        if is_hit:
+            digest = digests[kind]
+        elif part_size:
+            digest = compute_multipart_etag(file, part_size)
+        else:
+            digest = compute_md5sum(file)
+        with self._lock:
+            if is_hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+            self._seen[relpath] = [*key, {**digests, kind: digest}]
+        return digest
+
+    def save(self) -> None:
+        evicted = len(self._entries.keys() - self._seen.keys())
+        log.debug(
+            "Checksum cache %s: %d hits, %d misses, %d evicted",
+            self._path,
+            self.hits,
+            self.misses,
+            evicted,
+        )
+        newest_cacheable_mtime = time.time_ns() - CHECKSUM_CACHE_MIN_AGE_NS
+        entries = {
+            relpath: entry
+            for relpath, entry in self._seen.items()
+            if entry[1] < newest_cacheable_mtime
+        }
+        try:
+            SecurePath(self._path).write_text(
+                json.dumps({"version": CHECKSUM_CACHE_VERSION, "entries": entries})
+            )
+        except OSError as err:
+            log.debug("Could not write checksum cache %s: %s", self._path, err)
+
+
 def enumerate_files(path: Path) -> List[Path]:
     """
     Get a list of all files in a directory (recursively).
@@ -130,8 +312,12 @@ def enumerate_files(path: Path) -> List[Path]:
         raise ValueError("Path must point to a directory")
 
     paths: List[Path] = []
-    for child in sorted(path.iterdir()):
-        if child.is_dir():
+    with os.scandir(path) as it:
+        # scandir caches file types, saving a stat() call per entry
+        entries = sorted(it, key=lambda entry: entry.name)
+    for entry in entries:
+        child = path / entry.name
+        if entry.is_dir():
             paths += enumerate_files(child)
         else:
             paths.append(child)
@@ -144,39 +330,121 @@ def strip_stage_name(path: str) -> str:
     return "/".join(path.split("/")[1:])
 
 
+class StageFileInfo(NamedTuple):
+    size: int
+    md5: str
+
+
+def build_stage_file_map(
+    list_stage_cursor: SnowflakeCursor,
+) -> Dict[str, StageFileInfo]:
+    """
+    Returns a mapping of relative stage paths to their sizes and md5sums.
+    """
+    stage_files = {}
+    for row in list_stage_cursor.fetchall():
+        if isinstance(row, dict):
+            name, size, md5 = row["name"], row["size"], row["md5"]
+        else:
+            name, size, md5, _ = row
+        stage_files[strip_stage_name(name)] = StageFileInfo(size, md5)
+    return stage_files
+
+
 def build_md5_map(list_stage_cursor: SnowflakeCursor) -> Dict[str, str]:
     """
     Returns a mapping of relative stage paths to their md5sums.
     """
     return {
-        strip_stage_name(name): md5
-        for (name, size, md5, modified) in list_stage_cursor.fetchall()
+        relpath: info.md5
+        for relpath, info in build_stage_file_map(list_stage_cursor).items()
     }
 
 
-def stage_diff(local_path: Path, stage_fqn: str) -> DiffResult:
+def stage_diff(
+    local_path: Path,
+    stage_fqn: str,
+    use_checksum_cache: bool = False,
+    compare_sizes: bool = False,
+) -> DiffResult:
     """
     Diffs the files in a stage with a local folder.
+    If use_checksum_cache is True, checksums of local files are cached in
+    the local folder and only recomputed for files that changed.
+    If compare_sizes is True, files with a different size than on the stage
+    are considered different without computing their checksums.
     """
     stage_manager = StageManager()
-    local_files = enumerate_files(local_path)
-    remote_md5 = build_md5_map(stage_manager.list_files(stage_fqn))
+    checksum_cache = (
+        ChecksumCache(local_path / CHECKSUM_CACHE_FILENAME)
+        if use_checksum_cache
+        else None
+    )
+
+    def local_checksum(relpath: str, stage_checksum: str) -> Optional[str]:
+        """
+        Computes the local counterpart of the checksum reported by the stage,
+        or returns None if the stage checksum is not in a known format.
+        """
+        local_file = local_files[relpath]
+        part_size: Optional[int] = None
+        if not is_valid_md5sum(stage_checksum):
+            parts = get_multipart_parts(stage_checksum)
+            if parts is None:
+                return None
+            file_size = local_file.stat().st_size
+            part_size = get_multipart_chunk_size(file_size)
+            if math.ceil(file_size / part_size) != parts:
+                # the file was uploaded with a part size we cannot reproduce
+                return None
+
+        if checksum_cache:
+            return checksum_cache.md5sum(relpath, local_file, part_size)
+        if part_size:
+            return compute_multipart_etag(local_file, part_size)
+        return compute_md5sum(local_file)
+
+    with ThreadPoolExecutor(max_workers=MAX_HASHING_WORKERS) as executor:
+        # walk the local directory while the stage is being listed
+        stage_listing = executor.submit(stage_manager.list_files, stage_fqn)
+        local_files = {
+            str(local_file.relative_to(local_path)): local_file
+            for local_file in enumerate_files(local_path)
+        }
+        local_files.pop(CHECKSUM_CACHE_FILENAME, None)
+        remote_files = build_stage_file_map(stage_listing.result())
+
+        # N.B. the size reported by the stage may not always match the size of the
+        # local file (e.g. for client-side encrypted stages), so size comparison
+        # is opt-in and only used to skip the relatively-expensive checksums.
+        comparable = [
+            relpath
+            for relpath in local_files
+            if relpath in remote_files
+            and not (
+                compare_sizes
+                and local_files[relpath].stat().st_size != remote_files[relpath].size
+            )
+        ]
+        local_checksums = dict(
+            zip(
+                comparable,
+                executor.map(
+                    lambda relpath: local_checksum(relpath, remote_files[relpath].md5),
+                    comparable,
+                ),
+            )
+        )
 
     result: DiffResult = DiffResult()
 
-    for local_file in local_files:
-        relpath = str(local_file.relative_to(local_path))
-        if relpath not in remote_md5:
+    for relpath in local_files:
+        if relpath not in remote_files:
             # doesn't exist on the stage
             result.only_local.append(relpath)
         else:
-            # N.B. we could compare local size vs remote size to skip the relatively-
-            # expensive md5sum operation, but after seeing a comment that says the value
-            # may not always be correctly populated, we'll ignore that column.
-            stage_md5sum = remote_md5[relpath]
-            if is_valid_md5sum(stage_md5sum) and stage_md5sum == compute_md5sum(
-                local_file
-            ):
+            checksum = local_checksums.get(relpath)
+            if checksum is not None and checksum == remote_files[relpath].md5.lower():
                 # the file definitely hasn't changed
                 result.identical.append(relpath)
             else:
@@ -184,12 +452,15 @@ def stage_diff(local_path: Path, stage_fqn: str) -> DiffResult:
                 result.different.append(relpath)
 
             # mark this file as seen
-            del remote_md5[relpath]
+            del remote_files[relpath]
 
     # every entry here is a file we never saw locally
-    for relpath in remote_md5.keys():
+    for relpath in remote_files.keys():
         result.only_on_stage.append(relpath)
 
+    if checksum_cache:
+        checksum_cache.save()
+
     return result
 
 
@@ -199,17 +470,131 @@ def get_stage_path_from_file(filepath: str):
     return stage_path
 
 
+def group_stale_paths(
+    only_on_stage: List[str], remaining_on_stage: Optional[List[str]] = None
+) -> Tuple[List[str], List[str]]:
+    """
+    Splits stale stage paths into the topmost stage directories that contain
+    no remaining files, and the stale files outside of those directories.
+    Without a list of remaining files, no directory is considered stale.
+    """
+    if remaining_on_stage is None:
+        return [], list(only_on_stage)
+
+    live_directories: Set[str] = set()
+    for remaining in remaining_on_stage:
+        parts = remaining.split("/")[:-1]
+        for depth in range(1, len(parts) + 1):
+            live_directories.add("/".join(parts[:depth]))
+
+    stale_directories: Set[str] = set()
+    stale_files: List[str] = []
+    for stale in only_on_stage:
+        parts = stale.split("/")[:-1]
+        for depth in range(1, len(parts) + 1):
+            directory = "/".join(parts[:depth])
+            if directory not in live_directories:
+                stale_directories.add(directory)
+                break
+        else:
+            stale_files.append(stale)
+
+    return sorted(stale_directories), stale_files
+
+
 def delete_only_on_stage_files(
     stage_manager: StageManager,
     stage_fqn: str,
     only_on_stage: List[str],
     role: Optional[str] = None,
-):
+    remaining_on_stage: Optional[List[str]] = None,
+) -> List[str]:
     """
     Deletes all files from a Snowflake stage according to the input list of filenames, using a custom role.
+    Directories without any of the remaining_on_stage files are removed with one statement each,
+    and all other files are removed in bulk. Returns the deleted files.
     """
+    if not only_on_stage:
+        return []
+
+    stale_directories, stale_files = group_stale_paths(
+        only_on_stage, remaining_on_stage
+    )
+    with stage_manager.use_role(role) if role else nullcontext():
+        for directory in stale_directories:
+            stage_manager.remove(stage_name=stage_fqn, path=f"{directory}/")
+        if stale_files:
+            stage_manager.remove_files(stage_name=stage_fqn, paths=stale_files)
+
     for _file in only_on_stage:
-        stage_manager.remove(stage_name=stage_fqn, path=_file, role=role)
+        log.debug("Removed %s from stage %s", _file, stage_fqn)
+    return list(only_on_stage)
+
+
+def group_files_by_stage_path(files: List[str]) -> Dict[str, List[str]]:
+    """
+    Groups relative file paths by the stage directory they should be uploaded to.
+    """
+    groups: Dict[str, List[str]] = {}
+    for _file in files:
+        groups.setdefault(get_stage_path_from_file(_file), []).append(_file)
+    return groups
+
+
+def _can_upload_with_wildcard(local_dir: Path, files: List[str]) -> bool:
+    """
+    Whether a "<local_dir>/*" PUT would upload exactly the given files. The connector
+    expands the wildcard with glob, which skips hidden files and fails on directories.
+    """
+    if glob.has_magic(str(local_dir)) or not local_dir.is_dir():
+        return False
+
+    names = {Path(_file).name for _file in files}
+    with os.scandir(local_dir) as entries:
+        entry_names = set()
+        for entry in entries:
+            if entry.name.startswith(".") or not entry.is_file():
+                return False
+            entry_names.add(entry.name)
+    return entry_names == names
+
+
+def _plan_put_requests(
+    stage_fqn: str, deploy_root_path: Path, files: List[str]
+) -> List[_PutRequest]:
+    """
+    Returns the PUT statements required to upload the given files, using a single
+    wildcard PUT for every stage directory that can be uploaded as a whole.
+    """
+    requests: List[_PutRequest] = []
+    for stage_sub_path, group in group_files_by_stage_path(files).items():
+        full_stage_path = (
+            f"{stage_fqn}/{stage_sub_path}" if stage_sub_path else stage_fqn
+        )
+        local_dir = deploy_root_path / stage_sub_path
+        if len(group) > 1 and _can_upload_with_wildcard(local_dir, group):
+            requests.append(_PutRequest(local_dir / "*", full_stage_path, group))
+        else:
+            requests.extend(
+                _PutRequest(deploy_root_path / _file, full_stage_path, [_file])
+                for _file in group
+            )
+    return requests
+
+
+def _skipped_sources(put_cursor: SnowflakeCursor) -> Set[str]:
+    """
+    Returns the names of the source files that a PUT statement did not upload.
+    """
+    columns = [column.name.lower() for column in put_cursor.description or []]
+    if "source" not in columns or "status" not in columns:
+        return set()
+    source_idx, status_idx = columns.index("source"), columns.index("status")
+    return {
+        row[source_idx]
+        for row in put_cursor.fetchall()
+        if str(row[status_idx]).upper() == "SKIPPED"
+    }
 
 
 def put_files_on_stage(
@@ -219,26 +604,45 @@ def put_files_on_stage(
     files: List[str],
     role: Optional[str] = None,
     overwrite: bool = False,
-):
+    max_workers: int = MAX_UPLOAD_WORKERS,
+) -> UploadResult:
     """
     Uploads all files given input list of filenames on your local filesystem, to a Snowflake stage, using a custom role.
+    Files are grouped by stage directory and uploaded with as few PUT statements as possible,
+    running up to max_workers statements concurrently. The role is switched once for the whole upload.
     """
-    for _file in files:
-        stage_sub_path = get_stage_path_from_file(_file)
-        full_stage_path = (
-            f"{stage_fqn}/{stage_sub_path}" if stage_sub_path else stage_fqn
-        )
-        stage_manager.put(
-            local_path=deploy_root_path / _file,
-            stage_path=full_stage_path,
-            role=role,
+    requests = _plan_put_requests(stage_fqn, deploy_root_path, files)
+    log.debug(
+        "Uploading %d files to %s using %d PUT statements",
+        len(files),
+        stage_fqn,
+        len(requests),
+    )
+
+    def _put(request: _PutRequest) -> Tuple[_PutRequest, Set[str]]:
+        cursor = stage_manager.put(
+            local_path=request.local_path,
+            stage_path=request.stage_path,
             overwrite=overwrite,
         )
+        return request, _skipped_sources(cursor)
+
+    result = UploadResult()
+    with stage_manager.use_role(role) if role else nullcontext():
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            for request, skipped in executor.map(_put, requests):
+                for _file in request.files:
+                    if Path(_file).name in skipped:
+                        result.skipped.append(_file)
+                    else:
+                        result.uploaded.append(_file)
+
+    return result
 
 
 def sync_local_diff_with_stage(
     role: str, deploy_root_path: Path, diff_result: DiffResult, stage_path: str
-):
+) -> UploadResult:
     """
     Syncs a given local directory's contents with a Snowflake stage, including removing old files, and re-uploading modified and new files.
     """
@@ -250,20 +654,32 @@ def sync_local_diff_with_stage(
 
     try:
         delete_only_on_stage_files(
-            stage_manager, stage_path, diff_result.only_on_stage, role
+            stage_manager,
+            stage_path,
+            diff_result.only_on_stage,
+            role,
+            remaining_on_stage=diff_result.identical + diff_result.different,
         )
-        put_files_on_stage(
+        # new files cannot collide with anything on the stage, so they can share
+        # the overwriting PUT statements of the modified files in the same directory
+        upload_result = put_files_on_stage(
             stage_manager,
             stage_path,
             deploy_root_path,
-            diff_result.different,
+            diff_result.different + diff_result.only_local,
             role,
             overwrite=True,
         )
-        put_files_on_stage(
-            stage_manager, stage_path, deploy_root_path, diff_result.only_local, role
-        )
     except Exception as err:
         # Could be ProgrammingError or IntegrityError from SnowflakeCursor
         log.error(err)
         raise SnowflakeSQLExecutionError()
+
+    log.info(
+        "Uploaded %d files, %d files were already up-to-date.",
+        len(upload_result.uploaded),
+        len(upload_result.skipped),
+    )
+    for skipped in upload_result.skipped:
+        log.debug("Skipped upload of unchanged file %s", skipped)
+    return upload_result
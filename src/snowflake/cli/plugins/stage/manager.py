@@ -4,11 +4,13 @@ import fnmatch
 import glob
 import logging
 import re
+from concurrent.futures import FIRST_EXCEPTION, Future, ThreadPoolExecutor, wait
 from contextlib import nullcontext
 from dataclasses import dataclass
+from itertools import groupby
 from os import path
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from click import ClickException
 from snowflake.cli.api.commands.flags import OnErrorType
@@ -25,6 +27,15 @@ log = logging.getLogger(__name__)
 
 UNQUOTED_FILE_URI_REGEX = r"[\w/*?\-.=&{}$#[\]\"\\!@%^+:]+"
 EXECUTE_SUPPORTED_FILES_FORMATS = {".sql"}
+# keeps "remove ... pattern = '...'" statements well below the statement size limit
+MAX_REMOVE_PATTERN_LENGTH = 64 * 1024
+# unlike re.escape, escapes only special characters of regular expressions, since
+# Snowflake may not treat other escaped characters, e.g. "\-" or "\ ", as literals
+_REGEX_SPECIAL_CHARACTERS = re.compile(r"([.^$*+?()[\]{}|\\])")
+
+
+def _escape_regex(text: str) -> str:
+    return _REGEX_SPECIAL_CHARACTERS.sub(r"\\\1", text)
 
 
 @dataclass
@@ -180,6 +191,52 @@ class StageManager(SqlExecutionMixin):
             quoted_stage_name = self.quote_stage_name(f"{stage_name}{path}")
             return self._execute_query(f"remove {quoted_stage_name}")
 
+    @staticmethod
+    def _build_remove_patterns(paths: List[str]) -> List[str]:
+        """
+        Returns regular expressions matching exactly the given paths (relative to the
+        stage root) in the output of "ls", each no longer than MAX_REMOVE_PATTERN_LENGTH
+        unless a single path is longer than that.
+        """
+        prefix, suffix = "[^/]*/(", ")"
+        patterns: List[str] = []
+        alternatives: List[str] = []
+        length = len(prefix) + len(suffix)
+        for stage_path in paths:
+            alternative = _escape_regex(stage_path.lstrip("/"))
+            if (
+                alternatives
+                and length + len(alternative) + 1 > MAX_REMOVE_PATTERN_LENGTH
+            ):
+                patterns.append(prefix + "|".join(alternatives) + suffix)
+                alternatives, length = [], len(prefix) + len(suffix)
+            alternatives.append(alternative)
+            length += len(alternative) + 1
+        if alternatives:
+            patterns.append(prefix + "|".join(alternatives) + suffix)
+        return patterns
+
+    def remove_files(
+        self, stage_name: str, paths: List[str], role: Optional[str] = None
+    ) -> List[SnowflakeCursor]:
+        """
+        Removes many files from the root of a stage at once, using as few
+        "remove ... pattern = '...'" statements as possible.
+        If provided with a role, then temporarily use this role to perform the operation above,
+        and switch back to the original role for the next commands to run.
+        """
+        cursors: List[SnowflakeCursor] = []
+        with self.use_role(role) if role else nullcontext():
+            stage_name = self.get_standard_stage_prefix(stage_name)
+            quoted_stage_name = self.quote_stage_name(stage_name)
+            for pattern in self._build_remove_patterns(paths):
+                cursors.append(
+                    self._execute_query(
+                        f"remove {quoted_stage_name} pattern = {to_string_literal(pattern)}"
+                    )
+                )
+        return cursors
+
     def create(self, stage_name: str, comment: Optional[str] = None) -> SnowflakeCursor:
         query = f"create stage if not exists {stage_name}"
         if comment:
@@ -195,6 +252,7 @@ class StageManager(SqlExecutionMixin):
         stage_path: str,
         on_error: OnErrorType,
         variables: Optional[List[str]] = None,
+        parallel: int = 1,
     ):
         stage_path = self.get_standard_stage_prefix(stage_path)
         all_files_list = self._get_files_list_from_stage(stage_path)
@@ -210,25 +268,96 @@ class StageManager(SqlExecutionMixin):
         )
 
         sql_variables = self._parse_execute_variables(variables)
-        results = []
-        for file in sorted_file_list:
-            results.append(
+        if parallel <= 1:
+            return [
                 self._call_execute_immediate(
                     file=file, variables=sql_variables, on_error=on_error
                 )
-            )
+                for file in sorted_file_list
+            ]
 
+        # files in the same directory run concurrently, but each directory
+        # starts only after all files of the previous one were executed
+        results = []
+        with ThreadPoolExecutor(max_workers=parallel) as executor:
+            for _, directory_files in groupby(sorted_file_list, key=path.dirname):
+                results += self._execute_files_concurrently(
+                    executor, list(directory_files), sql_variables, on_error
+                )
         return results
 
+    def _execute_files_concurrently(
+        self,
+        executor: ThreadPoolExecutor,
+        files: List[str],
+        variables: Optional[str],
+        on_error: OnErrorType,
+    ) -> List[Dict]:
+        futures: List[Future] = [
+            executor.submit(
+                self._call_execute_immediate,
+                file=file,
+                variables=variables,
+                on_error=on_error,
+            )
+            for file in files
+        ]
+        # with OnErrorType.BREAK, files that did not start yet are skipped after
+        # the first failure; the error of the first failed file is raised
+        wait(futures, return_when=FIRST_EXCEPTION)
+        for future in futures:
+            future.cancel()
+        return [future.result() for future in futures if not future.cancelled()]
+
     def _get_files_list_from_stage(self, stage_path: str) -> List[str]:
         stage_name = self.get_stage_name_from_path(stage_path)
-        files_list_result = self.list_files(stage_name).fetchall()
+        location, pattern = self._get_listing_scope(stage_name, stage_path)
+        query = f"ls {self.quote_stage_name(location)}"
+        if pattern is not None:
+            query += f" pattern = {to_string_literal(pattern)}"
+        files_list_result = self._execute_query(
+            query, cursor_class=DictCursor
+        ).fetchall()
 
         if not files_list_result:
-            raise ClickException(f"No files found on stage '{stage_name}'")
+            if location == stage_name and pattern is None:
+                raise ClickException(f"No files found on stage '{stage_name}'")
+            raise ClickException(f"No files matched pattern '{stage_path}'")
 
         return [f["name"] for f in files_list_result]
 
+    @staticmethod
+    def _get_listing_scope(
+        stage_name: str, stage_path: str
+    ) -> Tuple[str, Optional[str]]:
+        """
+        Narrows down "ls" of the stage to the files that may match the stage path:
+        returns the longest directory of the path without wildcards, and a regular
+        expression for the rest of the path, or None if it would match everything.
+        The result is still filtered by _filter_files_list, so the expression
+        may match more files than the glob, but never fewer.
+        """
+        if glob.has_magic(stage_name) or not stage_path.startswith(stage_name):
+            return stage_name, None
+        # _filter_files_list matches the lowercase path
+        relative_path = stage_path[len(stage_name) :].lstrip("/").lower()
+        magic = re.search(r"[*?[]", relative_path)
+        literal_part = relative_path[: magic.start()] if magic else relative_path
+        directory = literal_part[: literal_part.rfind("/") + 1]
+        location = f"{stage_name.rstrip('/')}/{directory}" if directory else stage_name
+
+        rest = relative_path[len(directory) :]
+        if not magic:
+            # path to a file or a directory matches all paths starting with it
+            rest += "*"
+        if rest == "*" or "[" in rest:
+            return location, None
+        pattern = "".join(
+            ".*" if char == "*" else "." if char == "?" else _escape_regex(char)
+            for char in rest
+        )
+        return location, f".*/{pattern}"
+
     def _filter_files_list(
         self, stage_path: str, files_on_stage: List[str]
     ) -> List[str]:
@@ -1,5 +1,6 @@
 import logging
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
 import typer
@@ -17,9 +18,11 @@ from snowflake.cli.api.output.types import (
     MessageResult,
     SingleQueryResult,
 )
-from snowflake.cli.api.project.schemas.streamlit.streamlit import Streamlit
 from snowflake.cli.plugins.streamlit.manager import StreamlitManager
 
+if TYPE_CHECKING:
+    from snowflake.cli.api.project.schemas.streamlit.streamlit import Streamlit
+
 app = SnowTyper(
     name="streamlit",
     help="Manages a Streamlit app in Snowflake.",
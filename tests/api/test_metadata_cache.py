@@ -0,0 +1,142 @@
+from unittest import mock
+
+import pytest
+from snowflake.cli.api.cli_global_context import cli_context
+from snowflake.cli.api.metadata_cache import ObjectMetadataCache
+from snowflake.cli.api.sql_execution import SqlExecutionMixin
+from snowflake.cli.plugins.object.manager import ObjectManager
+from snowflake.connector import ProgrammingError
+from snowflake.connector.cursor import DictCursor
+
+MIXIN = "snowflake.cli.api.sql_execution.SqlExecutionMixin"
+CONTEXT = ("ROLE", "DB", "SCHEMA")
+
+
+def test_get_returns_default_for_unknown_object():
+    cache = ObjectMetadataCache()
+    cache.put(CONTEXT, "applications", "myapp", None, None)
+
+    assert cache.get(CONTEXT, "applications", "MYAPP", "", default=1) is None
+    assert cache.get(CONTEXT, "applications", '"myapp"', None, default=1) == 1
+    assert cache.get(("OTHER", "", ""), "applications", "myapp", None, 1) == 1
+
+
+@pytest.mark.parametrize(
+    "statement, invalidated",
+    [
+        ("select * from myapp", False),
+        ("show applications", False),
+        ("drop application MyApp", True),
+        ("alter application db.schema.myapp upgrade", True),
+        ('create application "MYAPP" from application package pkg', True),
+        ("drop application other_app", False),
+        ('drop application "myapp"', False),
+    ],
+)
+def test_observe_invalidates_objects_mentioned_in_ddl(statement, invalidated):
+    cache = ObjectMetadataCache()
+    cache.put(CONTEXT, "applications", "myapp", None, {"name": "MYAPP"})
+
+    cache.observe(statement)
+
+    cached = cache.get(CONTEXT, "applications", "myapp", None, default=None)
+    assert (cached is None) == invalidated
+
+
+def test_observe_ddl_forgets_listings():
+    cache = ObjectMetadataCache()
+    cache.put_listing(CONTEXT, "tables", "in schema s", [{"name": "T"}])
+    cache.observe("select 1")
+    assert cache.get_listing(CONTEXT, "tables", "in  schema S") == [{"name": "T"}]
+
+    cache.observe("create table t2 (i int)")
+    assert cache.get_listing(CONTEXT, "tables", "in schema s") is None
+
+
+@pytest.fixture
+def known_role():
+    cli_context.session_state.role = "test_role"
+    yield
+
+
+@mock.patch(f"{MIXIN}._execute_query")
+def test_show_specific_object_is_cached(mock_execute, mock_cursor, known_role):
+    mock_execute.return_value = mock_cursor([{"name": "MYAPP", "owner": "R"}], [])
+    mixin = SqlExecutionMixin()
+
+    for _ in range(3):
+        assert mixin.show_specific_object("applications", "myapp") == {
+            "name": "MYAPP",
+            "owner": "R",
+        }
+
+    mock_execute.assert_called_once_with(
+        "show applications like 'MYAPP'", cursor_class=DictCursor
+    )
+
+
+@mock.patch(f"{MIXIN}._execute_query")
+def test_show_specific_object_is_not_cached_without_known_role(
+    mock_execute, mock_cursor
+):
+    mock_execute.side_effect = [
+        mock_cursor([{"name": "MYAPP"}], []),
+        mock_cursor([], []),
+    ]
+    mixin = SqlExecutionMixin()
+
+    assert mixin.show_specific_object("applications", "myapp") == {"name": "MYAPP"}
+    assert mixin.show_specific_object("applications", "myapp") is None
+    assert mock_execute.call_count == 2
+
+
+@mock.patch(f"{MIXIN}._execute_query")
+def test_show_specific_object_uses_prefetched_listing(
+    mock_execute, mock_cursor, known_role
+):
+    mock_execute.return_value = mock_cursor(
+        [{"name": "STREAMLIT_A"}, {"name": "STREAMLIT_B"}], []
+    )
+    mixin = SqlExecutionMixin()
+
+    mixin.prefetch_objects("streamlits", "in schema db.s")
+
+    assert mixin.show_specific_object("streamlits", "db.s.streamlit_b") == {
+        "name": "STREAMLIT_B"
+    }
+    assert mixin.show_specific_object("streamlits", "db.s.missing") is None
+    mock_execute.assert_called_once_with(
+        "show streamlits in schema db.s", cursor_class=DictCursor
+    )
+
+
+@mock.patch(f"{MIXIN}._execute_query")
+def test_listed_objects_are_not_cached(mock_execute, mock_cursor, known_role):
+    mock_execute.return_value = mock_cursor([{"name": "STREAMLIT_A"}], [])
+    mixin = SqlExecutionMixin()
+
+    assert mixin.list_objects("streamlits", "in schema db.s") == [
+        {"name": "STREAMLIT_A"}
+    ]
+    mixin.show_specific_object("streamlits", "db.s.streamlit_a")
+
+    assert mock_execute.call_count == 2
+
+
+@mock.patch(f"{MIXIN}._execute_query")
+def test_object_exists_reuses_outcome_of_describe(
+    mock_execute, mock_cursor, known_role
+):
+    mock_execute.side_effect = [
+        mock_cursor([("name", "MYFUNC")], []),
+        ProgrammingError("does not exist or not authorized"),
+    ]
+    om = ObjectManager()
+
+    om.describe(object_type="function", name="myfunc()")
+    with pytest.raises(ProgrammingError):
+        om.describe(object_type="function", name="other()")
+
+    assert om.object_exists(object_type="function", name="myfunc()")
+    assert not om.object_exists(object_type="function", name="other()")
+    assert mock_execute.call_count == 2
@@ -0,0 +1,115 @@
+from unittest import mock
+
+import pytest
+from snowflake.cli.api.session_state import SessionState
+from snowflake.cli.api.sql_execution import SqlExecutionMixin
+from snowflake.connector import ProgrammingError
+from snowflake.connector.cursor import DictCursor
+
+MIXIN = "snowflake.cli.api.sql_execution.SqlExecutionMixin"
+
+
+def _state(**values) -> SessionState:
+    state = SessionState()
+    for key, value in values.items():
+        setattr(state, key, value)
+    return state
+
+
+def _context(state: SessionState):
+    return state.role, state.warehouse, state.database, state.schema
+
+
+@pytest.mark.parametrize(
+    "statement, expected",
+    [
+        ("use role accountadmin", _state(role="accountadmin", database="db")),
+        ('USE ROLE "My Role";', _state(role='"My Role"', database="db")),
+        (
+            "-- comment\nuse warehouse wh",
+            _state(role="r", warehouse="wh", database="db"),
+        ),
+        ("use database other", _state(role="r", database="other")),
+        ("use other", _state(role="r", database="other")),
+        ("use schema sch", _state(role="r", database="db", schema="sch")),
+        ("use schema d.s", _state(role="r", database="d", schema="s")),
+        ("use d.s", _state(role="r", database="d", schema="s")),
+        ("select 1", _state(role="r", database="db")),
+        ("create table t (i int)", _state(role="r", database="db")),
+        ("create or replace schema s", _state(role="r")),
+        ("drop database db", _state(role="r")),
+        ("call my_procedure()", _state()),
+        ("execute immediate from @stage/file.sql", _state()),
+        ("begin use role r2; end", _state()),
+        ("use secondary roles all", _state()),
+    ],
+)
+def test_observe(statement, expected):
+    state = _state(role="r", database="db")
+    state.observe(statement)
+    assert _context(state) == _context(expected)
+
+
+@mock.patch(f"{MIXIN}._execute_query")
+def test_use_role_queries_current_role_once(mock_execute, mock_cursor):
+    mock_execute.return_value = mock_cursor([{"CURRENT_ROLE()": "old_role"}], [])
+    mixin = SqlExecutionMixin()
+
+    for _ in range(3):
+        with mixin.use_role("new_role"):
+            with mixin.use_role("NEW_ROLE"):
+                pass
+
+    assert mock_execute.mock_calls == [
+        mock.call("select current_role()", cursor_class=DictCursor),
+        *[mock.call("use role new_role"), mock.call("use role old_role")] * 3,
+    ]
+
+
+@mock.patch(f"{MIXIN}._execute_query")
+def test_use_role_forgets_role_after_failed_switch(mock_execute, mock_cursor):
+    mock_execute.side_effect = [
+        mock_cursor([{"CURRENT_ROLE()": "old_role"}], []),
+        ProgrammingError("Role does not exist"),
+        mock_cursor([{"CURRENT_ROLE()": "old_role"}], []),
+    ]
+    mixin = SqlExecutionMixin()
+
+    with pytest.raises(ProgrammingError):
+        with mixin.use_role("new_role"):
+            pass
+    assert mixin._get_current_role() == "old_role"  # noqa: SLF001
+
+    assert mock_execute.call_count == 3
+
+
+@mock.patch(f"{MIXIN}._execute_query")
+def test_use_warehouse_skips_redundant_switch(mock_execute):
+    mixin = SqlExecutionMixin()
+
+    mixin.use_warehouse("wh")
+    mixin.use_warehouse("WH")
+    mixin.use_warehouse("other_wh")
+
+    assert mock_execute.mock_calls == [
+        mock.call("use warehouse wh"),
+        mock.call("use warehouse other_wh"),
+    ]
+
+
+def test_statements_executed_through_mixin_update_session_state():
+    connection = mock.Mock()
+    connection.execute_stream.return_value = iter(
+        [
+            mock.Mock(query="use role r1"),
+            mock.Mock(query="use schema d.s"),
+        ]
+    )
+    mixin = SqlExecutionMixin()
+
+    with mock.patch(f"{MIXIN}._conn", new_callable=mock.PropertyMock) as mock_conn:
+        mock_conn.return_value = connection
+        list(mixin._execute_string("use role r1; use schema d.s"))  # noqa: SLF001
+
+    state = mixin._session_state  # noqa: SLF001
+    assert (state.role, state.database, state.schema) == ("r1", "d", "s")
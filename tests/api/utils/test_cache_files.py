@@ -0,0 +1,21 @@
+import stat
+
+from snowflake.cli.api.utils.cache_files import read_cache_file, write_cache_file
+
+
+def test_cache_file_is_written_readable_only_by_owner(tmp_path):
+    path = tmp_path / "cache" / "test.json"
+
+    write_cache_file(path, {"key": [1, 2]})
+
+    assert read_cache_file(path) == {"key": [1, 2]}
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+    assert stat.S_IMODE(path.parent.stat().st_mode) == 0o700
+
+
+def test_missing_or_unreadable_cache_file_is_ignored(tmp_path):
+    path = tmp_path / "test.json"
+    assert read_cache_file(path) is None
+
+    path.write_text("{")
+    assert read_cache_file(path) is None
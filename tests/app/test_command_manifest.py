@@ -0,0 +1,169 @@
+import json
+import os
+from unittest import mock
+
+import pytest
+from snowflake.cli.app.commands_registration import command_plugins_loader
+from snowflake.cli.app.commands_registration.command_manifest import (
+    CommandManifest,
+    LazyPluginCommand,
+    ManifestPlugin,
+    get_command_manifest_cache_key,
+)
+from snowflake.cli.app.commands_registration.external_plugins_discovery import (
+    ExternalPluginEntryPoint,
+)
+from typer.core import TyperGroup
+
+MANIFEST = "snowflake.cli.app.commands_registration.command_manifest"
+
+
+@pytest.fixture
+def manifest_path(tmp_path, monkeypatch):
+    monkeypatch.setenv("SNOWFLAKE_CLI_FEATURES_ENABLE_LAZY_COMMAND_LOADING", "true")
+    path = tmp_path / "commands_manifest.json"
+    with mock.patch(f"{MANIFEST}.get_command_manifest_path", return_value=path):
+        yield path
+
+
+@pytest.fixture
+def imported_builtin_plugins():
+    with mock.patch.object(
+        command_plugins_loader,
+        "get_builtin_plugin_spec",
+        wraps=command_plugins_loader.get_builtin_plugin_spec,
+    ) as get_plugin_spec:
+        yield get_plugin_spec
+
+
+def _plugin_names(manifest_path):
+    data = json.loads(manifest_path.read_text())
+    return [plugin["name"] for plugin in data["plugins"]]
+
+
+def test_manifest_is_generated_from_all_plugins(manifest_path, runner):
+    result = runner.invoke(["connection", "list"])
+
+    assert result.exit_code == 0, result.output
+    assert {"connection", "sql", "stage", "snowpark"} <= set(
+        _plugin_names(manifest_path)
+    )
+    sql = next(
+        plugin
+        for plugin in json.loads(manifest_path.read_text())["plugins"]
+        if plugin["name"] == "sql"
+    )
+    assert sql["command_path"] == ["sql"]
+    assert "--query" in sql["command"]["options"]
+
+
+def test_only_plugin_of_invoked_command_is_imported(
+    manifest_path, runner, imported_builtin_plugins
+):
+    runner.invoke(["connection", "list"])
+    imported_builtin_plugins.reset_mock()
+
+    result = runner.invoke(["connection", "list"])
+
+    assert result.exit_code == 0, result.output
+    assert "default" in result.output
+    imported_builtin_plugins.assert_called_once_with("connection")
+
+
+def test_stale_manifest_is_regenerated(manifest_path, runner):
+    manifest_path.write_text(
+        json.dumps(
+            {
+                "manifest_version": 1,
+                "cache_key": {"version": "0.0.1"},
+                "plugins": [],
+            }
+        )
+    )
+
+    result = runner.invoke(["connection", "list"])
+
+    assert result.exit_code == 0, result.output
+    data = json.loads(manifest_path.read_text())
+    assert data["cache_key"] == get_command_manifest_cache_key([])
+    assert "connection" in _plugin_names(manifest_path)
+
+
+def test_unreadable_manifest_is_ignored(manifest_path, runner):
+    manifest_path.write_text("{")
+
+    result = runner.invoke(["connection", "list"])
+
+    assert result.exit_code == 0, result.output
+    assert "connection" in _plugin_names(manifest_path)
+
+
+def test_structure_loads_all_commands(manifest_path, runner):
+    runner.invoke(["connection", "list"])
+
+    result = runner.invoke(["--structure"])
+
+    assert result.exit_code == 0, result.output
+    assert "set-default" in result.output
+    assert "list-files" in result.output
+
+
+def test_cache_key_contains_versions_of_external_plugins():
+    entry_point = ExternalPluginEntryPoint(
+        name="hello", value="hello.plugin_spec", distribution="hello", version="1.2.3"
+    )
+
+    with mock.patch(
+        f"{MANIFEST}.discover_external_plugins", return_value={"hello": entry_point}
+    ):
+        cache_key = get_command_manifest_cache_key(["hello", "missing"])
+
+    assert cache_key["external_plugins"] == {"hello": "1.2.3", "missing": None}
+
+
+def test_cache_key_covers_nested_modules_of_builtin_plugins(tmp_path):
+    nested_module = tmp_path / "plugin" / "nested" / "module.py"
+    nested_module.parent.mkdir(parents=True)
+    nested_module.touch()
+    os.utime(nested_module, ns=(1, 1))
+
+    with mock.patch(f"{MANIFEST}._PLUGINS_DIR", tmp_path):
+        before = get_command_manifest_cache_key([])
+        os.utime(nested_module, ns=(2, 2))
+        after = get_command_manifest_cache_key([])
+
+    assert before["builtin_plugins_mtime"] == 1
+    assert after["builtin_plugins_mtime"] == 2
+
+
+def test_placeholders_describe_top_level_commands():
+    node = {
+        "name": "connection",
+        "help": "Manages connections to Snowflake.",
+        "short_help": None,
+        "hidden": False,
+        "deprecated": False,
+        "rich_help_panel": None,
+        "options": [],
+        "commands": [],
+    }
+    nested_node = {**node, "name": "nested"}
+    manifest = CommandManifest(
+        cache_key={},
+        plugins=[
+            ManifestPlugin("nested", False, ["connection", "nested"], nested_node),
+            ManifestPlugin("connection", True, ["connection"], node),
+        ],
+    )
+    group = TyperGroup(name="snow")
+
+    manifest.register_lazy_commands(group)
+
+    assert list(group.commands) == ["connection"]
+    placeholder = group.commands["connection"]
+    assert isinstance(placeholder, LazyPluginCommand)
+    assert placeholder.help == "Manages connections to Snowflake."
+    assert [plugin.name for plugin in placeholder._plugins] == [  # noqa: SLF001
+        "connection",
+        "nested",
+    ]
@@ -0,0 +1,126 @@
+import json
+import os
+from unittest import mock
+
+import pytest
+from snowflake.cli.app.commands_registration.command_plugins_loader import (
+    CommandPluginsLoader,
+)
+from snowflake.cli.app.commands_registration.external_plugins_discovery import (
+    ExternalPluginEntryPoint,
+    discover_external_plugins,
+)
+
+DISCOVERY = "snowflake.cli.app.commands_registration.external_plugins_discovery"
+
+
+def _distribution(name, version, entry_points):
+    distribution = mock.MagicMock(version=version, entry_points=[])
+    distribution.metadata = {"Name": name}
+    for entry_point_name, value in entry_points.items():
+        entry_point = mock.Mock(group="snowflake.cli.plugin.command", value=value)
+        entry_point.name = entry_point_name
+        distribution.entry_points.append(entry_point)
+    return distribution
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    path = tmp_path / "external_plugins.json"
+    with mock.patch(f"{DISCOVERY}.get_external_plugins_cache_path", return_value=path):
+        yield path
+
+
+@pytest.fixture
+def plugins_config():
+    config = {"hello": {"enabled": True}}
+    with mock.patch(f"{DISCOVERY}.get_plugins_config", return_value=config):
+        yield config
+
+
+@pytest.fixture
+def distributions():
+    with mock.patch("importlib.metadata.distributions") as distributions_mock:
+        distributions_mock.return_value = [
+            _distribution("other", "2.0", {}),
+            _distribution("hello-plugin", "1.0", {"hello": "hello.plugin_spec"}),
+        ]
+        yield distributions_mock
+
+
+def test_entry_points_are_found_and_cached(cache_path, plugins_config, distributions):
+    expected = {
+        "hello": ExternalPluginEntryPoint(
+            name="hello",
+            value="hello.plugin_spec",
+            distribution="hello-plugin",
+            version="1.0",
+        )
+    }
+
+    assert discover_external_plugins(["hello", "missing"]) == expected
+    assert discover_external_plugins(["hello", "missing"]) == expected
+
+    assert distributions.call_count == 1
+    cached = json.loads(cache_path.read_text())
+    assert cached["entry_points"]["hello"]["value"] == "hello.plugin_spec"
+
+
+def test_cache_is_rebuilt_when_plugins_config_changes(
+    cache_path, plugins_config, distributions
+):
+    discover_external_plugins(["hello"])
+    plugins_config["hello"]["config"] = {"greeting": "Hi"}
+
+    discover_external_plugins(["hello"])
+
+    assert distributions.call_count == 2
+
+
+def test_cache_is_rebuilt_when_search_path_changes(
+    cache_path, plugins_config, distributions, tmp_path, monkeypatch
+):
+    site_packages = tmp_path / "site-packages"
+    site_packages.mkdir()
+    monkeypatch.syspath_prepend(str(site_packages))
+    discover_external_plugins(["hello"])
+
+    os.utime(site_packages, ns=(0, 0))
+    discover_external_plugins(["hello"])
+
+    assert distributions.call_count == 2
+
+
+def test_unreadable_cache_is_rebuilt(cache_path, plugins_config, distributions):
+    cache_path.write_text("{")
+
+    assert "hello" in discover_external_plugins(["hello"])
+    assert distributions.call_count == 1
+
+
+def test_no_discovery_without_enabled_plugins(cache_path, distributions):
+    assert discover_external_plugins([]) == {}
+
+    distributions.assert_not_called()
+    assert not cache_path.exists()
+
+
+@mock.patch(
+    "snowflake.cli.app.commands_registration.command_plugins_loader.discover_external_plugins"
+)
+def test_loader_registers_plugin_specs_of_discovered_entry_points(discover_mock):
+    discover_mock.return_value = {
+        "custom-sql": ExternalPluginEntryPoint(
+            name="custom-sql",
+            value="snowflake.cli.plugins.sql.plugin_spec",
+            distribution="custom-sql",
+            version="1.0",
+        )
+    }
+    loader = CommandPluginsLoader()
+
+    loader.register_external_plugins(["custom-sql", "missing"])
+
+    loaded_plugins = loader.load_all_registered_plugins()
+    assert [plugin.plugin_name for plugin in loaded_plugins] == ["custom-sql"]
+    assert loaded_plugins[0].command_spec.full_command_path.path_segments == ["sql"]
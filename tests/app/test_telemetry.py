@@ -40,3 +40,21 @@ def test_executing_command_sends_telemetry_data(
         },
         "timestamp": "123",
     }
+
+
+@mock.patch("snowflake.cli.app.telemetry.click.get_current_context")
+def test_telemetry_is_queued_until_flush(_):
+    from snowflake.cli.app.telemetry import CLITelemetryClient
+
+    ctx = mock.Mock()
+    telemetry = ctx.connection._telemetry  # noqa: SLF001
+    ctx.reset_mock()
+    client = CLITelemetryClient(ctx=ctx)
+
+    client.send({"type": "executing_command"})
+    client.send({"type": "executing_command"})
+    assert ctx.mock_calls == []
+
+    client.flush()
+    assert telemetry.try_add_log_to_batch.call_count == 2
+    telemetry.send_batch.assert_called_once_with()
@@ -0,0 +1,101 @@
+from unittest import mock
+
+import pytest
+from click import ClickException
+from snowflake.cli.plugins.batch.manager import parse_commands
+from snowflake.connector.errors import ProgrammingError
+
+
+def test_parse_commands():
+    commands = parse_commands(
+        [
+            "# deploy",
+            "",
+            "snow sql -q 'select 1'",
+            "  stage list-files @stage  # trailing comment",
+        ]
+    )
+
+    assert [(c.line_number, c.args) for c in commands] == [
+        (3, ["sql", "-q", "select 1"]),
+        (4, ["stage", "list-files", "@stage"]),
+    ]
+
+
+def test_parse_commands_reports_line_of_invalid_quoting():
+    with pytest.raises(ClickException, match="Cannot parse line 2"):
+        parse_commands(["sql -q 'select 1'", "sql -q 'select 2"])
+
+
+@mock.patch("snowflake.connector.connect")
+def test_batch_reuses_connection(mock_connect, runner, mock_ctx, caplog):
+    ctx = mock_ctx()
+    mock_connect.return_value = ctx
+
+    result = runner.invoke(
+        ["batch", "--format", "json"],
+        input="sql -q 'select 1'\nsql -q 'select 2' --format csv\nsql -q 'select 3'\n",
+    )
+
+    assert result.exit_code == 0, result.output
+    assert mock_connect.call_count == 1
+    assert ctx.get_queries() == ["select 1", "select 2", "select 3"]
+    assert '"Status": "SUCCESS"' in result.output
+    assert "Cannot register plugin" not in caplog.text
+
+
+@mock.patch("snowflake.connector.connect")
+def test_batch_reconnects_when_connection_options_change(
+    mock_connect, runner, mock_ctx
+):
+    mock_connect.return_value = mock_ctx()
+
+    result = runner.invoke(
+        ["batch"],
+        input="sql -q 'select 1'\nsql -q 'select 2' --role other_role\n",
+    )
+
+    assert result.exit_code == 0, result.output
+    assert mock_connect.call_count == 2
+    assert mock_connect.call_args.kwargs["role"] == "other_role"
+
+
+@mock.patch("snowflake.cli.plugins.sql.manager.SqlExecutionMixin._execute_string")
+def test_batch_stops_on_first_error(mock_execute, runner, mock_cursor):
+    mock_execute.side_effect = [
+        ProgrammingError("Object does not exist"),
+        (mock_cursor(["row"], []) for _ in range(1)),
+    ]
+
+    result = runner.invoke(["batch"], input="sql -q 'select 1'\nsql -q 'select 2'\n")
+
+    assert result.exit_code == 1
+    assert "FAILURE - line 1: sql -q 'select 1'" in result.output
+    assert "Command in line 1 failed: Object does not exist" in result.output
+    assert mock_execute.call_count == 1
+
+
+@mock.patch("snowflake.cli.plugins.sql.manager.SqlExecutionMixin._execute_string")
+def test_batch_continues_on_error(mock_execute, runner, mock_cursor, tmp_path):
+    mock_execute.side_effect = [
+        ProgrammingError("Object does not exist"),
+        (mock_cursor(["row"], []) for _ in range(1)),
+    ]
+    commands_file = tmp_path / "commands.txt"
+    commands_file.write_text("sql -q 'select 1'\nsql --unknown-option\nsql -q 2\n")
+
+    result = runner.invoke(
+        [
+            "batch",
+            "-f",
+            str(commands_file),
+            "--continue-on-error",
+            "--format",
+            "json",
+        ]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert '"Status": "FAILURE"' in result.output
+    assert "No such option: --unknown-option" in result.output
+    assert mock_execute.call_count == 2
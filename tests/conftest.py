@@ -48,6 +48,22 @@ def isolate_snowflake_home(snowflake_home):
     yield snowflake_home
 
 
+# This automatically used fixture prevents commands from connecting to Snowflake
+# in the background, which tests expect to happen only when the connection is used.
+@pytest.fixture(autouse=True)
+def disable_connection_warm_up(monkeypatch):
+    monkeypatch.setenv("SNOWFLAKE_CLI_FEATURES_ENABLE_CONNECTION_WARM_UP", "false")
+    yield
+
+
+# This automatically used fixture makes commands register all plugins, as tests
+# expect, instead of using the command manifest cached between invocations.
+@pytest.fixture(autouse=True)
+def disable_lazy_command_loading(monkeypatch):
+    monkeypatch.setenv("SNOWFLAKE_CLI_FEATURES_ENABLE_LAZY_COMMAND_LOADING", "false")
+    yield
+
+
 def clean_logging_handlers():
     for logger in [logging.getLogger()] + list(
         logging.Logger.manager.loggerDict.values()
@@ -0,0 +1,354 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from datetime import date, datetime, timezone
+from datetime import time as dt_time
+from decimal import Decimal
+from io import BytesIO
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from snowflake.cli.app.snow_connector import connect_to_snowflake
+from snowflake.cli.plugins.daemon.client import DaemonConnection
+from snowflake.cli.plugins.daemon.manager import DaemonManager
+from snowflake.cli.plugins.daemon.protocol import (
+    FAKE_CONNECTOR_ENV,
+    get_socket_path,
+    receive_message,
+    send_message,
+)
+from snowflake.cli.plugins.daemon.server import (
+    ConnectionPool,
+    FakeConnection,
+    changes_session,
+    run_daemon,
+)
+from snowflake.connector import ProgrammingError
+from snowflake.connector.cursor import DictCursor
+from snowflake.connector.errors import NotSupportedError
+
+SERVER = "snowflake.cli.plugins.daemon.server"
+
+
+@pytest.fixture
+def daemon_directory():
+    # the path of a Unix socket must be short, so it is not placed in tmp_path
+    with tempfile.TemporaryDirectory(prefix="snow", dir="/tmp") as tmp_dir:
+        directory = Path(tmp_dir) / "daemon"
+        with mock.patch(
+            "snowflake.cli.plugins.daemon.protocol.get_daemon_directory",
+            return_value=directory,
+        ):
+            yield directory
+
+
+@pytest.fixture
+def fake_daemon(daemon_directory, monkeypatch):
+    monkeypatch.setenv(FAKE_CONNECTOR_ENV, "true")
+    socket_path = get_socket_path()
+    thread = threading.Thread(
+        target=run_daemon, args=(socket_path, 60, True), daemon=True
+    )
+    thread.start()
+    for _ in range(100):
+        if DaemonManager().status() is not None:
+            break
+        time.sleep(0.05)
+    yield socket_path
+    DaemonManager().stop()
+    thread.join(5)
+
+
+def _wait_for_idle_connections(count: int):
+    for _ in range(100):
+        if DaemonManager().status()["idle_connections"] == count:
+            return
+        time.sleep(0.02)
+    raise AssertionError(f"Expected {count} idle connections")
+
+
+@mock.patch("snowflake.connector.connect")
+def test_connect_to_snowflake_uses_running_daemon(mock_connect, fake_daemon):
+    connection = connect_to_snowflake(application="SNOWCLI.TEST")
+
+    assert isinstance(connection, DaemonConnection)
+    assert (connection.role, connection.database) == ("test_role", "db_for_test")
+    mock_connect.assert_not_called()
+
+
+@mock.patch("snowflake.connector.connect")
+def test_sql_is_executed_through_daemon(mock_connect, fake_daemon, runner):
+    result = runner.invoke(["sql", "-q", "select 1; select 2", "--format", "json"])
+
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.output) == [
+        [{"STATEMENT": "select 1;"}],
+        [{"STATEMENT": "select 2"}],
+    ]
+    mock_connect.assert_not_called()
+
+
+def test_cursors_of_daemon_connection(fake_daemon):
+    connection = connect_to_snowflake(application="SNOWCLI.TEST")
+
+    cursor = connection.cursor(DictCursor).execute("show databases")
+    assert cursor.description[0].name == "STATEMENT"
+    assert cursor.fetchall() == [{"STATEMENT": "show databases"}]
+
+    cursor = connection.cursor()
+    cursor.execute_async("select 1")
+    status = connection.get_query_status_throw_if_error(cursor.sfqid)
+    assert not connection.is_still_running(status)
+    cursor.get_results_from_sfqid(cursor.sfqid)
+    assert cursor.fetchone() == ("select 1",)
+    assert cursor.fetchone() is None
+
+
+@pytest.mark.parametrize(
+    "statement, expected",
+    [
+        ("put file://app.zip @stage", "put file://{cwd}/app.zip @stage"),
+        ("put 'file://my dir/*.py' @stage", "put 'file://{cwd}/my dir/*.py' @stage"),
+        ("put file:///tmp/app.zip @stage", "put file:///tmp/app.zip @stage"),
+        ("get @stage/a.txt file://~/out", "get @stage/a.txt file://~/out"),
+    ],
+)
+def test_local_paths_of_file_transfers_are_sent_as_absolute(
+    fake_daemon, statement, expected
+):
+    connection = connect_to_snowflake(application="SNOWCLI.TEST")
+
+    cursor = connection.cursor().execute(statement, _is_put_get=True)
+
+    assert cursor.fetchone() == (expected.format(cwd=os.getcwd()),)
+
+
+def test_execute_arguments_are_forwarded_to_daemon(fake_daemon):
+    connection = connect_to_snowflake(application="SNOWCLI.TEST")
+
+    with mock.patch(f"{SERVER}.FakeCursor.execute") as mock_execute:
+        connection.cursor().execute("select %s", params=[1], timeout=10)
+
+    mock_execute.assert_called_once_with(
+        "select %s", _is_put_get=None, params=[1], timeout=10
+    )
+    with pytest.raises(NotSupportedError, match="file_stream"):
+        connection.cursor().execute("put file://a @s", file_stream=BytesIO())
+
+
+@mock.patch("snowflake.connector.connect")
+def test_attributes_not_served_by_daemon_use_direct_connection(
+    mock_connect, fake_daemon
+):
+    connection = connect_to_snowflake(application="SNOWCLI.TEST", role="test_role")
+    assert connection.role == "test_role"
+    mock_connect.assert_not_called()
+
+    connection._all_async_queries_finished = lambda: False  # noqa: SLF001
+    assert connection._rest is mock_connect.return_value._rest  # noqa: SLF001
+    connection.close()
+
+    mock_connect.assert_called_once()
+    assert mock_connect.call_args.kwargs["application"] == "SNOWCLI.TEST"
+    assert mock_connect.call_args.kwargs["role"] == "test_role"
+    mock_connect.return_value.close.assert_called_once()
+
+
+def test_connections_are_pooled_per_profile(fake_daemon):
+    first = connect_to_snowflake(application="SNOWCLI.TEST")
+    first.close()
+    _wait_for_idle_connections(1)
+
+    second = connect_to_snowflake(application="SNOWCLI.OTHER")
+    assert DaemonManager().status()["idle_connections"] == 0
+    other_profile = connect_to_snowflake(application="SNOWCLI.TEST", role="other_role")
+    assert other_profile.role == "other_role"
+
+    status = DaemonManager().status()
+    assert (status["profiles"], status["connections_in_use"]) == (2, 2)
+    second.close()
+    other_profile.close()
+    _wait_for_idle_connections(2)
+
+
+def test_connection_with_changed_session_is_not_pooled(fake_daemon):
+    connection = connect_to_snowflake(application="SNOWCLI.TEST")
+    connection.cursor().execute("use role other_role")
+    assert connection.role == "other_role"
+    connection.close()
+
+    for _ in range(100):
+        if DaemonManager().status()["connections_in_use"] == 0:
+            break
+        time.sleep(0.02)
+    assert DaemonManager().status()["idle_connections"] == 0
+
+
+def test_errors_are_raised_as_connector_errors(fake_daemon):
+    connection = connect_to_snowflake(application="SNOWCLI.TEST")
+
+    with mock.patch(f"{SERVER}.FakeCursor.execute") as mock_execute:
+        mock_execute.side_effect = ProgrammingError(
+            msg="Object does not exist", errno=2003, sqlstate="02000"
+        )
+        with pytest.raises(ProgrammingError) as err:
+            connection.cursor().execute("select * from missing")
+
+    assert err.value.errno == 2003
+    assert err.value.raw_msg == "Object does not exist"
+
+
+def test_daemon_directory_and_socket_are_private(fake_daemon):
+    assert fake_daemon.parent.stat().st_mode & 0o777 == 0o700
+    assert fake_daemon.stat().st_mode & 0o777 == 0o600
+
+
+@mock.patch("snowflake.connector.connect")
+def test_daemon_is_not_used_if_directory_is_not_private(mock_connect, fake_daemon):
+    fake_daemon.parent.chmod(0o755)
+    try:
+        connect_to_snowflake(application="SNOWCLI.TEST")
+    finally:
+        fake_daemon.parent.chmod(0o700)
+    mock_connect.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"authenticator": "externalbrowser"},
+        {"session_token": "token", "master_token": "token"},
+    ],
+)
+@mock.patch("snowflake.connector.connect")
+def test_daemon_is_not_used_for_connections_which_cannot_be_shared(
+    mock_connect, fake_daemon, overrides
+):
+    connect_to_snowflake(
+        application="SNOWCLI.TEST", temporary_connection=True, **overrides
+    )
+    mock_connect.assert_called_once()
+
+
+@mock.patch("snowflake.connector.connect")
+def test_fake_daemon_is_used_only_by_clients_opting_in(
+    mock_connect, fake_daemon, monkeypatch
+):
+    monkeypatch.delenv(FAKE_CONNECTOR_ENV)
+    assert get_socket_path() != fake_daemon
+
+    connect_to_snowflake(application="SNOWCLI.TEST")
+
+    mock_connect.assert_called_once()
+
+
+@mock.patch("snowflake.connector.connect")
+def test_fake_daemon_is_refused_without_opt_in(mock_connect, daemon_directory):
+    socket_path = get_socket_path()
+    thread = threading.Thread(
+        target=run_daemon, args=(socket_path, 60, True), daemon=True
+    )
+    thread.start()
+    for _ in range(100):
+        if DaemonManager().status() is not None:
+            break
+        time.sleep(0.05)
+    try:
+        connection = connect_to_snowflake(application="SNOWCLI.TEST")
+    finally:
+        DaemonManager().stop()
+        thread.join(5)
+
+    assert connection is mock_connect.return_value
+
+
+def test_daemon_with_fake_connector_requires_opt_in(runner, daemon_directory):
+    result = runner.invoke(["daemon", "start", "--fake-connector"])
+
+    assert result.exit_code == 1
+    assert FAKE_CONNECTOR_ENV in result.output
+
+
+@mock.patch("snowflake.connector.connect")
+def test_connect_to_snowflake_without_daemon(mock_connect, daemon_directory):
+    connect_to_snowflake(application="SNOWCLI.TEST")
+    mock_connect.assert_called_once()
+
+
+def test_idle_connections_expire():
+    pool = ConnectionPool(connect=FakeConnection, idle_timeout=0)
+    connection = pool.acquire("profile", {})
+    pool.release("profile", connection, reuse=True)
+    assert pool.stats()["idle_connections"] == 1
+
+    with mock.patch.object(connection, "close") as mock_close:
+        pool.expire()
+
+    mock_close.assert_called_once()
+    assert pool.is_empty()
+
+
+@pytest.mark.parametrize(
+    "statement, expected",
+    [
+        ("select 1", False),
+        ("create table t (i int)", False),
+        ("drop table t", False),
+        ("use role r", True),
+        ("-- comment\n USE WAREHOUSE wh", True),
+        ("alter session set query_tag = 'x'", True),
+        ("create temporary table t (i int)", True),
+        ("create or replace schema s", True),
+        ("call my_procedure()", True),
+        ("begin transaction", True),
+        ("set x = 1", True),
+    ],
+)
+def test_changes_session(statement, expected):
+    assert changes_session(statement) is expected
+
+
+def test_values_are_sent_with_their_types():
+    values = [
+        datetime(2024, 1, 2, 3, 4, 5, 6, tzinfo=timezone.utc),
+        date(2024, 1, 2),
+        dt_time(3, 4, 5),
+        Decimal("1.10"),
+        b"\x00\xff",
+        1.5,
+        None,
+        "text",
+    ]
+    stream = BytesIO()
+    send_message(stream, {"rows": [values]})
+    stream.seek(0)
+
+    assert receive_message(stream) == {"rows": [values]}
+    assert receive_message(stream) is None
+
+
+def test_daemon_commands_when_not_running(runner, daemon_directory):
+    result = runner.invoke(["daemon", "status"])
+    assert result.exit_code == 0, result.output
+    assert result.output == "Daemon is not running.\n"
+
+    result = runner.invoke(["daemon", "stop"])
+    assert result.exit_code == 0, result.output
+    assert result.output == "Daemon is not running.\n"
+
+
+def test_daemon_status_command(runner, fake_daemon):
+    result = runner.invoke(["daemon", "status", "--format", "json"])
+    assert result.exit_code == 0, result.output
+    status = json.loads(result.output)
+    assert status["pid"] == os.getpid()
+    assert status["fake_connector"] is True
+
+
+def test_daemon_start_fails_if_already_running(runner, fake_daemon):
+    result = runner.invoke(["daemon", "start"])
+    assert result.exit_code == 1
+    assert "Daemon is already running." in result.output
@@ -389,20 +389,29 @@ def test_setup_create_secret_create_api(
 
 
 @pytest.mark.parametrize(
-    "repository_path, expected_files",
+    "repository_path, expected_files, expected_ls",
     [
         (
             "@repo/branches/main/",
             ["repo/branches/main/s1.sql", "repo/branches/main/a/s3.sql"],
+            "ls @repo/branches/main/",
         ),
         (
             "@repo/branches/main/a",
             ["repo/branches/main/a/s3.sql"],
+            "ls @repo/branches/main/ pattern = '.*/a.*'",
+        ),
+        (
+            "@repo/branches/main/a/*.sql",
+            ["repo/branches/main/a/s3.sql"],
+            r"ls @repo/branches/main/a/ pattern = '.*/.*\\.sql'",
         ),
     ],
 )
 @mock.patch(f"{STAGE_MANAGER}._execute_query")
-def test_execute(mock_execute, mock_cursor, runner, repository_path, expected_files):
+def test_execute(
+    mock_execute, mock_cursor, runner, repository_path, expected_files, expected_ls
+):
     mock_execute.return_value = mock_cursor(
         [
             {"name": "repo/branches/main/a/s3.sql"},
@@ -416,7 +425,7 @@ def test_execute(mock_execute, mock_cursor, runner, repository_path, expected_fi
 
     assert result.exit_code == 0, result.output
     ls_call, *execute_calls = mock_execute.mock_calls
-    assert ls_call == mock.call(f"ls @repo/branches/main/", cursor_class=DictCursor)
+    assert ls_call == mock.call(expected_ls, cursor_class=DictCursor)
     assert execute_calls == [
         mock.call(f"execute immediate from @{p}") for p in expected_files
     ]
@@ -1,5 +1,7 @@
+import os
 from pathlib import Path
 from typing import List, Optional
+from unittest import mock
 
 import pytest
 from snowflake.cli.api.project.definition import load_project_definition
@@ -8,11 +10,27 @@ from snowflake.cli.plugins.nativeapp.artifacts import (
     DeployRootError,
     GlobMatchedNothingError,
     NotInDeployRootError,
+    ProjectFileIndex,
     SourceNotFoundError,
     TooManyFilesError,
     build_bundle,
+    symlink_or_copy,
     translate_artifact,
 )
+from snowflake.cli.plugins.stage.diff import CHECKSUM_CACHE_FILENAME
+
+from tests.testing_utils.files_and_dirs import temp_local_dir
+
+INDEX_FILES = {
+    "setup.sql": "",
+    "README.md": "",
+    ".hidden.sql": "",
+    "app/main.py": "",
+    "app/nested/util.py": "",
+    "app/nested/deeper/data.csv": "",
+    "ui/main.py": "",
+    "output/deploy/setup.sql": "",
+}
 
 
 def trimmed_contents(path: Path) -> Optional[str]:
@@ -84,6 +102,91 @@ def test_napp_project_1_artifacts(project_definition_files):
     ]
 
 
+@pytest.mark.parametrize("project_definition_files", ["napp_project_1"], indirect=True)
+def test_rebundle_keeps_checksum_cache(project_definition_files):
+    project_root = project_definition_files[0].parent
+    native_app = load_project_definition(project_definition_files).native_app
+
+    deploy_root = Path(project_root, native_app.deploy_root)
+    artifacts = [translate_artifact(item) for item in native_app.artifacts]
+    build_bundle(project_root, deploy_root, artifacts)
+
+    (deploy_root / CHECKSUM_CACHE_FILENAME).write_text("{}")
+    build_bundle(project_root, deploy_root, artifacts)
+
+    assert trimmed_contents(deploy_root / CHECKSUM_CACHE_FILENAME) == "{}"
+    assert dir_structure(deploy_root) == [
+        CHECKSUM_CACHE_FILENAME,
+        "app/README.md",
+        "setup.sql",
+        "ui/config.py",
+        "ui/main.py",
+    ]
+
+
+@pytest.mark.parametrize("project_definition_files", ["napp_project_1"], indirect=True)
+def test_rebundle_is_incremental(project_definition_files):
+    project_root = project_definition_files[0].parent
+    native_app = load_project_definition(project_definition_files).native_app
+
+    deploy_root = Path(project_root, native_app.deploy_root)
+    artifacts = [translate_artifact(item) for item in native_app.artifacts]
+    build_bundle(project_root, deploy_root, artifacts)
+
+    # unchanged entries are not recreated
+    with mock.patch(
+        "snowflake.cli.plugins.nativeapp.artifacts.symlink_or_copy",
+        wraps=symlink_or_copy,
+    ) as mock_symlink_or_copy:
+        build_bundle(project_root, deploy_root, artifacts)
+        mock_symlink_or_copy.assert_not_called()
+
+        # removed mappings are cleaned up and retargeted mappings are replaced
+        build_bundle(
+            project_root,
+            deploy_root,
+            [
+                ArtifactMapping("setup.sql", "setup.sql"),
+                ArtifactMapping("app/README.md", "ui/main.py"),
+            ],
+        )
+        mock_symlink_or_copy.assert_called_once_with(
+            project_root / "app/README.md", deploy_root.resolve() / "ui/main.py"
+        )
+    assert dir_structure(deploy_root) == ["setup.sql", "ui/main.py"]
+    assert trimmed_contents(deploy_root / "ui" / "main.py") == "app/README.md"
+
+
+@pytest.mark.parametrize("project_definition_files", ["napp_project_1"], indirect=True)
+def test_rebundle_of_copies_is_incremental(project_definition_files):
+    project_root = project_definition_files[0].parent
+    deploy_root = Path(project_root, "output")
+    artifacts = [
+        ArtifactMapping("setup.sql", "setup.sql"),
+        ArtifactMapping("app", "app"),
+    ]
+
+    # copies are made where symlinks cannot be created
+    with mock.patch("os.symlink", side_effect=OSError):
+        build_bundle(project_root, deploy_root, artifacts)
+        with mock.patch(
+            "snowflake.cli.plugins.nativeapp.artifacts.symlink_or_copy",
+            wraps=symlink_or_copy,
+        ) as mock_symlink_or_copy:
+            build_bundle(project_root, deploy_root, artifacts)
+            mock_symlink_or_copy.assert_not_called()
+
+            # a changed file of a copied directory makes the directory copied again
+            (project_root / "app" / "README.md").write_text("changed")
+            build_bundle(project_root, deploy_root, artifacts)
+            mock_symlink_or_copy.assert_called_once_with(
+                project_root / "app", deploy_root.resolve() / "app"
+            )
+
+    assert not (deploy_root / "app").is_symlink()
+    assert trimmed_contents(deploy_root / "app" / "README.md") == "changed"
+
+
 @pytest.mark.parametrize("project_definition_files", ["napp_project_1"], indirect=True)
 def test_source_not_found(project_definition_files):
     project_root = project_definition_files[0].parent
@@ -163,3 +266,61 @@ def test_too_many_files(project_definition_files):
                 ArtifactMapping("app/streamlit/*.py", "somehow_combined_streamlits.py")
             ],
         )
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        "*.sql",
+        "*",
+        "**",
+        "**/*.py",
+        "**/main.py",
+        "app/**/*.py",
+        "app/*",
+        "*/main.py",
+        "app/nested/deeper/*.csv",
+        "[su]*/*.py",
+        "?etup.sql",
+        "app/**",
+        "missing/*.py",
+    ],
+)
+def test_project_file_index_matches_path_glob(pattern):
+    with temp_local_dir(INDEX_FILES) as project_root:
+        (project_root / "link").symlink_to(project_root / "app")
+        index = ProjectFileIndex(project_root)
+        assert sorted(index.glob(pattern)) == sorted(project_root.glob(pattern))
+
+
+def test_project_file_index_skips_ignored_paths():
+    with temp_local_dir(INDEX_FILES) as project_root:
+        index = ProjectFileIndex(project_root, ignored=[project_root / "output/deploy"])
+        assert sorted(index.glob("**/*.sql")) == [
+            project_root / ".hidden.sql",
+            project_root / "setup.sql",
+        ]
+        assert index.glob("output/deploy/*") == []
+
+
+def test_project_file_index_invalidates_changed_directories():
+    with temp_local_dir(INDEX_FILES) as project_root:
+        index = ProjectFileIndex(project_root)
+        assert index.glob("app/*.py") == [project_root / "app/main.py"]
+
+        (project_root / "app/extra.py").write_text("")
+        os.utime(project_root / "app", ns=(0, 0))
+        assert index.glob("app/*.py") == [project_root / "app/main.py"]
+
+        assert index.invalidate_stale() == [project_root / "app"]
+        assert sorted(index.glob("app/*.py")) == [
+            project_root / "app/extra.py",
+            project_root / "app/main.py",
+        ]
+
+
+def test_build_bundle_does_not_glob_into_deploy_root():
+    with temp_local_dir(INDEX_FILES) as project_root:
+        deploy_root = project_root / "output/deploy"
+        build_bundle(project_root, deploy_root, [ArtifactMapping("**/*.sql", "sql/")])
+        assert dir_structure(deploy_root) == ["sql/.hidden.sql", "sql/setup.sql"]
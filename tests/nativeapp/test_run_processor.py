@@ -181,10 +181,6 @@ def test_create_dev_app_create_new_with_additional_privileges(
             ),
             (None, mock.call("use role app_role")),
             (None, mock.call("use warehouse app_warehouse")),
-            (
-                mock_cursor([{"CURRENT_ROLE()": "app_role"}], []),
-                mock.call("select current_role()", cursor_class=DictCursor),
-            ),
             (None, mock.call("use role package_role")),
             (None, mock.call("use role app_role")),
             (
@@ -1035,10 +1031,6 @@ def test_upgrade_app_recreate_app(
                 mock.call("alter application myapp upgrade "),
             ),
             (None, mock.call("drop application myapp")),
-            (
-                mock_cursor([{"CURRENT_ROLE()": "app_role"}], []),
-                mock.call("select current_role()", cursor_class=DictCursor),
-            ),
             (None, mock.call("use role package_role")),
             (
                 None,
@@ -1168,10 +1160,6 @@ def test_upgrade_app_recreate_app_from_version(
                 mock.call("alter application myapp upgrade using version v1 "),
             ),
             (None, mock.call("drop application myapp")),
-            (
-                mock_cursor([{"CURRENT_ROLE()": "app_role"}], []),
-                mock.call("select current_role()", cursor_class=DictCursor),
-            ),
             (None, mock.call("use role package_role")),
             (
                 None,
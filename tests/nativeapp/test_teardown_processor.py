@@ -767,10 +767,6 @@ def test_drop_package_variable_mistmatch_w_special_comment_quoted_name_auto_drop
             ),
             (None, mock.call("use role old_role")),
             # Show versions
-            (
-                mock_cursor([{"CURRENT_ROLE()": "old_role"}], []),
-                mock.call("select current_role()", cursor_class=DictCursor),
-            ),
             (None, mock.call("use role package_role")),
             (
                 mock_cursor([], []),
@@ -781,10 +777,6 @@ def test_drop_package_variable_mistmatch_w_special_comment_quoted_name_auto_drop
             ),
             (None, mock.call("use role old_role")),
             # Drop app pkg
-            (
-                mock_cursor([{"CURRENT_ROLE()": "old_role"}], []),
-                mock.call("select current_role()", cursor_class=DictCursor),
-            ),
             (None, mock.call("use role package_role")),
             (None, mock.call('drop application package "My Package"')),
             (None, mock.call("use role old_role")),
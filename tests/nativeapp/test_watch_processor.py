@@ -0,0 +1,178 @@
+import os
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from snowflake.cli.api.project.definition_manager import DefinitionManager
+from snowflake.cli.plugins.nativeapp.watch_processor import (
+    NativeAppWatchProcessor,
+    diff_snapshots,
+)
+from snowflake.cli.plugins.stage.diff import DiffResult
+from snowflake.connector import ProgrammingError
+
+from tests.nativeapp.utils import WATCH_MODULE, WATCH_PROCESSOR
+
+
+def _get_watch_processor(working_dir: Path) -> NativeAppWatchProcessor:
+    dm = DefinitionManager(str(working_dir))
+    processor = NativeAppWatchProcessor(
+        project_definition=dm.project_definition.native_app,
+        project_root=dm.project_root,
+    )
+    processor.debounce_seconds = 1
+    return processor
+
+
+def _touch(path: Path, contents: str, mtime_ns: int):
+    path.write_text(contents)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def watched_project(project_definition_files):
+    working_dir: Path = project_definition_files[0].parent
+    with mock.patch(f"{WATCH_PROCESSOR}.deploy") as mock_deploy, mock.patch(
+        f"{WATCH_PROCESSOR}.use_role"
+    ), mock.patch(
+        f"{WATCH_PROCESSOR}._apply_package_scripts"
+    ) as mock_apply_package_scripts, mock.patch(
+        f"{WATCH_MODULE}.sync_local_diff_with_stage"
+    ) as mock_sync:
+        mock_deploy.return_value = DiffResult()
+        processor = _get_watch_processor(working_dir)
+        processor.start()
+        mock_deploy.assert_called_once_with(use_checksum_cache=True)
+        yield working_dir, processor, mock_sync, mock_apply_package_scripts
+
+
+def test_diff_snapshots():
+    synced = {"a.sql": (1, 1), "b.sql": (1, 1), "c.sql": (1, 1)}
+    current = {"a.sql": (1, 1), "b.sql": (2, 2), "d.sql": (1, 1)}
+    assert diff_snapshots(synced, current) == DiffResult(
+        identical=["a.sql"],
+        different=["b.sql"],
+        only_local=["d.sql"],
+        only_on_stage=["c.sql"],
+    )
+
+
+@pytest.mark.parametrize("project_definition_files", ["napp_project_1"], indirect=True)
+def test_watch_syncs_changed_files_after_debounce(watched_project):
+    working_dir, processor, mock_sync, _ = watched_project
+
+    assert processor.poll(now=100) is None
+    mock_sync.assert_not_called()
+
+    _touch(working_dir / "setup.sql", "select 1;", 10**9)
+    (working_dir / "app/streamlit/extra.py").write_text("")
+    assert processor.poll(now=101) is None
+    # a burst of changes restarts the debounce period
+    _touch(working_dir / "setup.sql", "select 2;", 2 * 10**9)
+    assert processor.poll(now=101.5) is None
+    assert processor.poll(now=102) is None
+    mock_sync.assert_not_called()
+
+    diff = processor.poll(now=102.5)
+    assert diff.different == ["setup.sql"]
+    assert diff.only_local == [os.path.join("ui", "extra.py")]
+    assert diff.only_on_stage == []
+    mock_sync.assert_called_once_with(
+        role=processor.package_role,
+        deploy_root_path=processor.deploy_root,
+        diff_result=diff,
+        stage_path=processor.stage_fqn,
+    )
+
+    # nothing changed since the last sync
+    assert processor.poll(now=200) is None
+    mock_sync.assert_called_once()
+
+
+@pytest.mark.parametrize("project_definition_files", ["napp_project_1"], indirect=True)
+def test_watch_removes_deleted_files(watched_project):
+    working_dir, processor, mock_sync, _ = watched_project
+
+    (working_dir / "app/streamlit/config.py").unlink()
+    processor.poll(now=100)
+    diff = processor.poll(now=101)
+    assert diff.only_on_stage == [os.path.join("ui", "config.py")]
+    assert diff.only_local == diff.different == []
+    mock_sync.assert_called_once()
+
+
+@pytest.mark.parametrize("project_definition_files", ["napp_project_1"], indirect=True)
+@mock.patch(f"{WATCH_MODULE}.cc.warning")
+def test_watch_reports_errors_and_keeps_watching(mock_warning, watched_project):
+    working_dir, processor, mock_sync, _ = watched_project
+
+    # the glob in the artifacts no longer matches anything
+    for file in (working_dir / "app/streamlit").glob("*.py"):
+        file.unlink()
+    processor.poll(now=100)
+    assert processor.poll(now=101) is None
+    mock_warning.assert_called_once()
+    mock_sync.assert_not_called()
+
+    (working_dir / "app/streamlit/main.py").write_text("")
+    processor.poll(now=102)
+    diff = processor.poll(now=103)
+    assert diff.only_on_stage == [os.path.join("ui", "config.py")]
+    assert diff.different == [os.path.join("ui", "main.py")]
+    mock_sync.assert_called_once()
+
+
+@pytest.mark.parametrize("project_definition_files", ["napp_project_1"], indirect=True)
+@mock.patch(f"{WATCH_MODULE}.cc.warning")
+def test_watch_retries_changes_that_failed_to_sync(mock_warning, watched_project):
+    working_dir, processor, mock_sync, _ = watched_project
+    mock_sync.side_effect = [ProgrammingError("stage does not exist"), None]
+
+    _touch(working_dir / "setup.sql", "select 1;", 10**9)
+    processor.poll(now=100)
+    assert processor.poll(now=101) is None
+    mock_warning.assert_called_once_with("Could not sync changes: stage does not exist")
+
+    # nothing changed locally, but the failed sync is retried
+    assert processor.poll(now=101.5) is None
+    diff = processor.poll(now=102)
+    assert diff.different == ["setup.sql"]
+    assert mock_sync.call_count == 2
+    assert processor.poll(now=200) is None
+    assert mock_sync.call_count == 2
+
+
+@pytest.mark.parametrize("project_definition_files", ["napp_project_1"], indirect=True)
+@pytest.mark.parametrize("reapply_package_scripts", [True, False])
+def test_watch_reapplies_changed_package_scripts(
+    watched_project, reapply_package_scripts
+):
+    working_dir, processor, mock_sync, mock_apply_package_scripts = watched_project
+    processor.reapply_package_scripts = reapply_package_scripts
+
+    _touch(working_dir / "001-shared.sql", "select 1;", 10**9)
+    processor.poll(now=100)
+    diff = processor.poll(now=101)
+    assert not diff.has_changes()
+    mock_sync.assert_not_called()
+    assert mock_apply_package_scripts.called == reapply_package_scripts
+
+
+@pytest.mark.parametrize("project_definition_files", ["napp_project_1"], indirect=True)
+@mock.patch(f"{WATCH_MODULE}.time.sleep")
+def test_watch_polls_less_often_while_nothing_changes(mock_sleep, watched_project):
+    working_dir, processor, _, _ = watched_project
+    intervals = []
+
+    def sleep(interval):
+        intervals.append(interval)
+        if len(intervals) == 6:
+            _touch(working_dir / "setup.sql", "changed", 10**18)
+        if len(intervals) == 8:
+            raise KeyboardInterrupt()
+
+    mock_sleep.side_effect = sleep
+    with mock.patch(f"{WATCH_PROCESSOR}.start"):
+        processor.process(poll_interval=0.5, max_poll_interval=4)
+
+    assert intervals == [0.5, 1, 2, 4, 4, 4, 0.5, 0.5]
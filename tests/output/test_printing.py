@@ -1,8 +1,11 @@
+import io
+import sys
 from datetime import datetime
 from textwrap import dedent
 from typing import NamedTuple
 
 import pytest
+from click import ClickException
 from snowflake.cli.api.output.formats import OutputFormat
 from snowflake.cli.api.output.types import (
     CollectionResult,
@@ -308,3 +311,147 @@ def _empty_cursor(mock_cursor):
         columns=["string", "number", "array", "object", "date"],
         rows=[],
     )
+
+
+def test_print_multi_db_cursor_ndjson(capsys, _create_mock_cursor):
+    output_data = MultipleResults(
+        [
+            QueryResult(_create_mock_cursor()),
+            MessageResult("Command done"),
+        ],
+    )
+    print_result(output_data, output_format=OutputFormat.NDJSON)
+
+    assert get_output(capsys) == dedent(
+        """\
+    {"string": "string", "number": 42, "array": ["array"], "object": {"k": "object"}, "date": "2022-03-21T00:00:00"}
+    {"string": "string", "number": 43, "array": ["array"], "object": {"k": "object"}, "date": "2022-03-21T00:00:00"}
+    {"message": "Command done"}
+    """
+    )
+
+
+def test_print_multi_db_cursor_csv(capsys, _create_mock_cursor, _empty_cursor):
+    output_data = MultipleResults(
+        [
+            QueryResult(_create_mock_cursor()),
+            QueryResult(_empty_cursor()),
+            CollectionResult([{"key": "value, with comma"}]),
+        ],
+    )
+    print_result(output_data, output_format=OutputFormat.CSV)
+
+    assert get_output(capsys) == dedent(
+        """\
+    string,number,array,object,date
+    string,42,['array'],{'k': 'object'},2022-03-21 00:00:00
+    string,43,['array'],{'k': 'object'},2022-03-21 00:00:00
+
+    string,number,array,object,date
+
+    key
+    "value, with comma"
+    """
+    )
+
+
+def test_print_with_no_data_ndjson(capsys, _empty_cursor):
+    print_result(QueryResult(_empty_cursor()), output_format=OutputFormat.NDJSON)
+    print_result(None, output_format=OutputFormat.NDJSON)
+    assert get_output(capsys) == ""
+
+
+def test_print_large_collection_table_in_pages(capsys, monkeypatch):
+    monkeypatch.setattr("snowflake.cli.app.printing.TABLE_PAGE_SIZE", 2)
+    rows = ({"id": i, "name": "x" * (i + 2)} for i in range(5))
+    print_result(CollectionResult(rows), output_format=OutputFormat.TABLE)
+
+    # column widths are computed from the first page only, longer values are folded
+    assert get_output(capsys) == dedent(
+        """\
+    +-----------+
+    | id | name |
+    |----+------|
+    | 0  | xx   |
+    | 1  | xxx  |
+    +-----------+
+    +-----------+
+    | 2  | xxxx |
+    | 3  | xxxx |
+    |    | x    |
+    +-----------+
+    +-----------+
+    | 4  | xxxx |
+    |    | xx   |
+    +-----------+
+    """
+    )
+
+
+def test_print_multiple_tables_are_separated_in_terminal(capsys, monkeypatch):
+    monkeypatch.setattr("rich.console.Console.is_terminal", True)
+    results = MultipleResults(
+        [CollectionResult([{"a": 1}]), CollectionResult([{"b": 2}])]
+    )
+    print_result(results, output_format=OutputFormat.TABLE)
+
+    assert get_output(capsys) == dedent(
+        """\
+    +---+
+    | a |
+    |---|
+    | 1 |
+    +---+
+
+    +---+
+    | b |
+    |---|
+    | 2 |
+    +---+
+
+    """
+    )
+
+
+@pytest.mark.parametrize("output_format", [OutputFormat.ARROW, OutputFormat.PARQUET])
+def test_print_multiple_results_arrow_is_not_supported(
+    output_format, _create_mock_cursor
+):
+    output_data = MultipleResults([QueryResult(_create_mock_cursor())])
+    with pytest.raises(ClickException, match="supports only a single result"):
+        print_result(output_data, output_format=output_format)
+
+
+def test_print_arrow_requires_pyarrow(monkeypatch, _create_mock_cursor):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    with pytest.raises(ClickException, match="require the pyarrow package"):
+        print_result(
+            QueryResult(_create_mock_cursor()), output_format=OutputFormat.ARROW
+        )
+
+
+@pytest.mark.parametrize("output_format", [OutputFormat.ARROW, OutputFormat.PARQUET])
+def test_print_query_result_arrow_batches(capsysbinary, mock_cursor, output_format):
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.ipc
+    import pyarrow.parquet
+
+    cursor = mock_cursor(rows=[], columns=["ID", "NAME"])
+    cursor.fetch_arrow_batches = lambda: iter(
+        [
+            pa.table({"ID": pa.array([1, 2], pa.int8()), "NAME": ["a", "b"]}),
+            pa.table({"ID": pa.array([300], pa.int16()), "NAME": ["c"]}),
+        ]
+    )
+    print_result(QueryResult(cursor), output_format=output_format)
+
+    output = io.BytesIO(capsysbinary.readouterr().out)
+    if output_format == OutputFormat.PARQUET:
+        table = pyarrow.parquet.read_table(output)
+    else:
+        table = pyarrow.ipc.open_stream(output).read_all()
+    assert table.to_pylist() == [
+        {"ID": 1, "NAME": "a"},
+        {"ID": 2, "NAME": "b"},
+        {"ID": 300, "NAME": "c"},
+    ]
@@ -1,14 +1,18 @@
+import os
 from pathlib import Path
 from typing import List, Optional
 from unittest import mock
 from unittest.mock import PropertyMock
 
 import pytest
+from snowflake.cli.api.project import definition
 from snowflake.cli.api.project.definition import (
     generate_local_override_yml,
+    get_project_definition_cache_path,
     load_project_definition,
 )
 from snowflake.cli.api.project.errors import SchemaValidationError
+from snowflake.cli.api.project.schemas.updatable_model import UpdatableModel
 
 
 @pytest.mark.parametrize("project_definition_files", ["napp_project_1"], indirect=True)
@@ -91,27 +95,113 @@ def test_does_not_accept_unknown_fields(project_definition_files):
     )
 
 
-@pytest.mark.parametrize(
-    "project_definition_files",
-    [
-        "integration",
-        "integration_external",
-        "minimal",
-        "napp_project_1",
-        "napp_project_with_pkg_warehouse",
-        "snowpark_function_external_access",
-        "snowpark_function_fully_qualified_name",
-        "snowpark_function_secrets_without_external_access",
-        "snowpark_functions",
-        "snowpark_procedure_external_access",
-        "snowpark_procedure_fully_qualified_name",
-        "snowpark_procedure_secrets_without_external_access",
-        "snowpark_procedures",
-        "snowpark_procedures_coverage",
-        "streamlit_full_definition",
-    ],
-    indirect=True,
-)
+PARSED_PROJECTS = [
+    "integration",
+    "integration_external",
+    "minimal",
+    "napp_project_1",
+    "napp_project_with_pkg_warehouse",
+    "snowpark_function_external_access",
+    "snowpark_function_fully_qualified_name",
+    "snowpark_function_secrets_without_external_access",
+    "snowpark_functions",
+    "snowpark_procedure_external_access",
+    "snowpark_procedure_fully_qualified_name",
+    "snowpark_procedure_secrets_without_external_access",
+    "snowpark_procedures",
+    "snowpark_procedures_coverage",
+    "streamlit_full_definition",
+]
+
+
+@pytest.mark.parametrize("project_definition_files", PARSED_PROJECTS, indirect=True)
 def test_fields_are_parsed_correctly(project_definition_files, snapshot):
     result = load_project_definition(project_definition_files).model_dump()
     assert result == snapshot
+
+
+@pytest.fixture
+def parse_yaml():
+    with mock.patch.object(
+        definition, "_parse_yaml", wraps=definition._parse_yaml  # noqa: SLF001
+    ) as parse_yaml:
+        yield parse_yaml
+
+
+@pytest.mark.parametrize("project_definition_files", ["napp_project_1"], indirect=True)
+def test_unchanged_definition_is_loaded_from_cache(
+    project_definition_files, parse_yaml
+):
+    project = load_project_definition(project_definition_files)
+    parse_yaml.reset_mock()
+
+    cached_project = load_project_definition(project_definition_files)
+
+    parse_yaml.assert_not_called()
+    assert cached_project == project
+    assert cached_project.native_app.application.name == "myapp_polly"
+
+
+@pytest.mark.parametrize("project_definition_files", PARSED_PROJECTS, indirect=True)
+def test_cached_definition_is_not_validated_again(project_definition_files):
+    project = load_project_definition(project_definition_files)
+
+    with mock.patch.object(
+        UpdatableModel, "__init__", side_effect=AssertionError("validated")
+    ):
+        cached_project = load_project_definition(project_definition_files)
+
+    assert cached_project.model_dump() == project.model_dump()
+    assert cached_project == project
+
+
+@pytest.mark.parametrize("project_definition_files", ["napp_project_1"], indirect=True)
+def test_changed_definition_is_parsed_again(project_definition_files, parse_yaml):
+    load_project_definition(project_definition_files)
+    local_yml = project_definition_files[1]
+    local_yml.write_text(local_yml.read_text().replace("myapp_polly", "myapp_changed"))
+    parse_yaml.reset_mock()
+
+    project = load_project_definition(project_definition_files)
+
+    assert parse_yaml.call_count == 2
+    assert project.native_app.application.name == "myapp_changed"
+
+
+@pytest.mark.parametrize("project_definition_files", ["underspecified"], indirect=True)
+def test_invalid_definition_is_not_cached(project_definition_files):
+    with pytest.raises(SchemaValidationError):
+        load_project_definition(project_definition_files)
+
+    assert not get_project_definition_cache_path(project_definition_files).exists()
+
+
+@pytest.mark.parametrize("project_definition_files", ["napp_project_1"], indirect=True)
+def test_definition_cached_by_other_version_is_parsed_again(
+    project_definition_files, parse_yaml
+):
+    load_project_definition(project_definition_files)
+    parse_yaml.reset_mock()
+
+    with mock.patch.object(definition, "VERSION", "0.0.0"):
+        load_project_definition(project_definition_files)
+
+    assert parse_yaml.call_count == 2
+
+
+@pytest.mark.parametrize("project_definition_files", ["napp_project_1"], indirect=True)
+def test_definitions_of_least_recently_loaded_projects_are_pruned(
+    project_definition_files,
+):
+    cache_path = get_project_definition_cache_path(project_definition_files)
+    stale_paths = [cache_path.parent / f"stale{i}.json" for i in range(3)]
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    for path in stale_paths:
+        path.write_text("{}")
+        os.utime(path, (0, 0))
+
+    with mock.patch.object(definition, "MAX_CACHED_PROJECT_DEFINITIONS", 2):
+        load_project_definition(project_definition_files)
+
+    assert cache_path.exists()
+    assert len(list(cache_path.parent.glob("*.json"))) == 2
@@ -0,0 +1,73 @@
+from unittest import mock
+
+import pytest
+from snowflake.cli.api.cli_global_context import cli_context
+from snowflake.cli.plugins.shell.manager import ShellManager, is_statement_complete
+from snowflake.connector.cursor import DictCursor
+from snowflake.connector.errors import ProgrammingError
+
+MIXIN = "snowflake.cli.api.sql_execution.SqlExecutionMixin"
+
+
+@pytest.mark.parametrize(
+    "text, complete",
+    [
+        ("select 1;", True),
+        ("select 1", False),
+        ("select 1;\n-- comment", True),
+        ("select 1 -- comment;", False),
+        ("select 'a;", False),
+        ("select 'a;\nb';", True),
+        ("select $$ a; $$", False),
+        ("select 1; select 2", False),
+        ("begin\n  select 1;\nend;", True),
+    ],
+)
+def test_is_statement_complete(text, complete):
+    assert is_statement_complete(text) == complete
+
+
+@mock.patch("snowflake.connector.connect")
+def test_shell_executes_statements_through_one_connection(
+    mock_connect, runner, mock_ctx
+):
+    ctx = mock_ctx()
+    mock_connect.return_value = ctx
+
+    result = runner.invoke(
+        ["shell"], input="select 1;\nselect\n  2; select 3;\n\nselect 4\n"
+    )
+
+    assert result.exit_code == 0, result.output
+    assert mock_connect.call_count == 1
+    assert ctx.get_queries() == ["select 1;", "select\n  2;\nselect 3;", "select 4"]
+    assert result.output.count(" row(s) (") == 3
+
+
+@mock.patch(f"{MIXIN}._execute_string")
+def test_shell_continues_after_error(mock_execute, runner, mock_cursor):
+    mock_execute.side_effect = [
+        ProgrammingError("Object does not exist"),
+        (mock_cursor(["row"], []) for _ in range(1)),
+    ]
+
+    result = runner.invoke(["shell"], input="select 1;\nselect 2;\nexit\nselect 3;\n")
+
+    assert result.exit_code == 0, result.output
+    assert "Object does not exist" in result.output
+    assert mock_execute.call_count == 2
+
+
+@mock.patch(f"{MIXIN}._execute_query")
+def test_completion_lists_objects_once(mock_execute, mock_cursor):
+    mock_execute.return_value = mock_cursor([{"name": "MY_TABLE"}], [])
+    shell = ShellManager()
+
+    assert shell.complete("MY") == ["MY_TABLE"]
+    assert shell.complete("sel") == ["select"]
+    assert shell.complete("SEL") == ["SELECT"]
+    mock_execute.assert_called_once_with("show terse objects", cursor_class=DictCursor)
+
+    cli_context.session_state.observe("create table my_other_table (i int)")
+    shell.complete("my")
+    assert mock_execute.call_count == 2
@@ -106,12 +106,12 @@ def test_filter_anaconda_packages(mock_get):
     assert split_requirements.unavailable[1].specs == [("==", "1.0.1")]
 
 
-@patch("snowflake.cli.plugins.snowpark.package.anaconda.requests")
-def test_anaconda_packages(mock_requests):
+@patch("requests.get")
+def test_anaconda_packages(mock_get):
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.json.return_value = test_data.anaconda_response
-    mock_requests.get.return_value = mock_response
+    mock_get.return_value = mock_response
 
     anaconda = AnacondaChannel.from_snowflake()
     assert anaconda.is_package_available(Requirement.parse_line("streamlit"))
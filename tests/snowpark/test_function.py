@@ -265,11 +265,13 @@ def test_deploy_function_needs_update_because_handler_changes(
 
 
 @mock.patch("snowflake.connector.connect")
+@mock.patch("snowflake.cli.plugins.snowpark.commands.ObjectManager.list_objects")
 @mock.patch("snowflake.cli.plugins.snowpark.commands.ObjectManager.describe")
 @mock.patch("snowflake.cli.plugins.snowpark.commands.ObjectManager.show")
 def test_deploy_procedure_fully_qualified_name(
     mock_om_show,
     mock_om_describe,
+    mock_om_list,
     mock_conn,
     runner,
     mock_ctx,
@@ -281,6 +283,7 @@ def test_deploy_procedure_fully_qualified_name(
     mock_om_describe.side_effect = [
         ProgrammingError("does not exist or not authorized"),
     ] * number_of_functions_in_project
+    mock_om_list.return_value = []
     ctx = mock_ctx()
     mock_conn.return_value = ctx
 
@@ -338,8 +341,11 @@ def _deploy_function(
         "snowflake.cli.plugins.snowpark.commands.ObjectManager.describe"
     ) as om_describe, mock.patch(
         "snowflake.cli.plugins.snowpark.commands.ObjectManager.show"
-    ) as om_show:
+    ) as om_show, mock.patch(
+        "snowflake.cli.plugins.snowpark.commands.ObjectManager.list_objects"
+    ) as om_list:
         om_describe.return_value = rows
+        om_list.return_value = [{"name": "FUNC1"}]
 
         with project_directory("snowpark_functions") as temp_dir:
             (Path(temp_dir) / "requirements.snowflake.txt").write_text(
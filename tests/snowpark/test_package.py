@@ -23,11 +23,11 @@ class TestPackage:
             "package-with-non-pep-version",
         ],
     )
-    @patch("snowflake.cli.plugins.snowpark.package.anaconda.requests")
+    @patch("requests.get")
     def test_package_lookup(
-        self, mock_requests, argument, monkeypatch, runner, snapshot
+        self, mock_get, argument, monkeypatch, runner, snapshot
     ) -> None:
-        mock_requests.get.return_value = self.mocked_anaconda_response(
+        mock_get.return_value = self.mocked_anaconda_response(
             test_data.anaconda_response
         )
 
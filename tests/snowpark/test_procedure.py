@@ -2,9 +2,7 @@ import json
 from pathlib import Path
 from textwrap import dedent
 from unittest import mock
-from unittest.mock import call
 
-from snowflake.cli.api.constants import ObjectType
 from snowflake.connector import ProgrammingError
 
 
@@ -21,11 +19,13 @@ def test_deploy_function_no_procedure(runner, project_directory):
 
 
 @mock.patch("snowflake.connector.connect")
+@mock.patch("snowflake.cli.plugins.snowpark.commands.ObjectManager.list_objects")
 @mock.patch("snowflake.cli.plugins.snowpark.commands.ObjectManager.describe")
 @mock.patch("snowflake.cli.plugins.snowpark.commands.ObjectManager.show")
 def test_deploy_procedure(
     mock_om_show,
     mock_om_describe,
+    mock_om_list,
     mock_conn,
     runner,
     mock_ctx,
@@ -33,6 +33,7 @@ def test_deploy_procedure(
 ):
 
     mock_om_describe.side_effect = ProgrammingError("does not exist or not authorized")
+    mock_om_list.return_value = []
     ctx = mock_ctx()
     mock_conn.return_value = ctx
 
@@ -45,12 +46,10 @@ def test_deploy_procedure(
         )
 
     assert result.exit_code == 0, result.output
-    mock_om_describe.return_value(
-        [
-            call(object_type=str(ObjectType.PROCEDURE), name="procedureName(string)"),
-            call(object_type=str(ObjectType.PROCEDURE), name="test()"),
-        ]
+    mock_om_list.assert_called_once_with(
+        "user procedures", "in schema MOCKDATABASE.MOCKSCHEMA"
     )
+    mock_om_describe.assert_not_called()
     assert ctx.get_queries() == [
         "create stage if not exists MOCKDATABASE.MOCKSCHEMA.DEV_DEPLOYMENT comment='deployments managed by Snowflake CLI'",
         f"put file://{Path(tmp).resolve()}/app.zip @MOCKDATABASE.MOCKSCHEMA.DEV_DEPLOYMENT/my_snowpark_project auto_compress=false parallel=4 overwrite=True",
@@ -80,11 +79,13 @@ def test_deploy_procedure(
 
 
 @mock.patch("snowflake.connector.connect")
+@mock.patch("snowflake.cli.plugins.snowpark.commands.ObjectManager.list_objects")
 @mock.patch("snowflake.cli.plugins.snowpark.commands.ObjectManager.describe")
 @mock.patch("snowflake.cli.plugins.snowpark.commands.ObjectManager.show")
 def test_deploy_procedure_with_external_access(
     mock_om_show,
     mock_om_describe,
+    mock_om_list,
     mock_conn,
     runner,
     mock_ctx,
@@ -96,6 +97,7 @@ def test_deploy_procedure_with_external_access(
         {"name": "external_2", "type": "EXTERNAL_ACCESS"},
     ]
 
+    mock_om_list.return_value = []
     ctx = mock_ctx()
     mock_conn.return_value = ctx
 
@@ -108,14 +110,7 @@ def test_deploy_procedure_with_external_access(
         )
 
     assert result.exit_code == 0, result.output
-    mock_om_describe.assert_has_calls(
-        [
-            call(
-                object_type=str(ObjectType.PROCEDURE),
-                name="MOCKDATABASE.MOCKSCHEMA.PROCEDURENAME(string)",
-            ),
-        ]
-    )
+    mock_om_describe.assert_not_called()
     assert ctx.get_queries() == [
         "create stage if not exists MOCKDATABASE.MOCKSCHEMA.DEV_DEPLOYMENT comment='deployments managed by Snowflake CLI'",
         f"put file://{Path(project_dir).resolve()}/app.zip @MOCKDATABASE.MOCKSCHEMA.DEV_DEPLOYMENT/my_snowpark_project"
@@ -205,11 +200,13 @@ def test_deploy_procedure_fails_if_integration_does_not_exists(
     "snowflake.cli.plugins.snowpark.commands._check_if_all_defined_integrations_exists"
 )
 @mock.patch("snowflake.connector.connect")
+@mock.patch("snowflake.cli.plugins.snowpark.commands.ObjectManager.list_objects")
 @mock.patch("snowflake.cli.plugins.snowpark.commands.ObjectManager.describe")
 @mock.patch("snowflake.cli.plugins.snowpark.commands.ObjectManager.show")
 def test_deploy_procedure_fails_if_object_exists_and_no_replace(
     mock_om_show,
     mock_om_describe,
+    mock_om_list,
     mock_conn,
     _,
     runner,
@@ -226,6 +223,7 @@ def test_deploy_procedure_fails_if_object_exists_and_no_replace(
         ],
         columns=["key", "value"],
     )
+    mock_om_list.return_value = [{"name": "PROCEDURENAME"}, {"name": "TEST"}]
     ctx = mock_ctx()
     mock_conn.return_value = ctx
 
@@ -237,11 +235,13 @@ def test_deploy_procedure_fails_if_object_exists_and_no_replace(
 
 
 @mock.patch("snowflake.connector.connect")
+@mock.patch("snowflake.cli.plugins.snowpark.commands.ObjectManager.list_objects")
 @mock.patch("snowflake.cli.plugins.snowpark.commands.ObjectManager.describe")
 @mock.patch("snowflake.cli.plugins.snowpark.commands.ObjectManager.show")
 def test_deploy_procedure_replace_nothing_to_update(
     mock_om_show,
     mock_om_describe,
+    mock_om_list,
     mock_conn,
     runner,
     mock_cursor,
@@ -268,6 +268,7 @@ def test_deploy_procedure_replace_nothing_to_update(
             columns=["key", "value"],
         ),
     ]
+    mock_om_list.return_value = [{"name": "PROCEDURENAME"}, {"name": "TEST"}]
     ctx = mock_ctx()
     mock_conn.return_value = ctx
 
@@ -290,11 +291,13 @@ def test_deploy_procedure_replace_nothing_to_update(
 
 
 @mock.patch("snowflake.connector.connect")
+@mock.patch("snowflake.cli.plugins.snowpark.commands.ObjectManager.list_objects")
 @mock.patch("snowflake.cli.plugins.snowpark.commands.ObjectManager.describe")
 @mock.patch("snowflake.cli.plugins.snowpark.commands.ObjectManager.show")
 def test_deploy_procedure_replace_updates_single_object(
     mock_om_show,
     mock_om_describe,
+    mock_om_list,
     mock_conn,
     runner,
     mock_cursor,
@@ -321,6 +324,7 @@ def test_deploy_procedure_replace_updates_single_object(
             columns=["key", "value"],
         ),
     ]
+    mock_om_list.return_value = [{"name": "PROCEDURENAME"}, {"name": "TEST"}]
     ctx = mock_ctx()
     mock_conn.return_value = ctx
 
@@ -343,11 +347,13 @@ def test_deploy_procedure_replace_updates_single_object(
 
 
 @mock.patch("snowflake.connector.connect")
+@mock.patch("snowflake.cli.plugins.snowpark.commands.ObjectManager.list_objects")
 @mock.patch("snowflake.cli.plugins.snowpark.commands.ObjectManager.describe")
 @mock.patch("snowflake.cli.plugins.snowpark.commands.ObjectManager.show")
 def test_deploy_procedure_replace_creates_missing_object(
     mock_om_show,
     mock_om_describe,
+    mock_om_list,
     mock_conn,
     runner,
     mock_cursor,
@@ -364,8 +370,8 @@ def test_deploy_procedure_replace_creates_missing_object(
             ],
             columns=["key", "value"],
         ),
-        ProgrammingError("does not exist or not authorized"),
     ]
+    mock_om_list.return_value = [{"name": "PROCEDURENAME"}]
     ctx = mock_ctx()
     mock_conn.return_value = ctx
 
@@ -388,11 +394,13 @@ def test_deploy_procedure_replace_creates_missing_object(
 
 
 @mock.patch("snowflake.connector.connect")
+@mock.patch("snowflake.cli.plugins.snowpark.commands.ObjectManager.list_objects")
 @mock.patch("snowflake.cli.plugins.snowpark.commands.ObjectManager.describe")
 @mock.patch("snowflake.cli.plugins.snowpark.commands.ObjectManager.show")
 def test_deploy_procedure_fully_qualified_name(
     mock_om_show,
     mock_om_describe,
+    mock_om_list,
     mock_conn,
     runner,
     mock_ctx,
@@ -404,6 +412,7 @@ def test_deploy_procedure_fully_qualified_name(
     mock_om_describe.side_effect = [
         ProgrammingError("does not exist or not authorized"),
     ] * number_of_procedures_in_projects
+    mock_om_list.return_value = []
     ctx = mock_ctx()
     mock_conn.return_value = ctx
 
@@ -454,3 +463,28 @@ def test_init_procedure(mock_create_project_template, runner, temp_dir):
     mock_create_project_template.assert_called_once_with(
         "default_snowpark", project_directory="my_project2"
     )
+
+
+@mock.patch("snowflake.connector.connect")
+@mock.patch("snowflake.cli.plugins.snowpark.commands.ObjectManager.list_objects")
+@mock.patch("snowflake.cli.plugins.snowpark.commands.ObjectManager.describe")
+@mock.patch("snowflake.cli.plugins.snowpark.commands.ObjectManager.show")
+def test_deploy_procedure_describes_each_procedure_if_schema_cannot_be_listed(
+    mock_om_show,
+    mock_om_describe,
+    mock_om_list,
+    mock_conn,
+    runner,
+    mock_ctx,
+    project_directory,
+):
+    mock_om_describe.side_effect = ProgrammingError("does not exist or not authorized")
+    mock_om_list.side_effect = ProgrammingError("insufficient privileges")
+    ctx = mock_ctx()
+    mock_conn.return_value = ctx
+
+    with project_directory("snowpark_procedures"):
+        result = runner.invoke(["snowpark", "deploy"])
+
+    assert result.exit_code == 0, result.output
+    assert mock_om_describe.call_count == 2
@@ -126,7 +126,7 @@ def test_create_repository_already_exists(mock_handle, mock_execute):
     )
 
 
-@mock.patch("snowflake.cli.plugins.spcs.image_repository.commands.requests.get")
+@mock.patch("requests.get")
 @mock.patch(
     "snowflake.cli.plugins.spcs.image_repository.commands.ImageRepositoryManager._execute_query"
 )
@@ -165,7 +165,7 @@ def test_list_images(
     assert json.loads(result.output) == [{"image": "/DB/SCHEMA/IMAGES/super-cool-repo"}]
 
 
-@mock.patch("snowflake.cli.plugins.spcs.image_repository.commands.requests.get")
+@mock.patch("requests.get")
 @mock.patch(
     "snowflake.cli.plugins.spcs.image_repository.manager.ImageRepositoryManager._execute_query"
 )
@@ -6,7 +6,10 @@ from unittest import mock
 import pytest
 from snowflake.cli.api.exceptions import SnowflakeSQLExecutionError
 from snowflake.cli.plugins.stage.diff import (
+    CHECKSUM_CACHE_FILENAME,
+    CHUNK_SIZE_BYTES,
     DiffResult,
+    compute_md5sum,
     delete_only_on_stage_files,
     enumerate_files,
     get_stage_path_from_file,
@@ -130,6 +133,161 @@ def test_modified_file(mock_list, mock_cursor):
         assert len(diff_result.only_local) == 0
 
 
+@mock.patch(f"{STAGE_MANAGER}.list_files")
+def test_checksum_cache_skips_unchanged_files(mock_list, mock_cursor):
+    mock_list.side_effect = lambda *args: mock_cursor(
+        rows=stage_contents(FILE_CONTENTS),
+        columns=STAGE_LS_COLUMNS,
+    )
+    compute_md5sum_path = "snowflake.cli.plugins.stage.diff.compute_md5sum"
+    checksum_cache_min_age = (
+        "snowflake.cli.plugins.stage.diff.CHECKSUM_CACHE_MIN_AGE_NS"
+    )
+
+    with temp_local_dir(FILE_CONTENTS) as local_path, mock.patch(
+        checksum_cache_min_age, -(10**12)
+    ):
+        with mock.patch(compute_md5sum_path, side_effect=md5_of_file) as mock_md5:
+            diff_result = stage_diff(local_path, "a.b.c", use_checksum_cache=True)
+            assert mock_md5.call_count == len(FILE_CONTENTS)
+        assert sorted(diff_result.identical) == sorted(FILE_CONTENTS.keys())
+        assert (local_path / CHECKSUM_CACHE_FILENAME).exists()
+
+        # unchanged files are not read again
+        with mock.patch(compute_md5sum_path, side_effect=md5_of_file) as mock_md5:
+            diff_result = stage_diff(local_path, "a.b.c", use_checksum_cache=True)
+            assert mock_md5.call_count == 0
+        assert sorted(diff_result.identical) == sorted(FILE_CONTENTS.keys())
+        assert diff_result.only_local == []
+
+        # touched files are hashed again
+        (local_path / "README.md").write_text("This is a modified README\n")
+        with mock.patch(compute_md5sum_path, side_effect=md5_of_file) as mock_md5:
+            diff_result = stage_diff(local_path, "a.b.c", use_checksum_cache=True)
+            mock_md5.assert_called_once_with(local_path / "README.md")
+        assert diff_result.different == ["README.md"]
+
+
+@mock.patch(f"{STAGE_MANAGER}.list_files")
+def test_checksum_cache_is_not_used_by_default(mock_list, mock_cursor):
+    mock_list.return_value = mock_cursor(
+        rows=stage_contents(FILE_CONTENTS),
+        columns=STAGE_LS_COLUMNS,
+    )
+
+    with temp_local_dir(FILE_CONTENTS) as local_path:
+        stage_diff(local_path, "a.b.c")
+        assert not (local_path / CHECKSUM_CACHE_FILENAME).exists()
+
+
+def test_enumerate_files_is_sorted_depth_first():
+    with temp_local_dir(
+        {
+            "b.txt": "b",
+            "a/z.txt": "z",
+            "a/nested/y.txt": "y",
+            "c/x.txt": "x",
+            "A.txt": "A",
+        }
+    ) as local_path:
+        assert [
+            str(path.relative_to(local_path)) for path in enumerate_files(local_path)
+        ] == ["A.txt", "a/nested/y.txt", "a/z.txt", "b.txt", "c/x.txt"]
+
+
+def test_compute_md5sum_of_file_larger_than_chunk():
+    contents = b"0123456789abcdef" * (CHUNK_SIZE_BYTES // 8 + 3)
+    with temp_local_dir({"big.bin": contents}) as local_path:
+        assert compute_md5sum(local_path / "big.bin") == md5_of(contents)
+
+
+@mock.patch(f"{STAGE_MANAGER}.list_files")
+def test_stage_diff_is_deterministic(mock_list, mock_cursor):
+    files = {f"dir{i % 7}/file{i}.txt": f"contents {i}" for i in range(200)}
+    modified = {relpath for i, relpath in enumerate(files) if i % 3 == 0}
+    mock_list.return_value = mock_cursor(
+        rows=stage_contents(files),
+        columns=STAGE_LS_COLUMNS,
+    )
+
+    with temp_local_dir(
+        {
+            relpath: f"{contents} modified" if relpath in modified else contents
+            for relpath, contents in files.items()
+        }
+    ) as local_path:
+        diff_result = stage_diff(local_path, "a.b.c")
+        expected_order = [
+            str(path.relative_to(local_path)) for path in enumerate_files(local_path)
+        ]
+        assert diff_result.different == [p for p in expected_order if p in modified]
+        assert diff_result.identical == [p for p in expected_order if p not in modified]
+
+
+@mock.patch(f"{STAGE_MANAGER}.list_files")
+def test_size_mismatch_is_different_without_hashing(mock_list, mock_cursor):
+    mock_list.return_value = mock_cursor(
+        rows=[
+            (f"stage/{relpath}", len(contents) + 1, md5_of(contents), "")
+            for relpath, contents in FILE_CONTENTS.items()
+        ],
+        columns=STAGE_LS_COLUMNS,
+    )
+
+    with temp_local_dir(FILE_CONTENTS) as local_path, mock.patch(
+        "snowflake.cli.plugins.stage.diff.compute_md5sum"
+    ) as mock_md5:
+        diff_result = stage_diff(local_path, "a.b.c", compare_sizes=True)
+        mock_md5.assert_not_called()
+        assert sorted(diff_result.different) == sorted(FILE_CONTENTS.keys())
+        assert diff_result.identical == []
+
+
+@mock.patch(f"{STAGE_MANAGER}.list_files")
+@mock.patch("snowflake.cli.plugins.stage.diff.MULTIPART_CHUNK_SIZE_BYTES", 4)
+def test_multipart_etags(mock_list, mock_cursor):
+    contents = {
+        "identical.bin": b"0123456789",
+        "modified.bin": b"0123456789",
+        "unknown_part_size.bin": b"0123456789",
+    }
+
+    def multipart_etag(data: bytes, part_size: int) -> str:
+        parts = [data[i : i + part_size] for i in range(0, len(data), part_size)]
+        digests = b"".join(hashlib.md5(part).digest() for part in parts)
+        return f"{hashlib.md5(digests).hexdigest()}-{len(parts)}"
+
+    mock_list.return_value = mock_cursor(
+        rows=[
+            {
+                "name": "stage/identical.bin",
+                "size": 10,
+                "md5": multipart_etag(b"0123456789", 4),
+            },
+            {
+                "name": "stage/modified.bin",
+                "size": 10,
+                "md5": multipart_etag(b"9876543210", 4),
+            },
+            {
+                "name": "stage/unknown_part_size.bin",
+                "size": 10,
+                "md5": multipart_etag(b"0123456789", 2),
+            },
+        ],
+        columns=STAGE_LS_COLUMNS,
+    )
+
+    with temp_local_dir(contents) as local_path:
+        diff_result = stage_diff(local_path, "a.b.c", compare_sizes=True)
+        assert diff_result.identical == ["identical.bin"]
+        assert diff_result.different == ["modified.bin", "unknown_part_size.bin"]
+
+
+def md5_of_file(path: Path) -> str:
+    return md5_of(path.read_bytes())
+
+
 def test_get_stage_path_from_file():
     expected = [
         "",
@@ -153,20 +311,58 @@ def test_get_stage_path_from_file():
     assert actual.sort() == expected
 
 
+@mock.patch(f"{STAGE_MANAGER}.remove_files")
 @mock.patch(f"{STAGE_MANAGER}.remove")
-def test_delete_only_on_stage_files(mock_remove):
+@mock.patch(f"{STAGE_MANAGER}.use_role")
+def test_delete_only_on_stage_files(mock_use_role, mock_remove, mock_remove_files):
     stage_name = "some_stage_name"
     random_file = "some_file_on_stage"
 
-    delete_only_on_stage_files(StageManager(), stage_name, [random_file], "some_role")
-    mock_remove.assert_has_calls(
-        [mock.call(stage_name=stage_name, path=random_file, role="some_role")]
+    deleted = delete_only_on_stage_files(
+        StageManager(), stage_name, [random_file], "some_role"
+    )
+    mock_use_role.assert_called_once_with("some_role")
+    mock_remove.assert_not_called()
+    mock_remove_files.assert_called_once_with(
+        stage_name=stage_name, paths=[random_file]
     )
+    assert deleted == [random_file]
 
 
+@mock.patch(f"{STAGE_MANAGER}.remove_files")
+@mock.patch(f"{STAGE_MANAGER}.remove")
+def test_delete_only_on_stage_files_removes_stale_directories(
+    mock_remove, mock_remove_files
+):
+    stage_name = "some_stage_name"
+    only_on_stage = [
+        "old/a.py",
+        "old/nested/b.py",
+        "ui/old/c.py",
+        "ui/d.py",
+        "e.py",
+    ]
+
+    deleted = delete_only_on_stage_files(
+        StageManager(),
+        stage_name,
+        only_on_stage,
+        remaining_on_stage=["ui/main.py", "setup.sql"],
+    )
+    assert mock_remove.mock_calls == [
+        mock.call(stage_name=stage_name, path="old/"),
+        mock.call(stage_name=stage_name, path="ui/old/"),
+    ]
+    mock_remove_files.assert_called_once_with(
+        stage_name=stage_name, paths=["ui/d.py", "e.py"]
+    )
+    assert deleted == only_on_stage
+
+
+@mock.patch(f"{STAGE_MANAGER}.use_role")
 @mock.patch(f"{STAGE_MANAGER}.put")
 @pytest.mark.parametrize("overwrite_param", [True, False])
-def test_put_files_on_stage(mock_put, overwrite_param):
+def test_put_files_on_stage(mock_put, mock_use_role, overwrite_param):
     stage_name = "some_stage_name"
     with temp_local_dir(
         {
@@ -174,7 +370,7 @@ def test_put_files_on_stage(mock_put, overwrite_param):
             "README.md": "# this is an app file\n",
         }
     ) as local_path:
-        put_files_on_stage(
+        result = put_files_on_stage(
             stage_manager=StageManager(),
             stage_fqn=stage_name,
             deploy_root_path=local_path,
@@ -186,17 +382,77 @@ def test_put_files_on_stage(mock_put, overwrite_param):
             mock.call(
                 local_path=local_path / "ui/nested/environment.yml",
                 stage_path=f"{stage_name}/ui/nested",  # TODO: verify if trailing slash is needed, doesn't seem so from regression tests
-                role="some_role",
                 overwrite=overwrite_param,
             ),
             mock.call(
                 local_path=local_path / "README.md",
                 stage_path=f"{stage_name}",
-                role="some_role",
                 overwrite=overwrite_param,
             ),
         ]
-        assert mock_put.mock_calls == expected
+        assert sorted(mock_put.call_args_list, key=str) == sorted(expected, key=str)
+        mock_use_role.assert_called_once_with("some_role")
+        assert result.uploaded == ["ui/nested/environment.yml", "README.md"]
+        assert result.skipped == []
+
+
+@mock.patch(f"{STAGE_MANAGER}.put")
+def test_put_files_on_stage_uses_wildcard_for_complete_directories(
+    mock_put, mock_cursor
+):
+    stage_name = "some_stage_name"
+    mock_put.return_value = mock_cursor(
+        rows=[
+            ("a.py", "a.py", 1, 1, "NONE", "NONE", "UPLOADED", ""),
+            ("b.py", "b.py", 1, 1, "NONE", "NONE", "SKIPPED", ""),
+        ],
+        columns=[
+            "source",
+            "target",
+            "source_size",
+            "target_size",
+            "source_compression",
+            "target_compression",
+            "status",
+            "message",
+        ],
+    )
+    with temp_local_dir(
+        {
+            "complete/a.py": "# a\n",
+            "complete/b.py": "# b\n",
+            "partial/a.py": "# a\n",
+            "partial/b.py": "# b\n",
+            "partial/c.py": "# c\n",
+        }
+    ) as local_path:
+        result = put_files_on_stage(
+            stage_manager=StageManager(),
+            stage_fqn=stage_name,
+            deploy_root_path=local_path,
+            files=["complete/a.py", "complete/b.py", "partial/a.py", "partial/b.py"],
+            overwrite=True,
+        )
+        expected = [
+            mock.call(
+                local_path=local_path / "complete" / "*",
+                stage_path=f"{stage_name}/complete",
+                overwrite=True,
+            ),
+            mock.call(
+                local_path=local_path / "partial/a.py",
+                stage_path=f"{stage_name}/partial",
+                overwrite=True,
+            ),
+            mock.call(
+                local_path=local_path / "partial/b.py",
+                stage_path=f"{stage_name}/partial",
+                overwrite=True,
+            ),
+        ]
+        assert sorted(mock_put.call_args_list, key=str) == sorted(expected, key=str)
+        assert result.uploaded == ["complete/a.py", "partial/a.py"]
+        assert result.skipped == ["complete/b.py", "partial/b.py"]
 
 
 @mock.patch(f"{STAGE_MANAGER}.remove")
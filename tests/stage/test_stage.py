@@ -1,9 +1,15 @@
+import json
+import re
+import threading
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from unittest import mock
 
 import pytest
-from snowflake.cli.plugins.stage.manager import StageManager
+from snowflake.cli.plugins.stage.manager import (
+    MAX_REMOVE_PATTERN_LENGTH,
+    StageManager,
+)
 from snowflake.connector import ProgrammingError
 from snowflake.connector.cursor import DictCursor
 
@@ -591,6 +597,52 @@ def test_stage_internal_remove_no_role_change(mock_execute, mock_cursor):
     assert mock_execute.mock_calls == expected
 
 
+@mock.patch(f"{STAGE_MANAGER}._execute_query")
+def test_stage_internal_remove_files(mock_execute, mock_cursor):
+    mock_execute.return_value = mock_cursor([{"CURRENT_ROLE()": "old_role"}], [])
+    sm = StageManager()
+    sm.remove_files("stageName", ["my/file/foo.csv", "bar+1.txt"], "new_role")
+    expected = [
+        mock.call("select current_role()", cursor_class=DictCursor),
+        mock.call("use role new_role"),
+        mock.call(
+            r"remove @stageName pattern = '[^/]*/(my/file/foo\\.csv|bar\\+1\\.txt)'"
+        ),
+        mock.call("use role old_role"),
+    ]
+    assert mock_execute.mock_calls == expected
+
+
+@mock.patch(f"{STAGE_MANAGER}._execute_query")
+def test_stage_internal_remove_files_escapes_only_special_characters(
+    mock_execute, mock_cursor
+):
+    sm = StageManager()
+    sm.remove_files("stageName", ["my-file #1.txt", "a~b&c.txt"])
+
+    mock_execute.assert_called_once_with(
+        r"remove @stageName pattern = '[^/]*/(my-file #1\\.txt|a~b&c\\.txt)'"
+    )
+
+
+@mock.patch(f"{STAGE_MANAGER}._execute_query")
+def test_stage_internal_remove_files_in_chunks(mock_execute, mock_cursor):
+    paths = [f"file{i:05}.sql" for i in range(20000)]
+    sm = StageManager()
+    sm.remove_files("stageName", paths)
+
+    assert mock_execute.call_count > 1
+    removed = []
+    for call in mock_execute.mock_calls:
+        query = call.args[0]
+        assert query.startswith("remove @stageName pattern = ")
+        # undo escaping of backslashes in the string literal
+        pattern = query[len("remove @stageName pattern = '") : -1].replace("\\\\", "\\")
+        assert len(pattern) <= MAX_REMOVE_PATTERN_LENGTH
+        removed += [p for p in paths if re.fullmatch(pattern, f"stagename/{p}")]
+    assert sorted(removed) == paths
+
+
 @mock.patch(f"{STAGE_MANAGER}._execute_query")
 def test_stage_internal_put(mock_execute, mock_cursor):
     mock_execute.return_value = mock_cursor([{"CURRENT_ROLE()": "old_role"}], [])
@@ -663,31 +715,47 @@ def test_stage_internal_put_quoted_path(
 
 
 @pytest.mark.parametrize(
-    "stage_path, expected_files",
+    "stage_path, expected_files, expected_ls",
     [
-        ("@exe", ["exe/s1.sql", "exe/a/s3.sql", "exe/a/b/s4.sql"]),
+        ("@exe", ["exe/s1.sql", "exe/a/s3.sql", "exe/a/b/s4.sql"], "ls @exe"),
         (
             "snow://exe",
             ["exe/s1.sql", "exe/a/s3.sql", "exe/a/b/s4.sql"],
+            "ls @exe",
         ),
-        ("exe", ["exe/s1.sql", "exe/a/s3.sql", "exe/a/b/s4.sql"]),
-        ("exe/", ["exe/s1.sql", "exe/a/s3.sql", "exe/a/b/s4.sql"]),
-        ("exe/*", ["exe/s1.sql", "exe/a/s3.sql", "exe/a/b/s4.sql"]),
-        ("exe/*.sql", ["exe/s1.sql", "exe/a/s3.sql", "exe/a/b/s4.sql"]),
-        ("exe/a", ["exe/a/s3.sql", "exe/a/b/s4.sql"]),
-        ("exe/a/", ["exe/a/s3.sql", "exe/a/b/s4.sql"]),
-        ("exe/a/*", ["exe/a/s3.sql", "exe/a/b/s4.sql"]),
-        ("exe/a/*.sql", ["exe/a/s3.sql", "exe/a/b/s4.sql"]),
-        ("exe/a/b", ["exe/a/b/s4.sql"]),
-        ("exe/a/b/", ["exe/a/b/s4.sql"]),
-        ("exe/a/b/*", ["exe/a/b/s4.sql"]),
-        ("exe/a/b/*.sql", ["exe/a/b/s4.sql"]),
-        ("exe/s?.sql", ["exe/s1.sql"]),
-        ("exe/s1.sql", ["exe/s1.sql"]),
+        ("exe", ["exe/s1.sql", "exe/a/s3.sql", "exe/a/b/s4.sql"], "ls @exe"),
+        ("exe/", ["exe/s1.sql", "exe/a/s3.sql", "exe/a/b/s4.sql"], "ls @exe"),
+        ("exe/*", ["exe/s1.sql", "exe/a/s3.sql", "exe/a/b/s4.sql"], "ls @exe"),
+        (
+            "exe/*.sql",
+            ["exe/s1.sql", "exe/a/s3.sql", "exe/a/b/s4.sql"],
+            r"ls @exe pattern = '.*/.*\\.sql'",
+        ),
+        ("exe/a", ["exe/a/s3.sql", "exe/a/b/s4.sql"], "ls @exe pattern = '.*/a.*'"),
+        ("exe/a/", ["exe/a/s3.sql", "exe/a/b/s4.sql"], "ls @exe/a/"),
+        ("exe/a/*", ["exe/a/s3.sql", "exe/a/b/s4.sql"], "ls @exe/a/"),
+        (
+            "exe/a/*.sql",
+            ["exe/a/s3.sql", "exe/a/b/s4.sql"],
+            r"ls @exe/a/ pattern = '.*/.*\\.sql'",
+        ),
+        ("exe/a/b", ["exe/a/b/s4.sql"], "ls @exe/a/ pattern = '.*/b.*'"),
+        ("exe/a/b/", ["exe/a/b/s4.sql"], "ls @exe/a/b/"),
+        ("exe/a/b/*", ["exe/a/b/s4.sql"], "ls @exe/a/b/"),
+        (
+            "exe/a/b/*.sql",
+            ["exe/a/b/s4.sql"],
+            r"ls @exe/a/b/ pattern = '.*/.*\\.sql'",
+        ),
+        ("exe/s?.sql", ["exe/s1.sql"], r"ls @exe pattern = '.*/s.\\.sql'"),
+        ("exe/s1.sql", ["exe/s1.sql"], r"ls @exe pattern = '.*/s1\\.sql.*'"),
+        ("exe/[s]1.sql", ["exe/s1.sql"], "ls @exe"),
     ],
 )
 @mock.patch(f"{STAGE_MANAGER}._execute_query")
-def test_execute(mock_execute, mock_cursor, runner, stage_path, expected_files):
+def test_execute(
+    mock_execute, mock_cursor, runner, stage_path, expected_files, expected_ls
+):
     mock_execute.return_value = mock_cursor(
         [
             {"name": "exe/a/s3.sql"},
@@ -702,12 +770,31 @@ def test_execute(mock_execute, mock_cursor, runner, stage_path, expected_files):
 
     assert result.exit_code == 0, result.output
     ls_call, *execute_calls = mock_execute.mock_calls
-    assert ls_call == mock.call(f"ls @exe", cursor_class=DictCursor)
+    assert ls_call == mock.call(expected_ls, cursor_class=DictCursor)
     assert execute_calls == [
         mock.call(f"execute immediate from @{p}") for p in expected_files
     ]
 
 
+@pytest.mark.parametrize(
+    "stage_path, expected_location, expected_pattern",
+    [
+        ("@exe", "@exe", None),
+        ("@exe/migrations/V12*.sql", "@exe/migrations/", r".*/v12.*\.sql"),
+        ("@exe/a/b?/c.sql", "@exe/a/", r".*/b./c\.sql"),
+        ("@exe/a/file(1).sql", "@exe/a/", r".*/file\(1\)\.sql.*"),
+        ("@exe/a/[bc]*.sql", "@exe/a/", None),
+        ("@ex*/a.sql", "@ex*", None),
+    ],
+)
+def test_execute_listing_scope(stage_path, expected_location, expected_pattern):
+    stage_name = StageManager.get_stage_name_from_path(stage_path)
+    assert StageManager._get_listing_scope(stage_name, stage_path) == (  # noqa: SLF001
+        expected_location,
+        expected_pattern,
+    )
+
+
 @mock.patch(f"{STAGE_MANAGER}._execute_query")
 def test_execute_with_variables(mock_execute, mock_cursor, runner):
     mock_execute.return_value = mock_cursor([{"name": "exe/s1.sql"}], [])
@@ -873,3 +960,84 @@ def test_execute_continue_on_error(mock_execute, mock_cursor, runner, snapshot):
         mock.call(f"execute immediate from @exe/s2.sql"),
         mock.call(f"execute immediate from @exe/s3.sql"),
     ]
+
+
+def _mock_parallel_execute(mock_cursor, files, failing=()):
+    executed = []
+    lock = threading.Lock()
+
+    def _execute(query, **kwargs):
+        if query.startswith("ls"):
+            return mock_cursor([{"name": file} for file in files], [])
+        with lock:
+            executed.append(query.split("@", 1)[1])
+        if query.split("@", 1)[1] in failing:
+            raise ProgrammingError("Error")
+        return mock_cursor([{"1": 1}], [])
+
+    return _execute, executed
+
+
+@mock.patch(f"{STAGE_MANAGER}._execute_query")
+def test_execute_parallel_runs_directories_in_order(mock_execute, mock_cursor, runner):
+    files = ["exe/a/s3.sql", "exe/s2.sql", "exe/b/s4.sql", "exe/s1.sql", "exe/a/s5.sql"]
+    mock_execute.side_effect, executed = _mock_parallel_execute(mock_cursor, files)
+
+    result = runner.invoke(
+        ["stage", "execute", "exe", "--parallel", "4", "--format", "json"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert set(executed[:2]) == {"exe/s1.sql", "exe/s2.sql"}
+    assert set(executed[2:4]) == {"exe/a/s3.sql", "exe/a/s5.sql"}
+    assert executed[4] == "exe/b/s4.sql"
+    assert [row["File"] for row in json.loads(result.output)] == [
+        "exe/s1.sql",
+        "exe/s2.sql",
+        "exe/a/s3.sql",
+        "exe/a/s5.sql",
+        "exe/b/s4.sql",
+    ]
+
+
+@mock.patch(f"{STAGE_MANAGER}._execute_query")
+def test_execute_parallel_stop_on_error(mock_execute, mock_cursor, runner):
+    files = ["exe/s1.sql", "exe/s2.sql", "exe/a/s3.sql"]
+    mock_execute.side_effect, executed = _mock_parallel_execute(
+        mock_cursor, files, failing={"exe/s2.sql"}
+    )
+
+    with pytest.raises(ProgrammingError):
+        runner.invoke(["stage", "execute", "exe", "--parallel", "2"])
+
+    assert "exe/a/s3.sql" not in executed
+
+
+@mock.patch(f"{STAGE_MANAGER}._execute_query")
+def test_execute_parallel_continue_on_error(mock_execute, mock_cursor, runner):
+    files = ["exe/s1.sql", "exe/s2.sql", "exe/a/s3.sql"]
+    mock_execute.side_effect, executed = _mock_parallel_execute(
+        mock_cursor, files, failing={"exe/s2.sql"}
+    )
+
+    result = runner.invoke(
+        [
+            "stage",
+            "execute",
+            "exe",
+            "--parallel",
+            "2",
+            "--on-error",
+            "continue",
+            "--format",
+            "json",
+        ]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert len(executed) == 3
+    assert json.loads(result.output) == [
+        {"File": "exe/s1.sql", "Status": "SUCCESS", "Error": None},
+        {"File": "exe/s2.sql", "Status": "FAILURE", "Error": "Error"},
+        {"File": "exe/a/s3.sql", "Status": "SUCCESS", "Error": None},
+    ]
@@ -180,15 +180,17 @@ def test_not_existing_external_entrypoint_handling(enabled_plugin_names_mock, ru
     assert result.output.count("Manages a Streamlit app in Snowflake") == 1
 
 
-@mock.patch("pluggy.PluginManager.load_setuptools_entrypoints")
+@mock.patch(
+    "snowflake.cli.app.commands_registration.command_plugins_loader.discover_external_plugins"
+)
 @mock.patch(
     "snowflake.cli.app.api_impl.plugin.plugin_config_provider_impl.PluginConfigProviderImpl.get_enabled_plugin_names"
 )
 def test_broken_external_entrypoint_handling(
-    enabled_plugin_names_mock, load_setuptools_entrypoints_mock, runner
+    enabled_plugin_names_mock, discover_external_plugins_mock, runner
 ):
     enabled_plugin_names_mock.return_value = ["xyz123"]
-    load_setuptools_entrypoints_mock.side_effect = RuntimeError("Test exception")
+    discover_external_plugins_mock.side_effect = RuntimeError("Test exception")
 
     result = runner.invoke(["-h"])
     assert result.exit_code == 0
@@ -98,6 +98,17 @@ def test_connection_caching(mock_connect):
     )
 
 
+@mock.patch("snowflake.cli.app.snow_connector.connect_to_snowflake")
+def test_connection_is_cached_when_options_are_set_to_same_values(mock_connect):
+    flags.RoleOption.callback("newValue")
+    _ = cli_context.connection
+
+    flags.RoleOption.callback("newValue")
+    flags.UserOption.callback(None)
+    _ = cli_context.connection
+    assert mock_connect.call_count == 1
+
+
 @pytest.mark.parametrize("schema", ["my_schema", '".my_schema3"', '"my.schema"'])
 def test_schema_validation_ok(schema):
     cli_context_manager.connection_context.set_schema(schema)
@@ -108,3 +119,75 @@ def test_schema_validation_error(schema):
     with pytest.raises(InvalidSchemaError) as e:
         cli_context_manager.connection_context.set_schema(schema)
         assert e.value.message == f"Invalid schema {schema}"
+
+
+@pytest.fixture
+def warm_connection_context():
+    context = cli_context_manager.connection_context
+    with mock.patch("snowflake.cli.app.telemetry.command_info") as mock_command_info:
+        mock_command_info.return_value = "SNOWCLI.TEST"
+        yield context
+    if context._warm_up_thread:  # noqa: SLF001
+        context._warm_up_thread.join()  # noqa: SLF001
+
+
+@mock.patch("snowflake.cli.app.snow_connector.requires_user_interaction")
+@mock.patch("snowflake.cli.app.snow_connector.connect_to_snowflake")
+def test_warm_up_connects_in_background(
+    mock_connect, mock_interaction, warm_connection_context
+):
+    mock_interaction.return_value = False
+    warm_connection_context.warm_up()
+    warm_connection_context.warm_up()
+
+    assert cli_context.connection is mock_connect.return_value
+    assert cli_context.connection is mock_connect.return_value
+    mock_connect.assert_called_once()
+    assert mock_connect.call_args.kwargs["redirect_output"] is False
+    assert mock_connect.call_args.kwargs["application"] == "SNOWCLI.TEST"
+
+
+@mock.patch("snowflake.cli.app.snow_connector.requires_user_interaction")
+@mock.patch("snowflake.cli.app.snow_connector.connect_to_snowflake")
+def test_warm_up_is_skipped_if_connecting_may_prompt_user(
+    mock_connect, mock_interaction, warm_connection_context
+):
+    mock_interaction.return_value = True
+    warm_connection_context.warm_up()
+
+    assert warm_connection_context._warm_up_thread is None  # noqa: SLF001
+    mock_connect.assert_not_called()
+    _ = cli_context.connection
+    assert "redirect_output" not in mock_connect.call_args.kwargs
+
+
+@mock.patch("snowflake.cli.app.snow_connector.requires_user_interaction")
+@mock.patch("snowflake.cli.app.snow_connector.connect_to_snowflake")
+def test_warm_up_error_is_raised_on_first_use(
+    mock_connect, mock_interaction, warm_connection_context
+):
+    mock_interaction.return_value = False
+    mock_connect.side_effect = [RuntimeError("login failed"), mock.Mock()]
+    warm_connection_context.warm_up()
+    warm_connection_context._warm_up_thread.join()  # noqa: SLF001
+
+    with pytest.raises(RuntimeError, match="login failed"):
+        _ = cli_context.connection
+    assert cli_context.connection is not None
+    assert mock_connect.call_count == 2
+
+
+@mock.patch("snowflake.cli.app.snow_connector.requires_user_interaction")
+@mock.patch("snowflake.cli.app.snow_connector.connect_to_snowflake")
+def test_warm_up_connection_is_dropped_after_settings_change(
+    mock_connect, mock_interaction, warm_connection_context
+):
+    mock_interaction.return_value = False
+    stale_connection, connection = mock.Mock(), mock.Mock()
+    mock_connect.side_effect = [stale_connection, connection]
+    warm_connection_context.warm_up()
+    flags.RoleOption.callback("otherRole")
+    warm_connection_context._warm_up_thread.join()  # noqa: SLF001
+
+    assert cli_context.connection is connection
+    assert mock_connect.call_args.kwargs["role"] == "otherRole"
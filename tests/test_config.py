@@ -194,6 +194,22 @@ def test_connections_toml_override_config_toml(test_snowcli_config, snowflake_ho
     }
 
 
+def test_connections_toml_is_read_by_config_manager(
+    test_snowcli_config, snowflake_home
+):
+    from snowflake.cli.api import config
+
+    connections_toml = snowflake_home / "connections.toml"
+    connections_toml.write_text('[default]\ndatabase = "overridden_database"\n')
+    connections_toml.chmod(0o600)
+
+    with mock.patch.object(config, "_parse_toml") as parse_toml:
+        config.config_init(test_snowcli_config)
+
+    parse_toml.assert_not_called()
+    assert config.get_default_connection_dict() == {"database": "overridden_database"}
+
+
 @pytest.mark.parametrize(
     "chmod",
     [
@@ -281,3 +297,49 @@ def test_no_error_when_init_from_non_default_config(
     connections_path.chmod(0o777)
 
     config_init(test_snowcli_config)
+
+
+@mock.patch.dict(os.environ, {}, clear=True)
+def test_config_files_are_parsed_once(test_snowcli_config):
+    from snowflake.cli.api import config
+
+    with mock.patch.object(
+        config, "_parse_toml", wraps=config._parse_toml  # noqa: SLF001
+    ) as parse_toml:
+        config.config_init(test_snowcli_config)
+        config.get_connection_dict("full")
+        config.get_default_connection_dict()
+        config.get_config_section("connections")
+
+    parse_toml.assert_called_once()
+
+
+@mock.patch.dict(os.environ, {}, clear=True)
+def test_memoized_config_section_reflects_environment_variables(test_snowcli_config):
+    from snowflake.cli.api import config
+
+    config.config_init(test_snowcli_config)
+    assert config.get_connection_dict("default")["warehouse"] == "xs"
+
+    with mock.patch.dict(os.environ, {"SNOWFLAKE_CONNECTIONS_DEFAULT_WAREHOUSE": "l"}):
+        assert config.get_connection_dict("default")["warehouse"] == "l"
+
+    connection = config.get_connection_dict("default")
+    connection["warehouse"] = "modified"
+    assert config.get_connection_dict("default")["warehouse"] == "xs"
+
+
+@mock.patch.dict(os.environ, {}, clear=True)
+def test_config_is_read_again_after_modification(test_snowcli_config, tmp_path):
+    from snowflake.cli.api import config
+
+    config_file = tmp_path / "config.toml"
+    config_file.write_text(test_snowcli_config.read_text())
+    config_file.chmod(0o600)
+    config.config_init(config_file)
+    config.get_config_section("connections")
+
+    config.add_connection("added", config.ConnectionConfig(account="added_account"))
+
+    assert config.get_connection_dict("added") == {"account": "added_account"}
+    assert "[connections.added]" in config_file.read_text()
@@ -1,7 +1,124 @@
+import os
+import subprocess
 import sys
+from typing import Dict, List, Set
 
 import pytest
 
+# Modules slow to import. Commands should import them only when they use them.
+HEAVY_MODULES = [
+    "snowflake.connector",
+    "rich",
+    "jinja2",
+    "yaml",
+    "requests",
+    "pydantic",
+    "packaging",
+    "tomlkit",
+    "cryptography",
+    "git",
+]
+# Dependencies imported by all commands: typer renders the output with rich, and the
+# connector reads the configuration. Heavy modules imported by them are not budgeted.
+ALWAYS_IMPORTED = ["typer", "snowflake.connector"]
+
+# command to heavy modules it is allowed to import apart from the ones always imported
+IMPORT_BUDGETS: Dict[str, Set[str]] = {
+    "--version": set(),
+    "connection list": set(),
+    "connection --help": set(),
+    "daemon status": set(),
+    "sql --help": set(),
+    "object --help": set(),
+    "stage --help": set(),
+    "git --help": set(),
+    "app --help": set(),
+    "app init --help": set(),
+    "app deploy --help": set(),
+    "app bundle": {"yaml", "pydantic"},
+    "snowpark --help": set(),
+    "snowpark init new_project": set(),
+    "snowpark deploy --help": set(),
+    "streamlit --help": set(),
+    "streamlit init new_project": set(),
+    "streamlit deploy --help": set(),
+    "spcs --help": set(),
+    "spcs image-repository --help": set(),
+    "render template --help": set(),
+}
+# commands run in a copy of the project instead of an empty directory
+COMMAND_PROJECTS = {"app bundle": "napp_project_1"}
+
+
+class ImportTimes:
+    """Modules imported by a command, recorded with `python -X importtime`."""
+
+    def __init__(self, output: str):
+        # module name to its cumulative import time in microseconds
+        self.times: Dict[str, int] = {}
+        # module name to the module that imported it
+        self.importers: Dict[str, str] = {}
+        stack: List[tuple] = []
+        for line in reversed(output.splitlines()):
+            if not line.startswith("import time:") or line.count("|") != 2:
+                continue
+            _, cumulative, name = line.split("|")
+            if not cumulative.strip().isdigit():
+                continue
+            depth = len(name) - len(name.lstrip())
+            name = name.strip()
+            while stack and stack[-1][0] >= depth:
+                stack.pop()
+            if stack:
+                self.importers.setdefault(name, stack[-1][1])
+            self.times.setdefault(name, int(cumulative))
+            stack.append((depth, name))
+
+    def imported(self, module: str) -> bool:
+        return module in self.times
+
+    def import_chain(self, module: str) -> str:
+        chain = [f"{module} ({self.times[module] // 1000}ms)"]
+        while chain[-1].split()[0] in self.importers:
+            chain.append(self.importers[chain[-1].split()[0]])
+        return " <- ".join(chain)
+
+
+def _run_with_import_times(args: List[str], env: Dict[str, str]) -> ImportTimes:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    return ImportTimes(result.stderr)
+
+
+def record_import_times(args: List[str], snowflake_home) -> ImportTimes:
+    env = {
+        **os.environ,
+        "SNOWFLAKE_HOME": str(snowflake_home),
+        "SNOWFLAKE_CLI_FEATURES_ENABLE_LAZY_COMMAND_LOADING": "true",
+    }
+    return _run_with_import_times(["-m", "snowflake.cli.app", *args], env)
+
+
+@pytest.fixture(scope="module")
+def snowflake_home(tmp_path_factory):
+    home = tmp_path_factory.mktemp("snowflake_home")
+    # generates the manifest of commands, so that measured commands load lazily
+    record_import_times(["connection", "--help"], home)
+    return home
+
+
+@pytest.fixture(scope="module")
+def always_imported() -> Set[str]:
+    import_times = _run_with_import_times(
+        ["-c", f"import {', '.join(ALWAYS_IMPORTED)}"], dict(os.environ)
+    )
+    return {module for module in HEAVY_MODULES if import_times.imported(module)}
+
 
 @pytest.mark.loaded_modules
 def test_loaded_modules(runner):
@@ -11,3 +128,36 @@ def test_loaded_modules(runner):
 
     loaded_modules = sys.modules.keys()
     assert loaded_modules.isdisjoint(should_not_load)
+
+
+@pytest.mark.loaded_modules
+@pytest.mark.parametrize("command", IMPORT_BUDGETS)
+def test_heavy_modules_are_imported_only_when_needed(
+    command, snowflake_home, always_imported, project_directory
+):
+    with project_directory(COMMAND_PROJECTS.get(command, "empty_project")):
+        import_times = record_import_times(command.split(), snowflake_home)
+
+    allowed = always_imported | IMPORT_BUDGETS[command]
+    unexpected = [
+        import_times.import_chain(module)
+        for module in HEAVY_MODULES
+        if module not in allowed and import_times.imported(module)
+    ]
+    assert not unexpected, "\n".join(unexpected)
+
+
+@pytest.mark.loaded_modules
+def test_import_times_are_parsed():
+    import_times = ImportTimes(
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       100 |        100 |     yaml.error\n"
+        "import time:       200 |       2300 |   yaml\n"
+        "import time:       300 |       2600 | snowflake.cli.plugins.spcs\n"
+    )
+
+    assert import_times.imported("yaml")
+    assert not import_times.imported("jinja2")
+    assert import_times.import_chain("yaml.error") == (
+        "yaml.error (0ms) <- yaml <- snowflake.cli.plugins.spcs"
+    )
@@ -1,10 +1,28 @@
+import os
 import subprocess
+from contextlib import redirect_stdout
+from datetime import datetime
 from timeit import default_timer as timer
 
 import pytest
+from snowflake.cli.api.output.formats import OutputFormat
+from snowflake.cli.api.output.types import CollectionResult
+from snowflake.cli.app.printing import print_result
 
 SAMPLE_AMOUNT = 20
 EXECUTION_TIME_THRESHOLD = 1.3
+# statements are executed without logging in, but all plugins are still imported
+DAEMON_SQL_EXECUTION_TIME_THRESHOLD = 2.5
+PRINTED_ROWS_AMOUNT = 100_000
+# thresholds leave a wide margin, as rendering tables in particular varies between machines
+PRINTED_ROWS_PER_SECOND_THRESHOLD = {
+    OutputFormat.TABLE: 400,
+    OutputFormat.JSON: 20_000,
+    OutputFormat.NDJSON: 20_000,
+    OutputFormat.CSV: 50_000,
+    OutputFormat.ARROW: 50_000,
+    OutputFormat.PARQUET: 50_000,
+}
 
 
 @pytest.mark.performance
@@ -18,3 +36,55 @@ def test_snow_help_performance():
 
     results.sort()
     assert results[int(SAMPLE_AMOUNT * 0.9)] <= EXECUTION_TIME_THRESHOLD
+
+
+@pytest.mark.performance
+def test_snow_sql_through_daemon_performance(test_snowcli_config, monkeypatch):
+    monkeypatch.setenv("SNOWFLAKE_CLI_DAEMON_FAKE_CONNECTOR", "true")
+    config = ["--config-file", str(test_snowcli_config)]
+    subprocess.run(
+        ["snow", *config, "daemon", "start", "--fake-connector"],
+        stdout=subprocess.DEVNULL,
+        check=True,
+    )
+    results = []
+    try:
+        for _ in range(SAMPLE_AMOUNT):
+            start = timer()
+            subprocess.run(
+                ["snow", *config, "sql", "-q", "select 1"],
+                stdout=subprocess.DEVNULL,
+                check=True,
+            )
+            end = timer()
+            results.append(end - start)
+    finally:
+        subprocess.run(["snow", *config, "daemon", "stop"], stdout=subprocess.DEVNULL)
+
+    results.sort()
+    assert results[int(SAMPLE_AMOUNT * 0.9)] <= DAEMON_SQL_EXECUTION_TIME_THRESHOLD
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("output_format", list(OutputFormat))
+def test_print_result_rows_per_second(output_format):
+    if output_format.is_binary:
+        pytest.importorskip("pyarrow")
+    rows = (
+        {
+            "id": i,
+            "name": f"name_{i}",
+            "amount": i * 1.5,
+            "created_on": datetime(2024, 1, 1),
+        }
+        for i in range(PRINTED_ROWS_AMOUNT)
+    )
+
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        start = timer()
+        print_result(CollectionResult(rows), output_format=output_format)
+        end = timer()
+
+    rows_per_second = PRINTED_ROWS_AMOUNT / (end - start)
+    print(f"{output_format.value}: {rows_per_second:.0f} rows/s")
+    assert rows_per_second >= PRINTED_ROWS_PER_SECOND_THRESHOLD[output_format]
@@ -123,3 +123,27 @@ def test_returns_nice_error_in_case_of_missing_master_token(runner):
         "When using a session token, you must provide the corresponding master token"
         in result.output
     )
+
+
+@pytest.mark.parametrize(
+    "overrides, expected",
+    [
+        ({}, False),
+        ({"authenticator": "externalbrowser"}, True),
+        ({"authenticator": "username_password_mfa"}, True),
+        ({"authenticator": "username_password_mfa", "passcode": "123456"}, False),
+        ({"authenticator": "snowflake_jwt"}, False),
+    ],
+)
+def test_requires_user_interaction(overrides, expected):
+    from snowflake.cli.app.snow_connector import requires_user_interaction
+
+    assert requires_user_interaction(**overrides) is expected
+
+
+def test_mfa_passcode_from_command_line_avoids_user_interaction():
+    from snowflake.cli.app.snow_connector import requires_user_interaction
+
+    assert not requires_user_interaction(
+        mfa_passcode="123456", authenticator="username_password_mfa"
+    )
@@ -3,10 +3,12 @@ from tempfile import NamedTemporaryFile
 from unittest import mock
 
 import pytest
+from click import UsageError
 from snowflake.cli.api.constants import ObjectType
 from snowflake.cli.api.exceptions import SnowflakeSQLExecutionError
 from snowflake.cli.api.project.util import identifier_to_show_like_pattern
-from snowflake.cli.api.sql_execution import SqlExecutionMixin
+from snowflake.cli.api.sql_execution import ConcurrentStatement, SqlExecutionMixin
+from snowflake.cli.plugins.sql.manager import SqlManager, plan_statements
 from snowflake.connector.cursor import DictCursor
 from snowflake.connector.errors import ProgrammingError
 
@@ -23,7 +25,7 @@ def test_sql_execute_query(mock_execute, runner, mock_cursor):
     mock_execute.assert_called_once_with("query")
 
 
-@mock.patch("snowflake.cli.plugins.sql.manager.SqlExecutionMixin._execute_string")
+@mock.patch("snowflake.cli.plugins.sql.manager.SqlExecutionMixin._execute_statements")
 def test_sql_execute_file(mock_execute, runner, mock_cursor):
     mock_execute.return_value = (mock_cursor(["row"], []) for _ in range(1))
     query = "query from file"
@@ -32,11 +34,12 @@ def test_sql_execute_file(mock_execute, runner, mock_cursor):
         Path(tmp_file.name).write_text(query)
         result = runner.invoke(["sql", "-f", tmp_file.name])
 
-    assert result.exit_code == 0
-    mock_execute.assert_called_once_with(query)
+        assert result.exit_code == 0
+        mock_execute.assert_called_once()
+        assert list(mock_execute.call_args.args[0]) == [(query, False)]
 
 
-@mock.patch("snowflake.cli.plugins.sql.manager.SqlExecutionMixin._execute_string")
+@mock.patch("snowflake.cli.plugins.sql.manager.SqlExecutionMixin._execute_statements")
 def test_sql_execute_from_stdin(mock_execute, runner, mock_cursor):
     mock_execute.return_value = (mock_cursor(["row"], []) for _ in range(1))
     query = "query from input"
@@ -44,7 +47,50 @@ def test_sql_execute_from_stdin(mock_execute, runner, mock_cursor):
     result = runner.invoke(["sql", "-i"], input=query)
 
     assert result.exit_code == 0
-    mock_execute.assert_called_once_with(query)
+    mock_execute.assert_called_once()
+    assert list(mock_execute.call_args.args[0]) == [(query, False)]
+
+
+@pytest.mark.parametrize(
+    "contents, expected_single_statement",
+    [
+        ("select 1;", True),
+        ("-- comment\nselect 1;\n-- another comment\n", True),
+        ("select 1;\nselect 2;", False),
+        ("select 1; select 2; select 3;", False),
+    ],
+)
+@mock.patch("snowflake.cli.plugins.sql.manager.SqlExecutionMixin._execute_statements")
+def test_sql_manager_detects_single_statement_in_file(
+    mock_execute, contents, expected_single_statement
+):
+    with NamedTemporaryFile("w", suffix=".sql") as tmp_file:
+        Path(tmp_file.name).write_text(contents)
+        single_statement, _ = SqlManager().execute(None, Path(tmp_file.name), False)
+
+    assert single_statement == expected_single_statement
+
+
+@mock.patch("snowflake.cli.api.sql_execution.SqlExecutionMixin._conn")
+def test_execute_statements_submits_statements_as_they_are_read(mock_conn):
+    read_statements = []
+
+    def statements():
+        for sql in ["select 1", "select 2"]:
+            read_statements.append(sql)
+            yield sql, False
+
+    cursors = SqlExecutionMixin()._execute_statements(statements())  # noqa: SLF001
+    assert read_statements == []
+
+    next(cursors)
+    assert read_statements == ["select 1"]
+    mock_conn.cursor.return_value.execute.assert_called_once_with(
+        "select 1", _is_put_get=False
+    )
+
+    assert len(list(cursors)) == 1
+    assert read_statements == ["select 1", "select 2"]
 
 
 def test_sql_fails_if_no_query_file_or_stdin(runner):
@@ -270,3 +316,154 @@ def test_show_specific_object_multiple_rows(mock_execute_query):
 def test_use_command(mock_execute_query, _object):
     SqlExecutionMixin().use(object_type=_object, name="foo_name")
     mock_execute_query.assert_called_once_with(f"use {_object.value.sf_name} foo_name")
+
+
+def test_plan_statements_dependencies():
+    statements = [
+        ("-- @name a\ncreate table a (x int);", False),
+        ("-- @name b\ncreate table b (x int);", False),
+        ("-- @depends a, b\ncreate view c as select * from a, b;", False),
+        ("-- just a comment", False),
+        ("use warehouse w;", False),
+        ("create table d (x int);", False),
+        ("-- @depends: a\ncreate table e (x int);", False),
+        ("put file:///tmp/f @stage;", True),
+        ("select 1;", False),
+    ]
+
+    assert list(plan_statements(statements)) == [
+        ConcurrentStatement("create table a (x int);", frozenset()),
+        ConcurrentStatement("create table b (x int);", frozenset()),
+        ConcurrentStatement("create view c as select * from a, b;", frozenset({0, 1})),
+        ConcurrentStatement("use warehouse w;", frozenset({0, 1, 2})),
+        ConcurrentStatement("create table d (x int);", frozenset({3})),
+        ConcurrentStatement("create table e (x int);", frozenset({0, 3})),
+        ConcurrentStatement("put file:///tmp/f @stage;", frozenset({3, 4, 5}), True),
+        ConcurrentStatement("select 1;", frozenset({6})),
+    ]
+
+
+def test_plan_statements_unknown_dependency():
+    with pytest.raises(UsageError, match="depends on unknown statement 'b'"):
+        list(plan_statements([("-- @depends b\nselect 1;", False)]))
+
+
+class _FakeAsyncConnection:
+    """Runs each query for the number of polls given in its text, e.g. 'q1 polls=2'."""
+
+    def __init__(self):
+        self.remaining_polls = {}
+        self.events = []
+        self.running = set()
+        self.max_running = 0
+
+    def cursor(self, cursor_class):
+        connection = self
+
+        class _Cursor:
+            sfqid = None
+
+            def execute_async(self, sql):
+                self.sfqid = sql
+                connection.remaining_polls[sql] = int(sql.split("polls=")[1])
+                connection.running.add(sql)
+                connection.max_running = max(
+                    connection.max_running, len(connection.running)
+                )
+                connection.events.append(("submit", sql))
+
+            def execute(self, sql, _is_put_get):
+                self.sfqid = sql
+                connection.events.append(("execute", sql))
+
+            def get_results_from_sfqid(self, sfqid):
+                connection.events.append(("done", sfqid))
+
+            def abort_query(self, sfqid):
+                connection.events.append(("abort", sfqid))
+
+        return _Cursor()
+
+    def get_query_status_throw_if_error(self, sfqid):
+        if "fail" in sfqid:
+            raise ProgrammingError(f"{sfqid} failed")
+        self.remaining_polls[sfqid] -= 1
+        return sfqid
+
+    def is_still_running(self, sfqid):
+        if self.remaining_polls[sfqid] > 0:
+            return True
+        self.running.discard(sfqid)
+        return False
+
+
+@mock.patch("snowflake.cli.api.sql_execution.time.sleep")
+@mock.patch("snowflake.cli.api.sql_execution.SqlExecutionMixin._conn")
+def test_execute_concurrently(mock_conn, mock_sleep):
+    connection = _FakeAsyncConnection()
+    mock_conn.cursor.side_effect = connection.cursor
+    mock_conn.get_query_status_throw_if_error.side_effect = (
+        connection.get_query_status_throw_if_error
+    )
+    mock_conn.is_still_running.side_effect = connection.is_still_running
+    statements = [
+        ConcurrentStatement("slow polls=5"),
+        ConcurrentStatement("fast polls=1"),
+        ConcurrentStatement("after_fast polls=1", frozenset({1})),
+        ConcurrentStatement("other polls=1"),
+    ]
+
+    cursors = SqlExecutionMixin()._execute_concurrently(  # noqa: SLF001
+        statements, max_concurrency=2
+    )
+
+    # results are reported in the order of statements
+    assert [cursor.sfqid for cursor in cursors] == [s.sql for s in statements]
+    assert connection.max_running == 2
+    events = connection.events
+    assert events.index(("done", "fast polls=1")) < events.index(
+        ("submit", "after_fast polls=1")
+    )
+    # the slow statement does not hold back the independent ones
+    assert events.index(("done", "other polls=1")) < events.index(
+        ("done", "slow polls=5")
+    )
+    assert ("abort", "slow polls=5") not in events
+
+
+@mock.patch("snowflake.cli.api.sql_execution.time.sleep")
+@mock.patch("snowflake.cli.api.sql_execution.SqlExecutionMixin._conn")
+def test_execute_concurrently_aborts_running_queries_on_error(mock_conn, mock_sleep):
+    connection = _FakeAsyncConnection()
+    mock_conn.cursor.side_effect = connection.cursor
+    mock_conn.get_query_status_throw_if_error.side_effect = (
+        connection.get_query_status_throw_if_error
+    )
+    mock_conn.is_still_running.side_effect = connection.is_still_running
+    statements = [
+        ConcurrentStatement("slow polls=5"),
+        ConcurrentStatement("fail polls=1"),
+    ]
+
+    with pytest.raises(ProgrammingError, match="fail polls=1 failed"):
+        list(
+            SqlExecutionMixin()._execute_concurrently(  # noqa: SLF001
+                statements, max_concurrency=4
+            )
+        )
+    assert ("abort", "slow polls=5") in connection.events
+
+
+@mock.patch("snowflake.cli.plugins.sql.manager.SqlExecutionMixin._execute_concurrently")
+def test_sql_execute_parallel(mock_execute, runner, mock_cursor):
+    mock_execute.return_value = (mock_cursor(["row"], []) for _ in range(2))
+
+    result = runner.invoke(["sql", "-q", "select 1; select 2;", "--parallel", "4"])
+
+    assert result.exit_code == 0, result.output
+    statements, max_concurrency = mock_execute.call_args.args
+    assert max_concurrency == 4
+    assert list(statements) == [
+        ConcurrentStatement("select 1;"),
+        ConcurrentStatement("select 2;"),
+    ]